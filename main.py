@@ -8,26 +8,30 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+import argparse
+import json
 import threading
-import time
 import os
-import pandas as pd
+import sys
+import traceback
+import math
+import multiprocessing
+import queue
+from collections import deque
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from importlib.util import find_spec
 import numpy as np
-from typing import Dict, List, Optional
-
-# Импорт модулей ИКС Анализатора
-from src.system_model import SystemModel, create_sample_network, NodeType, LinkType
-from src.reliability import ReliabilityAnalyzer
-from src.simulation import NetworkSimulator
-from src.stress_test import StressTester
-from src.whatif import WhatIfAnalyzer, ParameterType, ParameterRange
-from src.gui.main_window import MainWindow as NewMainWindow
-
-# Цветовая схема приложения
-BLOOD_ANGELS_COLORS = {
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.system_model import SystemModel
+
+# Тяжелые зависимости (matplotlib, pandas, модули src.*) импортируются
+# лениво в местах использования, чтобы не замедлять запуск приложения
+
+# Цветовая схема приложения (строки интернированы: tk получает один и тот же объект)
+BLOOD_ANGELS_COLORS = {key: sys.intern(value) for key, value in {
     'primary_red': '#8B0000',      # Темно-красный
     'secondary_red': '#DC143C',    # Кримсон
     'accent_red': '#FF4500',       # Оранжево-красный
@@ -58,7 +62,7 @@ BLOOD_ANGELS_COLORS = {
     'text_secondary': '#DAA520',   # Вторичный текст (золотой)
     'text_muted': '#A9A9A9',       # Приглушенный текст
     'text_warning': '#FFD700',     # Текст предупреждения
-}
+}.items()}
 
 # Шрифты в военном стиле
 MILITARY_FONTS = {
@@ -70,99 +74,168 @@ MILITARY_FONTS = {
     'military': ('Courier New', 10, 'bold'),
 }
 
-def configure_blood_angels_theme(root):
-    """Настраивает тему приложения для tkinter"""
-    style = ttk.Style()
-    style.theme_use('clam')
-    
+# Фабрики виджетов с общим оформлением (аргументы собираются один раз)
+_MIL_LABEL = partial(tk.Label,
+                     bg=BLOOD_ANGELS_COLORS['bg_panel'],
+                     fg=BLOOD_ANGELS_COLORS['text_primary'],
+                     font=MILITARY_FONTS['body'])
+_MIL_LABEL_TITLE = partial(tk.Label,
+                           bg=BLOOD_ANGELS_COLORS['bg_panel'],
+                           fg=BLOOD_ANGELS_COLORS['text_primary'],
+                           font=MILITARY_FONTS['title'])
+_MIL_SPINBOX = partial(ttk.Spinbox, style='BloodAngels.TSpinbox', width=10)
+
+# Заголовки окна и баннера
+_WINDOW_TITLE = "╔═══  ИКС АНАЛИЗАТОР СИСТЕМЫ ═══╗"
+_BANNER_TEXT = """╔═══  ИКС АНАЛИЗАТОР СИСТЕМЫ ═══╗
+║     СИСТЕМА МОНИТОРИНГА СЕТИ         ║
+║     В НЕБЛАГОПРИЯТНЫХ УСЛОВИЯХ       ║
+╚═══════════════════════════════════════════╝"""
+
+# Заголовки вкладок
+_TAB_TITLES = {
+    'network': "╔═══ СЕТЬ ═══╗",
+    'simulation': "╔═══ СИМУЛЯЦИЯ ═══╗",
+    'analysis': "╔═══ АНАЛИЗ ═══╗",
+    'reliability': "╔═══ НАДЕЖНОСТЬ ═══╗",
+    'stress_test': "╔═══ СТРЕСС-ТЕСТЫ ═══╗",
+    'whatif': "╔═══ WHAT-IF ═══╗",
+    'metrics': "╔═══ МЕТРИКИ ═══╗",
+}
+
+# Кэш оформленных заголовков фреймов
+_FMT_CACHE = {}
+
+# Генератор случайных чисел для синтетических рядов графиков
+_rng = np.random.default_rng(42)
+
+# Форматирование числа с 2 знаками после запятой (спецификация разбирается один раз)
+_FMT2 = "{:.2f}".format
+
+# Спецификации стилей ttk, собранные один раз при импорте
+_THEME_SPECS = (
     # Стиль для Frame
-    style.configure('BloodAngels.TFrame',
-                    background=BLOOD_ANGELS_COLORS['bg_secondary'],
-                    relief='raised',
-                    borderwidth=2)
-    
+    ('BloodAngels.TFrame', {
+        'background': BLOOD_ANGELS_COLORS['bg_secondary'],
+        'relief': 'raised',
+        'borderwidth': 2,
+    }),
     # Стиль для Label
-    style.configure('BloodAngels.TLabel',
-                    background=BLOOD_ANGELS_COLORS['bg_secondary'],
-                    foreground=BLOOD_ANGELS_COLORS['text_primary'],
-                    font=MILITARY_FONTS['body'])
-    
+    ('BloodAngels.TLabel', {
+        'background': BLOOD_ANGELS_COLORS['bg_secondary'],
+        'foreground': BLOOD_ANGELS_COLORS['text_primary'],
+        'font': MILITARY_FONTS['body'],
+    }),
     # Стиль для заголовков
-    style.configure('BloodAngels.Title.TLabel',
-                    background=BLOOD_ANGELS_COLORS['bg_secondary'],
-                    foreground=BLOOD_ANGELS_COLORS['text_secondary'],
-                    font=MILITARY_FONTS['title'])
-    
+    ('BloodAngels.Title.TLabel', {
+        'background': BLOOD_ANGELS_COLORS['bg_secondary'],
+        'foreground': BLOOD_ANGELS_COLORS['text_secondary'],
+        'font': MILITARY_FONTS['title'],
+    }),
     # Стиль для кнопок
-    style.configure('BloodAngels.TButton',
-                    background=BLOOD_ANGELS_COLORS['primary_red'],
-                    foreground=BLOOD_ANGELS_COLORS['text_primary'],
-                    font=MILITARY_FONTS['body'],
-                    borderwidth=2,
-                    relief='raised')
-    
-    style.map('BloodAngels.TButton',
-                background=[('active', BLOOD_ANGELS_COLORS['secondary_red']),
-                            ('pressed', BLOOD_ANGELS_COLORS['blood_red'])],
-                            relief=[('pressed', 'sunken'),
-                                    ('active', 'raised')])
-    
+    ('BloodAngels.TButton', {
+        'background': BLOOD_ANGELS_COLORS['primary_red'],
+        'foreground': BLOOD_ANGELS_COLORS['text_primary'],
+        'font': MILITARY_FONTS['body'],
+        'borderwidth': 2,
+        'relief': 'raised',
+    }),
     # Стиль для золотых кнопок
-    style.configure('BloodAngels.Gold.TButton',
-                    background=BLOOD_ANGELS_COLORS['primary_gold'],
-                    foreground=BLOOD_ANGELS_COLORS['primary_black'],
-                    font=MILITARY_FONTS['body'],
-                    borderwidth=2,
-                    relief='raised')
-    
-    style.map('BloodAngels.Gold.TButton',
-                background=[('active', BLOOD_ANGELS_COLORS['secondary_gold']),
-                            ('pressed', BLOOD_ANGELS_COLORS['dark_gold'])],
-                            relief=[('pressed', 'sunken'),
-                                    ('active', 'raised')])
-    
+    ('BloodAngels.Gold.TButton', {
+        'background': BLOOD_ANGELS_COLORS['primary_gold'],
+        'foreground': BLOOD_ANGELS_COLORS['primary_black'],
+        'font': MILITARY_FONTS['body'],
+        'borderwidth': 2,
+        'relief': 'raised',
+    }),
     # Стиль для Notebook
-    style.configure('BloodAngels.TNotebook',
-                    background=BLOOD_ANGELS_COLORS['bg_secondary'],
-                    borderwidth=2)
-    
-    style.configure('BloodAngels.TNotebook.Tab',
-                    background=BLOOD_ANGELS_COLORS['bg_panel'],
-                    foreground=BLOOD_ANGELS_COLORS['text_primary'],
-                    padding=[20, 10],
-                    font=MILITARY_FONTS['body'])
-    
-    style.map('BloodAngels.TNotebook.Tab',
-                background=[('selected', BLOOD_ANGELS_COLORS['primary_red']),
-                            ('active', BLOOD_ANGELS_COLORS['secondary_red'])],
-                            foreground=[('selected', BLOOD_ANGELS_COLORS['text_primary']),
-                                        ('active', BLOOD_ANGELS_COLORS['text_primary'])])
-    
+    ('BloodAngels.TNotebook', {
+        'background': BLOOD_ANGELS_COLORS['bg_secondary'],
+        'borderwidth': 2,
+    }),
+    ('BloodAngels.TNotebook.Tab', {
+        'background': BLOOD_ANGELS_COLORS['bg_panel'],
+        'foreground': BLOOD_ANGELS_COLORS['text_primary'],
+        'padding': [20, 10],
+        'font': MILITARY_FONTS['body'],
+    }),
     # Стиль для Progressbar
-    style.configure('BloodAngels.Horizontal.TProgressbar',
-                    background=BLOOD_ANGELS_COLORS['primary_gold'],
-                    troughcolor=BLOOD_ANGELS_COLORS['bg_panel'],
-                    borderwidth=2,
-                    lightcolor=BLOOD_ANGELS_COLORS['primary_gold'],
-                    darkcolor=BLOOD_ANGELS_COLORS['primary_gold'])
-    
+    ('BloodAngels.Horizontal.TProgressbar', {
+        'background': BLOOD_ANGELS_COLORS['primary_gold'],
+        'troughcolor': BLOOD_ANGELS_COLORS['bg_panel'],
+        'borderwidth': 2,
+        'lightcolor': BLOOD_ANGELS_COLORS['primary_gold'],
+        'darkcolor': BLOOD_ANGELS_COLORS['primary_gold'],
+    }),
     # Стиль для Spinbox
-    style.configure('BloodAngels.TSpinbox',
-                    fieldbackground=BLOOD_ANGELS_COLORS['bg_panel'],
-                    foreground=BLOOD_ANGELS_COLORS['text_primary'],
-                    borderwidth=2,
-                    arrowcolor=BLOOD_ANGELS_COLORS['text_primary'])
-    
+    ('BloodAngels.TSpinbox', {
+        'fieldbackground': BLOOD_ANGELS_COLORS['bg_panel'],
+        'foreground': BLOOD_ANGELS_COLORS['text_primary'],
+        'borderwidth': 2,
+        'arrowcolor': BLOOD_ANGELS_COLORS['text_primary'],
+    }),
     # Стиль для Scale
-    style.configure('BloodAngels.Horizontal.TScale',
-                    background=BLOOD_ANGELS_COLORS['bg_secondary'],
-                    troughcolor=BLOOD_ANGELS_COLORS['bg_panel'],
-                    borderwidth=2,
-                    sliderlength=20)
+    ('BloodAngels.Horizontal.TScale', {
+        'background': BLOOD_ANGELS_COLORS['bg_secondary'],
+        'troughcolor': BLOOD_ANGELS_COLORS['bg_panel'],
+        'borderwidth': 2,
+        'sliderlength': 20,
+    }),
+)
+
+# Динамические состояния стилей (style.map)
+_THEME_MAPS = (
+    ('BloodAngels.TButton', {
+        'background': [('active', BLOOD_ANGELS_COLORS['secondary_red']),
+                       ('pressed', BLOOD_ANGELS_COLORS['blood_red'])],
+        'relief': [('pressed', 'sunken'),
+                   ('active', 'raised')],
+    }),
+    ('BloodAngels.Gold.TButton', {
+        'background': [('active', BLOOD_ANGELS_COLORS['secondary_gold']),
+                       ('pressed', BLOOD_ANGELS_COLORS['dark_gold'])],
+        'relief': [('pressed', 'sunken'),
+                   ('active', 'raised')],
+    }),
+    ('BloodAngels.TNotebook.Tab', {
+        'background': [('selected', BLOOD_ANGELS_COLORS['primary_red']),
+                       ('active', BLOOD_ANGELS_COLORS['secondary_red'])],
+        'foreground': [('selected', BLOOD_ANGELS_COLORS['text_primary']),
+                       ('active', BLOOD_ANGELS_COLORS['text_primary'])],
+    }),
+)
+
+def configure_blood_angels_theme(root):
+    """Настраивает тему приложения для tkinter (однократно для каждого root)"""
+    if getattr(root, '_ba_themed', False):
+        return root._ba_style
+    
+    style = ttk.Style(root)
+    style.theme_use('clam')
+    
+    for style_name, options in _THEME_SPECS:
+        style.configure(style_name, **options)
+    
+    for style_name, options in _THEME_MAPS:
+        style.map(style_name, **options)
+    
+    root._ba_style = style
+    root._ba_themed = True
+    return style
+
+_mpl_configured = False
 
 def configure_matplotlib_blood_angels():
-    """Настраивает matplotlib для темы приложения"""
-    plt.style.use('dark_background')
+    """Настраивает matplotlib для темы приложения (однократно)"""
+    global _mpl_configured
+    if _mpl_configured:
+        return
+    
+    import matplotlib.pyplot as plt
+    
+    # Стиль 'fast' включает упрощение путей и разбиение длинных линий
+    # на блоки при растеризации Agg
+    plt.style.use(['dark_background', 'fast'])
     
     plt.rcParams.update({
         'figure.facecolor': BLOOD_ANGELS_COLORS['bg_primary'],
@@ -182,7 +255,56 @@ def configure_matplotlib_blood_angels():
         'font.family': 'sans-serif',
         'axes.spines.top': False,
         'axes.spines.right': False,
+        # Макет фигуры задается вручную, без пересчета при каждой отрисовке
+        'figure.autolayout': False,
+        'figure.constrained_layout.use': False,
+        # Потоковые линии метрик: упрощение путей до пикселя и без
+        # сглаживания. Для экспорта в публикацию сглаживание можно вернуть
+        # для отдельных линий через set_antialiased(True)
+        'path.simplify': True,
+        'path.simplify_threshold': 1.0,
+        'agg.path.chunksize': 10000,
+        'lines.antialiased': False,
     })
+    _mpl_configured = True
+
+def _ensure_mpl():
+    """Загружает matplotlib и применяет тему при первом построении графика"""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    
+    configure_matplotlib_blood_angels()
+    
+    return Figure, _locked_canvas_class(FigureCanvasTkAgg)
+
+@lru_cache(maxsize=None)
+def _locked_canvas_class(base):
+    """Создает подкласс холста Tk, работающий с буфером Agg только под блокировкой"""
+    
+    class LockedFigureCanvasTkAgg(base):
+        """Холст Tk, общий с потоком растеризации
+        
+        Отрисовка, перенос буфера на холст и изменение размеров выполняются
+        под render_lock: поток растеризации пишет в тот же буфер Agg.
+        """
+        
+        def __init__(self, figure, master, render_lock):
+            self.render_lock = render_lock
+            super().__init__(figure, master)
+        
+        def draw(self):
+            with self.render_lock:
+                super().draw()
+        
+        def blit(self, bbox=None):
+            with self.render_lock:
+                super().blit(bbox)
+        
+        def resize(self, event):
+            with self.render_lock:
+                super().resize(event)
+    
+    return LockedFigureCanvasTkAgg
 
 def create_military_frame(parent, title="", width=None, height=None):
     """Создает фрейм в военном стиле"""
@@ -206,17 +328,33 @@ def create_military_frame(parent, title="", width=None, height=None):
     if title:
         title_frame = tk.Frame(frame, bg=BLOOD_ANGELS_COLORS['primary_red'], height=30)
         title_frame.pack(fill=tk.X, padx=2, pady=2)
-        title_frame.pack_propagate(False)
+        title_frame.grid_propagate(False)
+        title_frame.grid_rowconfigure(0, weight=1)
+        title_frame.grid_columnconfigure(0, weight=1)
+        
+        text = _FMT_CACHE.get(title)
+        if text is None:
+            text = _FMT_CACHE[title] = f"╔═══ {title} ═══╗"
         
         title_label = tk.Label(title_frame, 
-                                text=f"╔═══ {title} ═══╗",
+                                text=text,
                                 bg=BLOOD_ANGELS_COLORS['primary_red'],
                                 fg=BLOOD_ANGELS_COLORS['text_primary'],
                                 font=MILITARY_FONTS['monospace'])
-        title_label.pack(expand=True)
+        title_label.grid(row=0, column=0)
     
     return frame
 
+# Цвета индикаторов статуса
+_STATUS_COLORS = {
+    'excellent': BLOOD_ANGELS_COLORS['success'],
+    'good': BLOOD_ANGELS_COLORS['primary_gold'],
+    'warning': BLOOD_ANGELS_COLORS['warning'],
+    'critical': BLOOD_ANGELS_COLORS['danger'],
+    'error': BLOOD_ANGELS_COLORS['danger'],
+    'normal': BLOOD_ANGELS_COLORS['text_primary']
+}
+
 def create_status_indicator(parent, text, status='normal', size=(100, 30)):
     """Создает индикатор статуса в военном стиле"""
     frame = tk.Frame(parent, 
@@ -225,22 +363,16 @@ def create_status_indicator(parent, text, status='normal', size=(100, 30)):
                     borderwidth=2,
                     width=size[0],
                     height=size[1])
-    frame.pack_propagate(False)
-    
-    # Индикаторная полоса
-    status_colors = {
-        'excellent': BLOOD_ANGELS_COLORS['success'],
-        'good': BLOOD_ANGELS_COLORS['primary_gold'],
-        'warning': BLOOD_ANGELS_COLORS['warning'],
-        'critical': BLOOD_ANGELS_COLORS['danger'],
-        'error': BLOOD_ANGELS_COLORS['danger'],
-        'normal': BLOOD_ANGELS_COLORS['text_primary']
-    }
+    # Фиксированный размер: одна сетка, без пересчета по содержимому
+    frame.grid_propagate(False)
+    frame.grid_rowconfigure(0, weight=1)
+    frame.grid_columnconfigure(1, weight=1)
     
+    # Индикаторная полоса (статус передается в нижнем регистре)
     indicator = tk.Frame(frame, 
-                        bg=status_colors.get(status.lower(), BLOOD_ANGELS_COLORS['text_primary']),
+                        bg=_STATUS_COLORS.get(status, BLOOD_ANGELS_COLORS['text_primary']),
                         width=5)
-    indicator.pack(side=tk.LEFT, fill=tk.Y, padx=2, pady=2)
+    indicator.grid(row=0, column=0, sticky=tk.NS, padx=2, pady=2)
     
     # Текст
     label = tk.Label(frame,
@@ -248,14 +380,250 @@ def create_status_indicator(parent, text, status='normal', size=(100, 30)):
                     bg=BLOOD_ANGELS_COLORS['bg_panel'],
                     fg=BLOOD_ANGELS_COLORS['text_primary'],
                     font=MILITARY_FONTS['small'])
-    label.pack(expand=True)
+    label.grid(row=0, column=1)
     
     return frame, label
 
 
+def _set_bar_heights(ax, bars, values):
+    """
+    Обновляет высоты существующих столбцов на месте.
+    
+    Возвращает False, если столбцы нужно построить заново: их еще нет,
+    оси были очищены или изменилось количество значений.
+    """
+    if bars is None or len(bars) != len(values):
+        return False
+    if not any(container is bars for container in ax.containers):
+        return False
+    
+    for rect, value in zip(bars, values):
+        rect.set_height(value)
+    return True
+
+def _clear_axes(ax):
+    """Удаляет графики с осей, сохраняя заголовок и оформление вкладки"""
+    title = ax.get_title()
+    ax.clear()
+    ax.set_title(title, color=BLOOD_ANGELS_COLORS['text_secondary'], fontweight='bold')
+    ax.set_facecolor(BLOOD_ANGELS_COLORS['bg_panel'])
+    ax.tick_params(colors=BLOOD_ANGELS_COLORS['text_primary'])
+
+def _tcl_word(value):
+    """Экранирует значение как одно слово Tcl-скрипта"""
+    text = str(value)
+    if not text:
+        return "{}"
+    return "".join(ch if ch.isalnum() or ch in "_.-" else
+                   ("\\n" if ch == "\n" else "\\" + ch)
+                   for ch in text)
+
+# Разрешение и исходный размер (дюймы) общей фигуры графиков. Время
+# растеризации Agg пропорционально числу пикселей, а встроенной панели
+# хватает 72 dpi; разрешение можно повысить ползунком на панели
+PLOT_DPI = 72
+PLOT_SIZE = (9, 6)
+
+# Максимальное число точек линии метрики, передаваемых в matplotlib
+_PLOT_MAX_POINTS = 2000
+
+# Период опроса очереди обновлений симуляции главным потоком, мс (~30 кадров/с)
+_UPDATE_INTERVAL_MS = 33
+
+def _put_latest(q, item):
+    """Кладет элемент в ограниченную очередь, вытесняя самые старые"""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+def _padded_range(values, margin=0.05):
+    """Возвращает пределы оси для ряда с небольшим запасом по краям"""
+    low, high = float(values.min()), float(values.max())
+    pad = (high - low) * margin or abs(high) * margin or 1.0
+    return low - pad, high + pad
+
+def _downsample(x, y, target=_PLOT_MAX_POINTS):
+    """
+    Прореживает ряд для отрисовки с сохранением пиков.
+    
+    Ряд делится на target // 2 корзин, из каждой берутся минимум и максимум
+    в порядке следования по оси X. Короткие ряды возвращаются без изменений.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if n <= target:
+        return x, y
+    
+    buckets = target // 2
+    size = n // buckets
+    m = buckets * size
+    x_buckets = x[:m].reshape(buckets, size)
+    y_buckets = y[:m].reshape(buckets, size)
+    
+    i_min = y_buckets.argmin(axis=1)
+    i_max = y_buckets.argmax(axis=1)
+    order = np.stack((np.minimum(i_min, i_max), np.maximum(i_min, i_max)), axis=1)
+    rows = np.arange(buckets)[:, None]
+    
+    # Остаток, не вошедший в корзины, добавляется как есть
+    return (np.concatenate((x_buckets[rows, order].ravel(), x[m:])),
+            np.concatenate((y_buckets[rows, order].ravel(), y[m:])))
+
+def _random_component_rates(soa, rng):
+    """Разыгрывает интенсивности отказов и восстановлений всех компонентов
+    
+    По одному вызову генератора rng (np.random.Generator) на каждую группу
+    значений вместо вызова на каждый компонент. Возвращает
+    (failure_rates, repair_rates).
+    """
+    node_ids, link_ids = soa['node_ids'], soa['link_ids']
+    num_nodes, num_links = len(node_ids), len(link_ids)
+    
+    # Частоты отказов (отказов в час)
+    failure_rates = dict(zip(node_ids, rng.uniform(1e-5, 1e-3, num_nodes).tolist()))
+    failure_rates.update(zip(link_ids, rng.uniform(1e-6, 1e-4, num_links).tolist()))
+    
+    # Частоты восстановления (восстановлений в час): 1-10 часов на
+    # восстановление узла, 0.5-2 часа на восстановление канала
+    repair_rates = dict(zip(node_ids, rng.uniform(0.1, 1.0, num_nodes).tolist()))
+    repair_rates.update(zip(link_ids, rng.uniform(0.5, 2.0, num_links).tolist()))
+    
+    return failure_rates, repair_rates
+
+def _component_parameter_ranges(soa):
+    """Диапазоны What-if: пропускная способность узлов и каналов (x0.5 - x2)"""
+    from src.whatif import ParameterType, ParameterRange
+    
+    ranges = []
+    for param_type, ids, values in ((ParameterType.NODE_CAPACITY, soa['node_ids'], soa['capacity']),
+                                    (ParameterType.LINK_BANDWIDTH, soa['link_ids'], soa['bandwidth'])):
+        ranges += [ParameterRange(param_type=param_type, component_id=component_id,
+                                  min_value=low, max_value=high, default_value=default)
+                   for component_id, low, high, default in zip(ids, (values * 0.5).tolist(),
+                                                               (values * 2.0).tolist(),
+                                                               values.tolist())]
+    return ranges
+
+def _excel_engine():
+    """Движок записи xlsx: xlsxwriter, если установлен (быстрее), иначе openpyxl"""
+    return 'xlsxwriter' if find_spec('xlsxwriter') is not None else 'openpyxl'
+
+def _open_excel_writer(filename):
+    """Открывает книгу Excel для записи
+    
+    С xlsxwriter книга пишется в режиме constant_memory: каждая строка
+    сбрасывается на диск, как только начата следующая.
+    """
+    import pandas as pd
+    
+    engine = _excel_engine()
+    if engine == 'xlsxwriter':
+        return pd.ExcelWriter(filename, engine=engine,
+                              engine_kwargs={'options': {'constant_memory': True,
+                                                         'strings_to_numbers': False}})
+    return pd.ExcelWriter(filename, engine=engine)
+
+def _write_sheet(writer, df, sheet_name):
+    """Записывает DataFrame на лист книги (без индекса)
+    
+    to_excel выводит таблицу по столбцам, а в режиме constant_memory строки
+    принимаются только по порядку, поэтому для xlsxwriter строки пишутся напрямую.
+    """
+    if writer.engine != 'xlsxwriter':
+        df.to_excel(writer, sheet_name=sheet_name, index=False)
+        return
+    
+    # Значения приводятся к типам Excel один раз для каждого столбца:
+    # числа остаются числами, остальное - строками, пропуски - пустыми ячейками
+    columns = []
+    for _, column in df.items():
+        if column.dtype.kind in 'biuf':
+            values = column.tolist()
+        else:
+            values = column.astype(str).tolist()
+        if column.hasnans:
+            values = [None if missing else value
+                      for value, missing in zip(values, column.isna().tolist())]
+        columns.append(values)
+    
+    worksheet = writer.book.add_worksheet(sheet_name)
+    header_format = writer.book.add_format({'bold': True, 'border': 1,
+                                            'align': 'center', 'valign': 'top'})
+    worksheet.write_row(0, 0, [str(name) for name in df.columns], header_format)
+    for row_index, row in enumerate(zip(*columns), 1):
+        worksheet.write_row(row_index, 0, row)
+
+def _write_columnar_table(path, df, export_format):
+    """Записывает DataFrame в файл parquet или feather (нужен pyarrow)"""
+    if export_format == 'parquet':
+        df.to_parquet(path, index=False, compression='zstd')
+    else:
+        df.reset_index(drop=True).to_feather(path, compression='lz4')
+
+def _reliability_worker(system_model, failure_rates, repair_rates, hours, sims):
+    """Анализ надежности в рабочем процессе (вне цикла событий tkinter)"""
+    from src.reliability import ReliabilityAnalyzer
+    
+    analyzer = ReliabilityAnalyzer(system_model)
+    analyzer.set_failure_rates(failure_rates)
+    analyzer.set_repair_rates(repair_rates)
+    
+    reliability_results = analyzer.calculate_system_reliability(hours)
+    mc_results = analyzer.monte_carlo_reliability_analysis(sims)
+    
+    return reliability_results, mc_results
+
+
+def _whatif_worker(system_model, parameter_ranges, sims, seed, sensitivity, monte_carlo):
+    """What-if анализ в рабочем процессе (вне цикла событий tkinter)"""
+    from src.whatif import WhatIfAnalyzer
+    
+    analyzer = WhatIfAnalyzer(system_model)
+    analyzer.create_baseline_system()
+    analyzer.set_parameter_ranges(parameter_ranges)
+    
+    results = {}
+    if sensitivity:
+        results['sensitivity'] = analyzer.analyze_parameter_sensitivity(parameter_ranges, num_samples=20)
+    if monte_carlo:
+        results['monte_carlo'] = analyzer.monte_carlo_analysis(
+            num_simulations=sims, simulation_duration=60, seed=seed
+        )
+    return results
+
+
+def _stress_worker(system_model, duration, test_type):
+    """Один стресс-тест в рабочем процессе (вне цикла событий tkinter)"""
+    from src.stress_test import StressTester
+    
+    stress_tester = StressTester(system_model)
+    test_runners = {
+        'load_increase': stress_tester.run_load_increase_test,
+        'failure_injection': stress_tester.run_failure_injection_test,
+        'cascade_failure': stress_tester.run_cascade_failure_test,
+        'network_congestion': stress_tester.run_network_congestion_test,
+        'random_stress': stress_tester.run_random_stress_test,
+    }
+    
+    return test_runners[test_type](duration=duration)
+
+
 class MainWindow(tk.Frame):
     """Главное окно приложения ИКС Анализатора"""
     
+    # Цвета узлов на схеме сети (по кругу)
+    _NODE_PALETTE = (BLOOD_ANGELS_COLORS['success'], BLOOD_ANGELS_COLORS['primary_gold'],
+                     BLOOD_ANGELS_COLORS['warning'], BLOOD_ANGELS_COLORS['danger'],
+                     BLOOD_ANGELS_COLORS['info'], BLOOD_ANGELS_COLORS['primary_red'],
+                     BLOOD_ANGELS_COLORS['secondary_red'])
+    
     def __init__(self, root: tk.Tk, config):
         super().__init__(root)
         self.root = root
@@ -263,10 +631,9 @@ class MainWindow(tk.Frame):
 
         # Настройка темы приложения
         configure_blood_angels_theme(self.root)
-        configure_matplotlib_blood_angels()
         
         # Настройка главного окна
-        self.root.title("╔═══  ИКС АНАЛИЗАТОР СИСТЕМЫ ═══╗")
+        self.root.title(_WINDOW_TITLE)
         self.root.geometry("1600x1000")
         self.root.minsize(1200, 800)
         self.root.configure(bg=BLOOD_ANGELS_COLORS['bg_primary'])
@@ -277,7 +644,44 @@ class MainWindow(tk.Frame):
         # Переменные состояния
         self.is_simulation_running = False
         self.system_model = None  # Созданная система
+        self._soa = None  # Массивы параметров системы (SystemModel.as_soa)
         self.simulation_data = []
+        self._sim_series = np.empty((5, 0))  # Ряды текущей симуляции (строки одного массива)
+        self._sim_count = 0  # Число выданных точек рядов
+        self._stop_evt = threading.Event()  # Запрос остановки потока симуляции
+        self._update_q = queue.Queue(maxsize=1)  # Последнее состояние симуляции
+        self._downsample_cache = {}  # Прореженные ряды текущей симуляции
+        self._sim_limits_series = None  # Ряды, по которым заданы пределы осей метрик
+        
+        # Столбцы графиков, обновляемые на месте
+        self._rel_bars = None
+        self._rel_bar_labels = None
+        self._sensitivity_bars = None
+        self._result_bars = {}  # Оси -> (подписи, столбцы) результатов анализа
+        
+        # Кэш расположения узлов на схеме сети
+        self._node_positions_cache = None
+        self._node_colors_cache = None
+        
+        # Подписи компонентов созданной системы (см. _cache_system_labels)
+        self._node_labels = {}
+        self._link_labels = {}
+        self._component_labels = ()
+        self._node_positions_system_id = None
+        
+        # Фоновая растеризация полных кадров графиков метрик. Блокировка
+        # реентерабельная: обработчики главного потока, уже держащие ее,
+        # вызывают отрисовку холста, которая тоже ее берет
+        self._render_queue = queue.Queue(maxsize=1)
+        self._render_done = queue.Queue()  # Поток растеризации -> главный поток
+        self._render_lock = threading.RLock()
+        self._render_thread = None
+        self._renders_pending = 0  # Запросы, результат которых еще не забран
+        self._redraw_pending = False
+        
+        # Журнал сообщений (последние 200 записей)
+        self._log = deque(maxlen=200)
+        self._log_var = tk.StringVar()
         
         # Переменные ИКС Анализатора
         self.reliability_analyzer = None
@@ -286,6 +690,29 @@ class MainWindow(tk.Frame):
         self.whatif_analyzer = None
         self.analysis_results = {}
         
+        # Параметры анализа для текущей системы: ключ (id системы, число
+        # узлов, число каналов), значение хранит и саму систему, чтобы ее id
+        # не мог достаться новой системе, пока запись в кэше
+        self._reliability_params_cache = {}
+        self._whatif_params_cache = {}
+        
+        # Таблицы узлов и каналов для экспорта: (система, версия) -> DataFrame
+        self._export_cache_key = None
+        self._export_cache = None
+        
+        # Пул процессов для длительных вычислений (создается при первом запуске)
+        self._pool = None
+        # Поток записи файлов экспорта (создается при первом экспорте)
+        self._export_pool = None
+        # Число выполняемых фоновых задач и кнопки, блокируемые на это время
+        # (создание системы и запуск анализов меняют общее состояние)
+        self._active_tasks = 0
+        self._analysis_buttons = []
+        
+        # Отложенное форматирование числовых полей
+        self._formatting = False
+        self._format_jobs = {}
+        
         # Создание интерфейса
         self._create_banner()
         self._create_main_interface()
@@ -299,13 +726,8 @@ class MainWindow(tk.Frame):
         banner_frame.pack(fill=tk.X, padx=5, pady=5)
         banner_frame.pack_propagate(False)
         
-        banner_text = """╔═══  ИКС АНАЛИЗАТОР СИСТЕМЫ ═══╗
-║     СИСТЕМА МОНИТОРИНГА СЕТИ         ║
-║     В НЕБЛАГОПРИЯТНЫХ УСЛОВИЯХ       ║
-╚═══════════════════════════════════════════╝"""
-        
         banner_label = tk.Label(banner_frame,
-                              text=banner_text,
+                              text=_BANNER_TEXT,
                               bg=BLOOD_ANGELS_COLORS['primary_red'],
                               fg=BLOOD_ANGELS_COLORS['text_primary'],
                               font=MILITARY_FONTS['monospace'])
@@ -332,46 +754,73 @@ class MainWindow(tk.Frame):
         notebook = ttk.Notebook(control_frame, style='BloodAngels.TNotebook')
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Вкладка "Сеть"
-        network_frame = ttk.Frame(notebook, style='BloodAngels.TFrame')
-        notebook.add(network_frame, text="╔═══ СЕТЬ ═══╗")
-        self._create_network_tab(network_frame)
+        # Вкладки заполняются виджетами при первом открытии
+        self._create_control_variables()
+        self._tab_builders = {}
+        self._built_tabs = set()
+        for tab_key, builder in (
+            ('network', self._create_network_tab),
+            ('simulation', self._create_simulation_tab),
+            ('analysis', self._create_analysis_tab),
+            ('reliability', self._create_reliability_tab),
+            ('stress_test', self._create_stress_test_tab),
+            ('whatif', self._create_whatif_tab)
+        ):
+            tab_frame = ttk.Frame(notebook, style='BloodAngels.TFrame')
+            notebook.add(tab_frame, text=_TAB_TITLES[tab_key])
+            self._tab_builders[tab_frame] = builder
+        
+        notebook.bind('<<NotebookTabChanged>>', self._on_control_tab_changed)
+        self._build_control_tab(notebook.nametowidget(notebook.select()))
         
-        # Вкладка "Симуляция"
-        sim_frame = ttk.Frame(notebook, style='BloodAngels.TFrame')
-        notebook.add(sim_frame, text="╔═══ СИМУЛЯЦИЯ ═══╗")
-        self._create_simulation_tab(sim_frame)
-        
-        # Вкладка "Анализ"
-        analysis_frame = ttk.Frame(notebook, style='BloodAngels.TFrame')
-        notebook.add(analysis_frame, text="╔═══ АНАЛИЗ ═══╗")
-        self._create_analysis_tab(analysis_frame)
+        # Кнопки управления
+        self._create_control_buttons(control_frame)
+    
+    def _create_control_variables(self):
+        """Создает переменные вкладок, которые строятся при первом открытии"""
+        self.duration_var = tk.DoubleVar(value=100.0)
+        self.time_step_var = tk.DoubleVar(value=0.10)
+        self.seed_var = tk.IntVar(value=42)
         
-        # Вкладка "Надежность"
-        reliability_frame = ttk.Frame(notebook, style='BloodAngels.TFrame')
-        notebook.add(reliability_frame, text="╔═══ НАДЕЖНОСТЬ ═══╗")
-        self._create_reliability_tab(reliability_frame)
+        self.enable_traffic_var = tk.BooleanVar(value=True)
+        self.enable_failures_var = tk.BooleanVar(value=True)
+        self.enable_adverse_var = tk.BooleanVar(value=True)
         
-        # Вкладка "Стресс-тесты"
-        stress_frame = ttk.Frame(notebook, style='BloodAngels.TFrame')
-        notebook.add(stress_frame, text="╔═══ СТРЕСС-ТЕСТЫ ═══╗")
-        self._create_stress_test_tab(stress_frame)
+        self.reliability_hours_var = tk.DoubleVar(value=8760)
+        self.monte_carlo_sims_var = tk.IntVar(value=1000)
         
-        # Вкладка "What-if"
-        whatif_frame = ttk.Frame(notebook, style='BloodAngels.TFrame')
-        notebook.add(whatif_frame, text="╔═══ WHAT-IF ═══╗")
-        self._create_whatif_tab(whatif_frame)
+        self.stress_duration_var = tk.DoubleVar(value=300)
+        self.stress_test_types = {
+            'load_increase': tk.BooleanVar(value=True),
+            'failure_injection': tk.BooleanVar(value=True),
+            'cascade_failure': tk.BooleanVar(value=True),
+            'network_congestion': tk.BooleanVar(value=True),
+            'random_stress': tk.BooleanVar(value=True)
+        }
         
-        # Кнопки управления
-        self._create_control_buttons(control_frame)
+        self.whatif_sims_var = tk.IntVar(value=200)
+        self.whatif_analysis_types = {
+            'sensitivity': tk.BooleanVar(value=True),
+            'monte_carlo': tk.BooleanVar(value=True),
+            'optimization': tk.BooleanVar(value=False)
+        }
+    
+    def _on_control_tab_changed(self, event):
+        """Строит содержимое вкладки при первом открытии"""
+        notebook = event.widget
+        self._build_control_tab(notebook.nametowidget(notebook.select()))
+    
+    def _build_control_tab(self, tab_frame):
+        """Заполняет вкладку виджетами, если это еще не сделано"""
+        if tab_frame in self._built_tabs:
+            return
+        self._tab_builders[tab_frame](tab_frame)
+        self._built_tabs.add(tab_frame)
     
     def _create_network_tab(self, parent):
         """Создает вкладку создания системы"""
         # Заголовок
-        title_label = tk.Label(parent, text="СОЗДАНИЕ СИСТЕМЫ", 
-                              bg=BLOOD_ANGELS_COLORS['bg_panel'],
-                              fg=BLOOD_ANGELS_COLORS['text_primary'],
-                              font=MILITARY_FONTS['title'])
+        title_label = _MIL_LABEL_TITLE(parent, text="СОЗДАНИЕ СИСТЕМЫ")
         title_label.grid(row=0, column=0, columnspan=3, sticky=tk.W, padx=5, pady=10)
         
         # Выбор типа системы
@@ -398,46 +847,31 @@ class MainWindow(tk.Frame):
         self.custom_params_frame.grid(row=2, column=0, columnspan=3, sticky='ew', padx=5, pady=5)
         
         # Количество узлов
-        tk.Label(self.custom_params_frame, text="Количество узлов:", 
-                bg=BLOOD_ANGELS_COLORS['bg_panel'],
-                fg=BLOOD_ANGELS_COLORS['text_primary'],
-                font=MILITARY_FONTS['body']).grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        
-        self.nodes_var = tk.StringVar(value="10")
-        nodes_spinbox = ttk.Spinbox(self.custom_params_frame, from_=3, to=50, textvariable=self.nodes_var, width=10,
-                                   style='BloodAngels.TSpinbox')
+        _MIL_LABEL(self.custom_params_frame, text="Количество узлов:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        
+        self.nodes_var = tk.IntVar(value=10)
+        nodes_spinbox = _MIL_SPINBOX(self.custom_params_frame, from_=3, to=50, textvariable=self.nodes_var)
         nodes_spinbox.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Вероятность соединения
-        tk.Label(self.custom_params_frame, text="Вероятность соединения:", 
-                bg=BLOOD_ANGELS_COLORS['bg_panel'],
-                fg=BLOOD_ANGELS_COLORS['text_primary'],
-                font=MILITARY_FONTS['body']).grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        _MIL_LABEL(self.custom_params_frame, text="Вероятность соединения:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
         
-        self.connection_prob_var = tk.StringVar(value="0.30")
-        
-        # Функция для форматирования значения
-        def format_prob_value(*args):
-            try:
-                value = float(self.connection_prob_var.get())
-                formatted_value = f"{value:.2f}"
-                if self.connection_prob_var.get() != formatted_value:
-                    self.connection_prob_var.set(formatted_value)
-            except ValueError:
-                pass
-        
-        # Привязка функции к изменению переменной
-        self.connection_prob_var.trace('w', format_prob_value)
+        self.connection_prob_var = tk.DoubleVar(value=0.30)
         
+        # Форматирование значения откладывается до простоя цикла событий,
+        # чтобы перетаскивание ползунка не вызывало лавину перезаписей
         prob_scale = ttk.Scale(self.custom_params_frame, from_=0.01, to=1.0, orient=tk.HORIZONTAL, 
                               variable=self.connection_prob_var, length=150,
+                              command=lambda value: self._schedule_format(self.connection_prob_var, value),
                               style='BloodAngels.Horizontal.TScale')
         prob_scale.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Spinbox для точного ввода вероятности с 2 знаками после запятой
+        prob_vcmd = (parent.register(self._validate_prob), '%P')
         prob_spinbox = ttk.Spinbox(self.custom_params_frame, from_=0.01, to=1.0, 
                                   textvariable=self.connection_prob_var, 
-                                  width=8, increment=0.01,
+                                  width=8, increment=0.01, format='%.2f',
+                                  validate='focusout', validatecommand=prob_vcmd,
                                   style='BloodAngels.TSpinbox')
         prob_spinbox.grid(row=1, column=2, sticky=tk.W, padx=5, pady=5)
         
@@ -458,6 +892,7 @@ class MainWindow(tk.Frame):
         create_btn = ttk.Button(parent, text="СОЗДАТЬ СИСТЕМУ", 
                                command=self.create_system,
                                style='Military.TButton')
+        self._register_analysis_button(create_btn)
         create_btn.grid(row=3, column=0, columnspan=3, sticky='ew', padx=5, pady=10)
         
         # Информация о системе
@@ -478,104 +913,88 @@ class MainWindow(tk.Frame):
         self.system_type_var.trace('w', toggle_custom_params)
         toggle_custom_params()  # Инициализация
     
-    def create_system(self):
-        """Создание системы на основе выбранных параметров"""
-        try:
-            if self.system_type_var.get() == "sample":
-                # Создаем готовую систему
-                from src.system_model import create_sample_network
-                self.system_model = create_sample_network()
-                system_info = f"Готовая система: {len(self.system_model.nodes)} узлов, {len(self.system_model.links)} каналов"
-            else:
-                # Создаем пользовательскую систему
-                num_nodes = int(self.nodes_var.get())
-                connection_prob = float(self.connection_prob_var.get())
-                
-                from src.system_model import SystemModel
-                self.system_model = SystemModel("Пользовательская ИКС")
-                self.system_model.generate_random_network(num_nodes, connection_prob)
-                system_info = f"Пользовательская система: {num_nodes} узлов, {len(self.system_model.links)} каналов (p={connection_prob:.2f})"
-            
-            # Обновляем информацию о системе
-            self.system_info_var.set(system_info)
-            
-            # Обновляем визуализацию сети
-            if hasattr(self, 'network_canvas'):
-                self._draw_sample_network()
-            
-            # Выводим сообщение об успехе
-            print(f"Система создана: {system_info}")
-            
-        except Exception as e:
-            error_msg = f"Ошибка создания системы: {str(e)}"
-            self.system_info_var.set(error_msg)
-            print(error_msg)
+    def _log_msg(self, message):
+        """Добавляет сообщение в журнал и показывает его в строке состояния"""
+        self._log.append(message)
+        self._log_var.set(message)
+        if __debug__:
+            print(message, file=sys.stderr)
     
     def _create_simulation_tab(self, parent):
         """Создает вкладку настроек симуляции"""
         # Длительность симуляции
-        tk.Label(parent, text="Длительность (сек):", 
-                bg=BLOOD_ANGELS_COLORS['bg_panel'],
-                fg=BLOOD_ANGELS_COLORS['text_primary'],
-                font=MILITARY_FONTS['body']).grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        
-        self.duration_var = tk.StringVar(value="100.0")
-        duration_spinbox = ttk.Spinbox(parent, from_=10, to=1000, 
-                                      textvariable=self.duration_var, width=10,
-                                      style='BloodAngels.TSpinbox')
+        _MIL_LABEL(parent, text="Длительность (сек):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        
+        duration_spinbox = _MIL_SPINBOX(parent, from_=10, to=1000, textvariable=self.duration_var)
         duration_spinbox.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Шаг времени
-        tk.Label(parent, text="Шаг времени (сек):", 
-                bg=BLOOD_ANGELS_COLORS['bg_panel'],
-                fg=BLOOD_ANGELS_COLORS['text_primary'],
-                font=MILITARY_FONTS['body']).grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        
-        self.time_step_var = tk.StringVar(value="0.10")
+        _MIL_LABEL(parent, text="Шаг времени (сек):").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
         
-        # Функция для форматирования шага времени
-        def format_time_step(*args):
-            try:
-                value = float(self.time_step_var.get())
-                formatted_value = f"{value:.2f}"
-                if self.time_step_var.get() != formatted_value:
-                    self.time_step_var.set(formatted_value)
-            except ValueError:
-                pass
-        
-        self.time_step_var.trace('w', format_time_step)
-        
-        time_step_spinbox = ttk.Spinbox(parent, from_=0.01, to=1.0, 
-                                       textvariable=self.time_step_var, width=10, increment=0.01,
-                                       style='BloodAngels.TSpinbox')
+        time_step_vcmd = (parent.register(self._validate_time_step), '%P')
+        time_step_spinbox = _MIL_SPINBOX(parent, from_=0.01, to=1.0, 
+                                         textvariable=self.time_step_var, increment=0.01, format='%.2f',
+                                         validate='focusout', validatecommand=time_step_vcmd)
         time_step_spinbox.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Случайное зерно
-        tk.Label(parent, text="Случайное зерно:", 
-                bg=BLOOD_ANGELS_COLORS['bg_panel'],
-                fg=BLOOD_ANGELS_COLORS['text_primary'],
-                font=MILITARY_FONTS['body']).grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        
-        self.seed_var = tk.StringVar(value="42")
-        seed_spinbox = ttk.Spinbox(parent, from_=1, to=10000, 
-                                  textvariable=self.seed_var, width=10,
-                                  style='BloodAngels.TSpinbox')
+        _MIL_LABEL(parent, text="Случайное зерно:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        
+        seed_spinbox = _MIL_SPINBOX(parent, from_=1, to=10000, textvariable=self.seed_var)
         seed_spinbox.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
     
+    def _validate_prob(self, new_value):
+        """Проверяет вероятность соединения при потере фокуса"""
+        self._schedule_format(self.connection_prob_var, new_value)
+        return True
+    
+    def _validate_time_step(self, new_value):
+        """Проверяет шаг времени при потере фокуса"""
+        self._schedule_format(self.time_step_var, new_value)
+        return True
+    
+    def _schedule_format(self, var, raw_value):
+        """Планирует округление значения переменной до 2 знаков после запятой"""
+        if self._formatting:
+            return
+        
+        try:
+            value = float(raw_value)
+        except (TypeError, ValueError):
+            return
+        
+        # Строка уже в нужном формате (например, из Spinbox с format='%.2f')
+        formatted_value = _FMT2(value)
+        if formatted_value == raw_value:
+            return
+        
+        # Повторные запросы до простоя цикла событий объединяются в один
+        var_name = str(var)
+        pending = self._format_jobs.pop(var_name, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._format_jobs[var_name] = self.root.after_idle(self._apply_format, var, formatted_value)
+    
+    def _apply_format(self, var, formatted_value):
+        """Записывает отформатированное значение без повторного запуска валидации"""
+        self._format_jobs.pop(str(var), None)
+        self._formatting = True
+        try:
+            var.set(formatted_value)
+        finally:
+            self._formatting = False
+    
     def _create_analysis_tab(self, parent):
         """Создает вкладку анализа"""
         # Флаги анализа
-        self.enable_traffic_var = tk.BooleanVar(value=True)
         traffic_check = ttk.Checkbutton(parent, text="Включить генерацию трафика", 
                                        variable=self.enable_traffic_var)
         traffic_check.grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
         
-        self.enable_failures_var = tk.BooleanVar(value=True)
         failures_check = ttk.Checkbutton(parent, text="Включить моделирование отказов", 
                                         variable=self.enable_failures_var)
         failures_check.grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
         
-        self.enable_adverse_var = tk.BooleanVar(value=True)
         adverse_check = ttk.Checkbutton(parent, text="Включить неблагоприятные условия", 
                                        variable=self.enable_adverse_var)
         adverse_check.grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
@@ -583,58 +1002,33 @@ class MainWindow(tk.Frame):
     def _create_reliability_tab(self, parent):
         """Создает вкладку анализа надежности"""
         # Период анализа
-        tk.Label(parent, text="Период анализа (часы):", 
-                bg=BLOOD_ANGELS_COLORS['bg_panel'],
-                fg=BLOOD_ANGELS_COLORS['text_primary'],
-                font=MILITARY_FONTS['body']).grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        
-        self.reliability_hours_var = tk.StringVar(value="8760")
-        reliability_spinbox = ttk.Spinbox(parent, from_=1, to=87600, 
-                                        textvariable=self.reliability_hours_var, width=10,
-                                        style='BloodAngels.TSpinbox')
+        _MIL_LABEL(parent, text="Период анализа (часы):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        
+        reliability_spinbox = _MIL_SPINBOX(parent, from_=1, to=87600, textvariable=self.reliability_hours_var)
         reliability_spinbox.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Количество симуляций Монте-Карло
-        tk.Label(parent, text="Симуляций Монте-Карло:", 
-                bg=BLOOD_ANGELS_COLORS['bg_panel'],
-                fg=BLOOD_ANGELS_COLORS['text_primary'],
-                font=MILITARY_FONTS['body']).grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        
-        self.monte_carlo_sims_var = tk.StringVar(value="1000")
-        monte_carlo_spinbox = ttk.Spinbox(parent, from_=100, to=10000, 
-                                        textvariable=self.monte_carlo_sims_var, width=10,
-                                        style='BloodAngels.TSpinbox')
+        _MIL_LABEL(parent, text="Симуляций Монте-Карло:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        
+        monte_carlo_spinbox = _MIL_SPINBOX(parent, from_=100, to=10000, textvariable=self.monte_carlo_sims_var)
         monte_carlo_spinbox.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Кнопка анализа надежности
         reliability_button = ttk.Button(parent, text="╔═══ АНАЛИЗ НАДЕЖНОСТИ ═══╗",
                                       command=self.run_reliability_analysis,
                                       style='BloodAngels.Gold.TButton')
+        self._register_analysis_button(reliability_button)
         reliability_button.grid(row=2, column=0, columnspan=2, pady=10)
     
     def _create_stress_test_tab(self, parent):
         """Создает вкладку стресс-тестирования"""
         # Длительность тестов
-        tk.Label(parent, text="Длительность тестов (сек):", 
-                bg=BLOOD_ANGELS_COLORS['bg_panel'],
-                fg=BLOOD_ANGELS_COLORS['text_primary'],
-                font=MILITARY_FONTS['body']).grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        
-        self.stress_duration_var = tk.StringVar(value="300")
-        stress_spinbox = ttk.Spinbox(parent, from_=60, to=3600, 
-                                   textvariable=self.stress_duration_var, width=10,
-                                   style='BloodAngels.TSpinbox')
+        _MIL_LABEL(parent, text="Длительность тестов (сек):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        
+        stress_spinbox = _MIL_SPINBOX(parent, from_=60, to=3600, textvariable=self.stress_duration_var)
         stress_spinbox.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Типы стресс-тестов
-        self.stress_test_types = {
-            'load_increase': tk.BooleanVar(value=True),
-            'failure_injection': tk.BooleanVar(value=True),
-            'cascade_failure': tk.BooleanVar(value=True),
-            'network_congestion': tk.BooleanVar(value=True),
-            'random_stress': tk.BooleanVar(value=True)
-        }
-        
         row = 1
         for test_type, var in self.stress_test_types.items():
             test_name = test_type.replace('_', ' ').title()
@@ -646,29 +1040,18 @@ class MainWindow(tk.Frame):
         stress_button = ttk.Button(parent, text="╔═══ ЗАПУСК СТРЕСС-ТЕСТОВ ═══╗",
                                  command=self.run_stress_tests,
                                  style='BloodAngels.Gold.TButton')
+        self._register_analysis_button(stress_button)
         stress_button.grid(row=row, column=0, columnspan=2, pady=10)
     
     def _create_whatif_tab(self, parent):
         """Создает вкладку What-if анализа"""
         # Количество симуляций
-        tk.Label(parent, text="Количество симуляций:", 
-                bg=BLOOD_ANGELS_COLORS['bg_panel'],
-                fg=BLOOD_ANGELS_COLORS['text_primary'],
-                font=MILITARY_FONTS['body']).grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        
-        self.whatif_sims_var = tk.StringVar(value="200")
-        whatif_spinbox = ttk.Spinbox(parent, from_=50, to=1000, 
-                                   textvariable=self.whatif_sims_var, width=10,
-                                   style='BloodAngels.TSpinbox')
+        _MIL_LABEL(parent, text="Количество симуляций:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        
+        whatif_spinbox = _MIL_SPINBOX(parent, from_=50, to=1000, textvariable=self.whatif_sims_var)
         whatif_spinbox.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Типы анализа
-        self.whatif_analysis_types = {
-            'sensitivity': tk.BooleanVar(value=True),
-            'monte_carlo': tk.BooleanVar(value=True),
-            'optimization': tk.BooleanVar(value=False)
-        }
-        
         row = 1
         for analysis_type, var in self.whatif_analysis_types.items():
             analysis_name = analysis_type.replace('_', ' ').title()
@@ -680,6 +1063,7 @@ class MainWindow(tk.Frame):
         whatif_button = ttk.Button(parent, text="╔═══ WHAT-IF АНАЛИЗ ═══╗",
                                  command=self.run_whatif_analysis,
                                  style='BloodAngels.Gold.TButton')
+        self._register_analysis_button(whatif_button)
         whatif_button.grid(row=row, column=0, columnspan=2, pady=10)
     
     def _create_control_buttons(self, parent):
@@ -715,12 +1099,14 @@ class MainWindow(tk.Frame):
                                              command=self.create_system,
                                              style='BloodAngels.Gold.TButton')
         self.create_system_button.pack(side=tk.LEFT, padx=(0, 5))
+        self._register_analysis_button(self.create_system_button)
         
         # Кнопка полного анализа
         self.full_analysis_button = ttk.Button(additional_frame, text="╔═══ ПОЛНЫЙ АНАЛИЗ ═══╗", 
                                              command=self.run_full_analysis,
                                              style='BloodAngels.Gold.TButton')
         self.full_analysis_button.pack(side=tk.LEFT, padx=(0, 5))
+        self._register_analysis_button(self.full_analysis_button)
         
         # Кнопка экспорта результатов
         self.export_results_button = ttk.Button(additional_frame, text="╔═══ ЭКСПОРТ ═══╗", 
@@ -733,43 +1119,151 @@ class MainWindow(tk.Frame):
         viz_frame = create_military_frame(parent, "ПАНЕЛЬ ВИЗУАЛИЗАЦИИ")
         viz_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
         
+        # Разрешение графиков (применяется по отпусканию ползунка, чтобы
+        # перетаскивание не вызывало полную перерисовку на каждом шаге)
+        dpi_frame = tk.Frame(viz_frame, bg=BLOOD_ANGELS_COLORS['bg_panel'])
+        dpi_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(0, 10))
+        _MIL_LABEL(dpi_frame, text="Разрешение графиков (dpi):").pack(side=tk.LEFT, padx=5)
+        
+        self.plot_dpi_var = tk.IntVar(value=PLOT_DPI)
+        dpi_scale = ttk.Scale(dpi_frame, from_=50, to=150, orient=tk.HORIZONTAL,
+                              variable=self.plot_dpi_var, length=150,
+                              command=lambda value: self.plot_dpi_var.set(round(float(value))),
+                              style='BloodAngels.Horizontal.TScale')
+        dpi_scale.pack(side=tk.LEFT, padx=5)
+        dpi_scale.bind('<ButtonRelease-1>', self._apply_plot_dpi)
+        _MIL_LABEL(dpi_frame, textvariable=self.plot_dpi_var).pack(side=tk.LEFT, padx=5)
+        
         # Notebook для графиков
         self.viz_notebook = ttk.Notebook(viz_frame, style='BloodAngels.TNotebook')
         self.viz_notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Вкладка "Метрики"
-        metrics_frame = ttk.Frame(self.viz_notebook, style='BloodAngels.TFrame')
-        self.viz_notebook.add(metrics_frame, text="╔═══ МЕТРИКИ ═══╗")
-        self._create_metrics_plots(metrics_frame)
+        # Одна фигура и один холст на все вкладки с графиками: у каждой вкладки
+        # свой набор осей, видимы только оси выбранной вкладки. Макет
+        # рассчитывается вручную один раз, а не решателем при каждой отрисовке
+        Figure, FigureCanvasTkAgg = _ensure_mpl()
+        self._fig = Figure(figsize=PLOT_SIZE, dpi=PLOT_DPI,
+                           facecolor=BLOOD_ANGELS_COLORS['bg_primary'])
+        self._canvas = FigureCanvasTkAgg(self._fig, self.viz_notebook, self._render_lock)
+        self._viz_views = {}  # Вкладка -> оси ее графиков
+        self._subplot_params = {}  # Поля макета, рассчитанные tight_layout
+        self._active_view = None
+        
+        # Вкладки создаются пустыми, графики строятся при первом открытии
+        self._viz_builders = {}  # Вкладка -> (построение, обновление данных)
+        for tab_key, attr, builder, refresh in (
+            ('metrics', '_metrics_view', self._create_metrics_plots, None),
+            ('network', '_network_view', self._create_network_visualization, None),
+            ('reliability', '_reliability_view', self._create_reliability_visualization,
+             self._update_reliability_plots),
+            ('stress_test', '_stress_view', self._create_stress_test_visualization, None),
+            ('whatif', '_whatif_view', self._create_whatif_visualization,
+             self._update_whatif_plots)
+        ):
+            tab_frame = ttk.Frame(self.viz_notebook, style='BloodAngels.TFrame')
+            self.viz_notebook.add(tab_frame, text=_TAB_TITLES[tab_key])
+            self._viz_builders[tab_frame] = (builder, refresh)
+            setattr(self, attr, tab_frame)
+        
+        # Вкладка метрик открыта по умолчанию. Все виды используют одну
+        # сетку 2x2, поэтому макет рассчитывается один раз по ее осям
+        self._build_viz_view(self._metrics_view)
+        self._fig.tight_layout()
+        
+        # Поля макета фиксируются: оси остальных вкладок создаются с ними
+        # же, а обновления графиков макет не пересчитывают
+        params = self._fig.subplotpars
+        self._subplot_params = {name: getattr(params, name)
+                                for name in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')}
+        
+        self.viz_notebook.bind('<<NotebookTabChanged>>', self._on_viz_tab_changed)
+        self._show_viz_view(self._metrics_view)
+    
+    def _apply_plot_dpi(self, event=None):
+        """Меняет разрешение общей фигуры, сохраняя ее размер в пикселях"""
+        dpi = self.plot_dpi_var.get()
+        if dpi == self._fig.dpi:
+            return
         
-        # Вкладка "Сеть"
-        network_frame = ttk.Frame(self.viz_notebook, style='BloodAngels.TFrame')
-        self.viz_notebook.add(network_frame, text="╔═══ СЕТЬ ═══╗")
-        self._create_network_visualization(network_frame)
+        widget = self._canvas.get_tk_widget()
+        width, height = widget.winfo_width(), widget.winfo_height()
+        with self._render_lock:
+            self._fig.set_dpi(dpi)
+            if width > 1 and height > 1:
+                self._fig.set_size_inches(width / dpi, height / dpi, forward=False)
+            self._metrics_bg = None
+        self._canvas.draw_idle()
+    
+    def _build_viz_view(self, tab_frame):
+        """Строит графики вкладки, если это еще не сделано"""
+        entry = self._viz_builders.pop(tab_frame, None)
+        if entry is None:
+            return
         
-        # Вкладка "Надежность"
-        reliability_viz_frame = ttk.Frame(self.viz_notebook, style='BloodAngels.TFrame')
-        self.viz_notebook.add(reliability_viz_frame, text="╔═══ НАДЕЖНОСТЬ ═══╗")
-        self._create_reliability_visualization(reliability_viz_frame)
+        builder, refresh = entry
+        builder(tab_frame)
         
-        # Вкладка "Стресс-тесты"
-        stress_viz_frame = ttk.Frame(self.viz_notebook, style='BloodAngels.TFrame')
-        self.viz_notebook.add(stress_viz_frame, text="╔═══ СТРЕСС-ТЕСТЫ ═══╗")
-        self._create_stress_test_visualization(stress_viz_frame)
+        # Новые оси видимы, только если их вкладка выбрана
+        for ax in self._viz_views.get(tab_frame, ()):
+            ax.set_visible(tab_frame is self._active_view)
         
-        # Вкладка "What-if"
-        whatif_viz_frame = ttk.Frame(self.viz_notebook, style='BloodAngels.TFrame')
-        self.viz_notebook.add(whatif_viz_frame, text="╔═══ WHAT-IF ═══╗")
-        self._create_whatif_visualization(whatif_viz_frame)
+        # Данные созданной ранее системы
+        if refresh is not None:
+            refresh()
+    
+    def _add_view_axes(self, parent):
+        """Создает оси 2x2 для вкладки на общей фигуре"""
+        # Одна сетка и все четыре оси за один вызов; возвращается массив 2x2
+        axes = self._fig.subplots(2, 2, gridspec_kw=self._subplot_params)
+        self._viz_views[parent] = tuple(axes.flat)
+        return axes
+    
+    def _on_viz_tab_changed(self, event):
+        """Переключает общий холст на выбранную вкладку"""
+        self._show_viz_view(self.viz_notebook.nametowidget(self.viz_notebook.select()))
+    
+    def _select_viz_tab(self, tab_frame):
+        """Выбирает вкладку визуализации и сразу показывает ее оси"""
+        self.viz_notebook.select(tab_frame)
+        self._show_viz_view(tab_frame)
+    
+    def _show_viz_view(self, tab_frame):
+        """Показывает оси вкладки на общем холсте, скрывая остальные"""
+        if tab_frame is self._active_view:
+            return
+        
+        # Дожидаемся окончания фоновой растеризации текущего кадра
+        with self._render_lock:
+            self._switch_viz_view(tab_frame)
+    
+    def _switch_viz_view(self, tab_frame):
+        """Переключает видимость осей (вызывается под _render_lock)"""
+        self._active_view = tab_frame
+        self._build_viz_view(tab_frame)
+        
+        widget = self._canvas.get_tk_widget()
+        if tab_frame not in self._viz_views:
+            # Вкладка без графиков matplotlib (топология сети)
+            widget.pack_forget()
+            return
+        
+        for view, axes in self._viz_views.items():
+            for ax in axes:
+                ax.set_visible(view is tab_frame)
+        
+        # Фон для blitting относится к виду метрик
+        self._metrics_bg = None
+        widget.pack(in_=tab_frame, fill=tk.BOTH, expand=True)
+        self._canvas.draw_idle()
     
     def _create_metrics_plots(self, parent):
         """Создает графики метрик"""
-        # Создание фигуры для графиков
-        self.metrics_fig = Figure(figsize=(12, 8), dpi=100, 
-                                facecolor=BLOOD_ANGELS_COLORS['bg_primary'])
+        # Графики строятся на общей фигуре панели визуализации
+        self.metrics_fig = self._fig
+        axes = self._add_view_axes(parent)
+        (self.throughput_ax, self.latency_ax), (self.system_reliability_ax, self.availability_ax) = axes
         
         # График пропускной способности
-        self.throughput_ax = self.metrics_fig.add_subplot(221)
         self.throughput_ax.set_title("ПРОПУСКНАЯ СПОСОБНОСТЬ (Мбит/с)", 
                                    color=BLOOD_ANGELS_COLORS['text_secondary'],
                                    fontweight='bold')
@@ -777,10 +1271,9 @@ class MainWindow(tk.Frame):
         self.throughput_ax.set_ylabel("Мбит/с", color=BLOOD_ANGELS_COLORS['text_primary'])
         self.throughput_line, = self.throughput_ax.plot([], [], 
                                                       color=BLOOD_ANGELS_COLORS['primary_red'],
-                                                      linewidth=3, alpha=0.8)
+                                                      linewidth=3, alpha=0.8, animated=True)
         
         # График задержки
-        self.latency_ax = self.metrics_fig.add_subplot(222)
         self.latency_ax.set_title("ЗАДЕРЖКА СИГНАЛА (мс)", 
                                 color=BLOOD_ANGELS_COLORS['text_secondary'],
                                 fontweight='bold')
@@ -788,21 +1281,19 @@ class MainWindow(tk.Frame):
         self.latency_ax.set_ylabel("мс", color=BLOOD_ANGELS_COLORS['text_primary'])
         self.latency_line, = self.latency_ax.plot([], [], 
                                                 color=BLOOD_ANGELS_COLORS['warning'],
-                                                linewidth=3, alpha=0.8)
+                                                linewidth=3, alpha=0.8, animated=True)
         
         # График надежности
-        self.reliability_ax = self.metrics_fig.add_subplot(223)
-        self.reliability_ax.set_title("НАДЕЖНОСТЬ СИСТЕМЫ", 
+        self.system_reliability_ax.set_title("НАДЕЖНОСТЬ СИСТЕМЫ", 
                                     color=BLOOD_ANGELS_COLORS['text_secondary'],
                                     fontweight='bold')
-        self.reliability_ax.set_xlabel("Время (с)", color=BLOOD_ANGELS_COLORS['text_primary'])
-        self.reliability_ax.set_ylabel("Надежность", color=BLOOD_ANGELS_COLORS['text_primary'])
-        self.reliability_line, = self.reliability_ax.plot([], [], 
+        self.system_reliability_ax.set_xlabel("Время (с)", color=BLOOD_ANGELS_COLORS['text_primary'])
+        self.system_reliability_ax.set_ylabel("Надежность", color=BLOOD_ANGELS_COLORS['text_primary'])
+        self.reliability_line, = self.system_reliability_ax.plot([], [], 
                                                         color=BLOOD_ANGELS_COLORS['success'],
-                                                        linewidth=3, alpha=0.8)
+                                                        linewidth=3, alpha=0.8, animated=True)
         
         # График доступности
-        self.availability_ax = self.metrics_fig.add_subplot(224)
         self.availability_ax.set_title("ДОСТУПНОСТЬ СЕТИ", 
                                      color=BLOOD_ANGELS_COLORS['text_secondary'],
                                      fontweight='bold')
@@ -810,15 +1301,20 @@ class MainWindow(tk.Frame):
         self.availability_ax.set_ylabel("Доступность", color=BLOOD_ANGELS_COLORS['text_primary'])
         self.availability_line, = self.availability_ax.plot([], [], 
                                                           color=BLOOD_ANGELS_COLORS['primary_gold'],
-                                                          linewidth=3, alpha=0.8)
+                                                          linewidth=3, alpha=0.8, animated=True)
         
-        # Настройка макета
-        self.metrics_fig.tight_layout()
         
         # Создание canvas
-        self.metrics_canvas = FigureCanvasTkAgg(self.metrics_fig, parent)
-        self.metrics_canvas.draw()
-        self.metrics_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Линии метрик анимированы: при потоковом обновлении они
+        # перерисовываются поверх сохраненного фона (blitting)
+        self._metric_lines = (self.throughput_line, self.latency_line,
+                              self.reliability_line, self.availability_line)
+        self._metrics_bg = None
+        
+        self.metrics_canvas = self._canvas
+        self.metrics_canvas.mpl_connect('draw_event', self._on_metrics_draw)
+        # После изменения размеров окна сохраненный фон устаревает
+        self.metrics_canvas.mpl_connect('resize_event', self._on_metrics_resize)
     
     def _create_network_visualization(self, parent):
         """Создает визуализацию сети"""
@@ -838,6 +1334,24 @@ class MainWindow(tk.Frame):
         # Рисование примера сети
         self._draw_sample_network(network_canvas)
     
+    def _layout_sample_network(self, system_nodes, canvas_width=400, canvas_height=300):
+        """Размещает узлы в сетке с небольшим случайным смещением"""
+        n = len(system_nodes)
+        cols = math.isqrt(n) + 1
+        index = np.arange(n)
+        rows, columns = np.divmod(index, cols)
+        
+        # Фиксированное зерно для стабильности расположения
+        jitter = np.random.default_rng(42).integers(-20, 21, size=(n, 2))
+        x = (columns + 1) * (canvas_width // (cols + 1)) + jitter[:, 0]
+        y = (rows + 1) * (canvas_height // (max(1, n // cols + 1) + 1)) + jitter[:, 1]
+        
+        # Ограничиваем позиции границами canvas
+        x = np.clip(x, 30, canvas_width - 30)
+        y = np.clip(y, 30, canvas_height - 30)
+        
+        return dict(zip(system_nodes, zip(x.tolist(), y.tolist())))
+    
     def _draw_sample_network(self, canvas):
         """Рисует сеть на основе созданной системы"""
         canvas.delete("all")
@@ -853,178 +1367,141 @@ class MainWindow(tk.Frame):
         system_nodes = list(self.system_model.nodes.keys())
         system_links = list(self.system_model.links.keys())
         
-        # Генерируем позиции узлов
-        import random
-        random.seed(42)  # Фиксированное seed для стабильности
-        
-        canvas_width = 400
-        canvas_height = 300
-        
-        node_positions = {}
-        for i, node_id in enumerate(system_nodes):
-            # Размещаем узлы в сетке с небольшим случайным смещением
-            cols = int(len(system_nodes) ** 0.5) + 1
-            row = i // cols
-            col = i % cols
-            
-            x = (col + 1) * (canvas_width // (cols + 1)) + random.randint(-20, 20)
-            y = (row + 1) * (canvas_height // (max(1, len(system_nodes) // cols + 1) + 1)) + random.randint(-20, 20)
-            
-            # Ограничиваем позиции границами canvas
-            x = max(30, min(canvas_width - 30, x))
-            y = max(30, min(canvas_height - 30, y))
-            
-            node_positions[node_id] = (x, y)
-        
-        # Цвета узлов
-        node_colors = [BLOOD_ANGELS_COLORS['success'], BLOOD_ANGELS_COLORS['primary_gold'], 
-                      BLOOD_ANGELS_COLORS['warning'], BLOOD_ANGELS_COLORS['danger'], 
-                      BLOOD_ANGELS_COLORS['info'], BLOOD_ANGELS_COLORS['primary_red'],
-                      BLOOD_ANGELS_COLORS['secondary_red']]
+        # Позиции и цвета узлов рассчитываются один раз для каждой системы
+        if self._node_positions_system_id != id(self.system_model):
+            self._node_positions_cache = self._layout_sample_network(system_nodes)
+            palette = self._NODE_PALETTE
+            self._node_colors_cache = [palette[i % len(palette)] for i in range(len(system_nodes))]
+            self._node_positions_system_id = id(self.system_model)
+        node_positions = self._node_positions_cache
+        
+        # Все элементы схемы создаются одним Tcl-скриптом: один переход
+        # Python -> Tcl вместо вызова на каждую линию, овал и подпись
+        widget = str(canvas)
+        gold = BLOOD_ANGELS_COLORS['primary_gold']
+        text_color = BLOOD_ANGELS_COLORS['text_primary']
+        font = _tcl_word(" ".join(_tcl_word(part) for part in MILITARY_FONTS['small']))
+        commands = []
         
         # Рисование связей
         for (source, target) in system_links:
             if source in node_positions and target in node_positions:
                 x1, y1 = node_positions[source]
                 x2, y2 = node_positions[target]
-                canvas.create_line(x1, y1, x2, y2, 
-                                 fill=BLOOD_ANGELS_COLORS['primary_gold'], width=2)
+                commands.append(f"{widget} create line {x1} {y1} {x2} {y2} -fill {gold} -width 2")
         
         # Рисование узлов
-        for i, (node_id, (x, y)) in enumerate(node_positions.items()):
-            color_index = i % len(node_colors)
-            canvas.create_oval(x-15, y-15, x+15, y+15, 
-                            fill=node_colors[color_index], 
-                            outline=BLOOD_ANGELS_COLORS['primary_gold'], width=2)
-            canvas.create_text(x, y, text=node_id[:3],  # Показываем первые 3 символа ID
-                             fill=BLOOD_ANGELS_COLORS['text_primary'],
-                             font=MILITARY_FONTS['small'])
+        for (node_id, (x, y)), color in zip(node_positions.items(), self._node_colors_cache):
+            commands.append(f"{widget} create oval {x - 15} {y - 15} {x + 15} {y + 15} "
+                            f"-fill {color} -outline {gold} -width 2")
+            # Показываем первые 3 символа ID
+            commands.append(f"{widget} create text {x} {y} -text {_tcl_word(node_id[:3])} "
+                            f"-fill {text_color} -font {font}")
+        
+        if commands:
+            canvas.tk.eval("\n".join(commands))
     
     def _create_reliability_visualization(self, parent):
         """Создает визуализацию анализа надежности"""
-        # Создание фигуры для надежности
-        self.reliability_fig = Figure(figsize=(12, 8), dpi=100, 
-                                    facecolor=BLOOD_ANGELS_COLORS['bg_primary'])
+        # Графики строятся на общей фигуре панели визуализации
+        self.reliability_fig = self._fig
+        axes = self._add_view_axes(parent)
+        (self.reliability_ax, self.mttf_ax), (self.monte_carlo_ax, self.fault_tree_ax) = axes
         
         # График надежности компонентов
-        self.reliability_ax = self.reliability_fig.add_subplot(221)
         self.reliability_ax.set_title("НАДЕЖНОСТЬ КОМПОНЕНТОВ", 
                                     color=BLOOD_ANGELS_COLORS['text_secondary'],
                                     fontweight='bold')
         
         # График MTTF/MTTR
-        self.mttf_ax = self.reliability_fig.add_subplot(222)
         self.mttf_ax.set_title("MTTF/MTTR", 
                              color=BLOOD_ANGELS_COLORS['text_secondary'],
                              fontweight='bold')
         
         # График анализа Монте-Карло
-        self.monte_carlo_ax = self.reliability_fig.add_subplot(223)
         self.monte_carlo_ax.set_title("АНАЛИЗ МОНТЕ-КАРЛО", 
                                     color=BLOOD_ANGELS_COLORS['text_secondary'],
                                     fontweight='bold')
         
         # График деревьев отказов
-        self.fault_tree_ax = self.reliability_fig.add_subplot(224)
         self.fault_tree_ax.set_title("ДЕРЕВЬЯ ОТКАЗОВ", 
                                    color=BLOOD_ANGELS_COLORS['text_secondary'],
                                    fontweight='bold')
         
         # Настройка осей
-        for ax in [self.reliability_ax, self.mttf_ax, self.monte_carlo_ax, self.fault_tree_ax]:
+        for ax in axes.flat:
             ax.set_facecolor(BLOOD_ANGELS_COLORS['bg_panel'])
             ax.tick_params(colors=BLOOD_ANGELS_COLORS['text_primary'])
         
-        self.reliability_fig.tight_layout()
-        
-        # Canvas для отображения
-        self.reliability_canvas = FigureCanvasTkAgg(self.reliability_fig, parent)
-        self.reliability_canvas.draw()
-        self.reliability_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.reliability_canvas = self._canvas
     
     def _create_stress_test_visualization(self, parent):
         """Создает визуализацию стресс-тестирования"""
-        # Создание фигуры для стресс-тестов
-        self.stress_fig = Figure(figsize=(12, 8), dpi=100, 
-                               facecolor=BLOOD_ANGELS_COLORS['bg_primary'])
+        # Графики строятся на общей фигуре панели визуализации
+        self.stress_fig = self._fig
+        axes = self._add_view_axes(parent)
+        (self.stress_results_ax, self.degradation_ax), (self.failure_points_ax, self.recovery_ax) = axes
         
         # График результатов стресс-тестов
-        self.stress_results_ax = self.stress_fig.add_subplot(221)
         self.stress_results_ax.set_title("РЕЗУЛЬТАТЫ СТРЕСС-ТЕСТОВ", 
                                        color=BLOOD_ANGELS_COLORS['text_secondary'],
                                        fontweight='bold')
         
         # График деградации производительности
-        self.degradation_ax = self.stress_fig.add_subplot(222)
         self.degradation_ax.set_title("ДЕГРАДАЦИЯ ПРОИЗВОДИТЕЛЬНОСТИ", 
                                     color=BLOOD_ANGELS_COLORS['text_secondary'],
                                     fontweight='bold')
         
         # График точек отказа
-        self.failure_points_ax = self.stress_fig.add_subplot(223)
         self.failure_points_ax.set_title("ТОЧКИ ОТКАЗА", 
                                        color=BLOOD_ANGELS_COLORS['text_secondary'],
                                        fontweight='bold')
         
         # График времени восстановления
-        self.recovery_ax = self.stress_fig.add_subplot(224)
         self.recovery_ax.set_title("ВРЕМЯ ВОССТАНОВЛЕНИЯ", 
                                  color=BLOOD_ANGELS_COLORS['text_secondary'],
                                  fontweight='bold')
         
         # Настройка осей
-        for ax in [self.stress_results_ax, self.degradation_ax, self.failure_points_ax, self.recovery_ax]:
+        for ax in axes.flat:
             ax.set_facecolor(BLOOD_ANGELS_COLORS['bg_panel'])
             ax.tick_params(colors=BLOOD_ANGELS_COLORS['text_primary'])
         
-        self.stress_fig.tight_layout()
-        
-        # Canvas для отображения
-        self.stress_canvas = FigureCanvasTkAgg(self.stress_fig, parent)
-        self.stress_canvas.draw()
-        self.stress_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.stress_canvas = self._canvas
     
     def _create_whatif_visualization(self, parent):
         """Создает визуализацию What-if анализа"""
-        # Создание фигуры для What-if анализа
-        self.whatif_fig = Figure(figsize=(12, 8), dpi=100, 
-                               facecolor=BLOOD_ANGELS_COLORS['bg_primary'])
+        # Графики строятся на общей фигуре панели визуализации
+        self.whatif_fig = self._fig
+        axes = self._add_view_axes(parent)
+        (self.sensitivity_ax, self.whatif_monte_carlo_ax), (self.scenarios_ax, self.optimization_ax) = axes
         
         # График чувствительности параметров
-        self.sensitivity_ax = self.whatif_fig.add_subplot(221)
         self.sensitivity_ax.set_title("ЧУВСТВИТЕЛЬНОСТЬ ПАРАМЕТРОВ", 
                                     color=BLOOD_ANGELS_COLORS['text_secondary'],
                                     fontweight='bold')
         
         # График анализа Монте-Карло
-        self.whatif_monte_carlo_ax = self.whatif_fig.add_subplot(222)
         self.whatif_monte_carlo_ax.set_title("ЧТО-ЕСЛИ МОНТЕ-КАРЛО", 
                                            color=BLOOD_ANGELS_COLORS['text_secondary'],
                                            fontweight='bold')
         
         # График сценариев
-        self.scenarios_ax = self.whatif_fig.add_subplot(223)
         self.scenarios_ax.set_title("СЦЕНАРИИ", 
                                   color=BLOOD_ANGELS_COLORS['text_secondary'],
                                   fontweight='bold')
         
         # График оптимизации
-        self.optimization_ax = self.whatif_fig.add_subplot(224)
         self.optimization_ax.set_title("ОПТИМИЗАЦИЯ", 
                                      color=BLOOD_ANGELS_COLORS['text_secondary'],
                                      fontweight='bold')
         
         # Настройка осей
-        for ax in [self.sensitivity_ax, self.whatif_monte_carlo_ax, self.scenarios_ax, self.optimization_ax]:
+        for ax in axes.flat:
             ax.set_facecolor(BLOOD_ANGELS_COLORS['bg_panel'])
             ax.tick_params(colors=BLOOD_ANGELS_COLORS['text_primary'])
         
-        self.whatif_fig.tight_layout()
-        
-        # Canvas для отображения
-        self.whatif_canvas = FigureCanvasTkAgg(self.whatif_fig, parent)
-        self.whatif_canvas.draw()
-        self.whatif_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.whatif_canvas = self._canvas
     
     def _create_status_panel(self):
         """Создает панель статуса"""
@@ -1042,19 +1519,31 @@ class MainWindow(tk.Frame):
                                font=MILITARY_FONTS['monospace'])
         status_label.pack(pady=10)
         
+        log_label = tk.Label(status_frame,
+                            textvariable=self._log_var,
+                            bg=BLOOD_ANGELS_COLORS['bg_panel'],
+                            fg=BLOOD_ANGELS_COLORS['text_secondary'],
+                            font=MILITARY_FONTS['small'])
+        log_label.pack()
+        
+        # Индикатор выполнения фоновых задач (анализ, экспорт)
+        self.analysis_progress = ttk.Progressbar(status_frame, mode='indeterminate', length=300,
+                                                 style='BloodAngels.Horizontal.TProgressbar')
+        self.analysis_progress.pack(pady=(5, 0))
+        
         # Индикаторы статуса
         indicators_frame = tk.Frame(status_frame, bg=BLOOD_ANGELS_COLORS['bg_panel'])
         indicators_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        # Создание индикаторов
+        # Создание индикаторов (фиксированные ячейки одной строки)
         self.network_indicator, _ = create_status_indicator(indicators_frame, "СЕТЬ", "good")
-        self.network_indicator.pack(side=tk.LEFT, padx=5)
+        self.network_indicator.grid(row=0, column=0, padx=5)
         
         self.simulation_indicator, _ = create_status_indicator(indicators_frame, "СИМУЛЯЦИЯ", "normal")
-        self.simulation_indicator.pack(side=tk.LEFT, padx=5)
+        self.simulation_indicator.grid(row=0, column=1, padx=5)
         
         self.analysis_indicator, _ = create_status_indicator(indicators_frame, "АНАЛИЗ", "normal")
-        self.analysis_indicator.pack(side=tk.LEFT, padx=5)
+        self.analysis_indicator.grid(row=0, column=2, padx=5)
     
     def start_simulation(self):
         """Запускает симуляцию"""
@@ -1081,11 +1570,26 @@ class MainWindow(tk.Frame):
             # Генерируем начальные графики на основе созданной системы
             self._generate_initial_plots()
             
+            # Каждый запуск получает свои событие остановки и очередь, чтобы
+            # поток прошлого запуска не повлиял на новый
+            self._stop_evt = threading.Event()
+            self._update_q = queue.Queue(maxsize=1)
+            self._sim_count = 0
+            
+            # Параметры читаются здесь: поток симуляции не обращается к tkinter
+            duration = self.duration_var.get()
+            time_step = self.time_step_var.get()
+            
             # Запуск симуляции в отдельном потоке
-            simulation_thread = threading.Thread(target=self._run_simulation)
+            simulation_thread = threading.Thread(target=self._run_simulation,
+                                                 args=(self._stop_evt, self._update_q,
+                                                       duration, time_step))
             simulation_thread.daemon = True
             simulation_thread.start()
             
+            # Главный поток сам забирает обновления из очереди
+            self.root.after(_UPDATE_INTERVAL_MS, self._drain_updates, self._update_q)
+            
         except Exception as e:
             messagebox.showerror("Ошибка", f"Не удалось запустить симуляцию: {str(e)}")
     
@@ -1099,30 +1603,29 @@ class MainWindow(tk.Frame):
             num_nodes = len(self.system_model.nodes)
             num_links = len(self.system_model.links)
             
-            # Генерируем базовые данные на основе системы
-            import numpy as np
-            import random
-            
             # Время для графиков
             time_points = np.linspace(0, 100, 50)
+            n = time_points.size
             
             # Пропускная способность зависит от количества каналов
             base_throughput = num_links * 20
-            throughput_data = [base_throughput + 30 * np.sin(t/10) + random.uniform(-5, 5) for t in time_points]
+            throughput_data = base_throughput + 30 * np.sin(time_points / 10) + _rng.uniform(-5, 5, n)
             
             # Задержка зависит от сложности сети
             base_latency = 10 + num_nodes * 2
-            latency_data = [base_latency + 8 * np.cos(t/5) + random.uniform(-3, 3) for t in time_points]
+            latency_data = base_latency + 8 * np.cos(time_points / 5) + _rng.uniform(-3, 3, n)
             
             # Надежность зависит от количества узлов
             base_reliability = 0.95 - (num_nodes - 5) * 0.01
-            reliability_data = [max(0.8, min(1.0, base_reliability + 0.03 * np.sin(t/20) + random.uniform(-0.01, 0.01))) for t in time_points]
+            reliability_data = np.clip(base_reliability + 0.03 * np.sin(time_points / 20)
+                                       + _rng.uniform(-0.01, 0.01, n), 0.8, 1.0)
             
             # Доступность
-            availability_data = [0.98 + 0.02 * np.cos(t/15) + random.uniform(-0.01, 0.01) for t in time_points]
+            availability_data = 0.98 + 0.02 * np.cos(time_points / 15) + _rng.uniform(-0.01, 0.01, n)
             
             # Обновляем графики
-            self._update_plots(time_points.tolist(), throughput_data, latency_data, reliability_data, availability_data)
+            with self._render_lock:
+                self._update_plots(time_points, throughput_data, latency_data, reliability_data, availability_data)
             
             # Обновляем графики надежности
             self._update_reliability_plots()
@@ -1133,6 +1636,14 @@ class MainWindow(tk.Frame):
         except Exception as e:
             print(f"Ошибка генерации начальных графиков: {e}")
     
+    def _cache_system_labels(self):
+        """Строит подписи узлов и каналов один раз при создании системы"""
+        self._node_labels = {node_id: f"Узел {node_id[:8]}" for node_id in self.system_model.nodes}
+        self._link_labels = {(source, target): f"Канал {source[:3]}-{target[:3]}"
+                             for source, target in self.system_model.links}
+        self._component_labels = (tuple(self._node_labels.values())
+                                  + tuple(self._link_labels.values()))
+    
     def _update_reliability_plots(self):
         """Обновляет графики надежности на основе созданной системы"""
         try:
@@ -1144,37 +1655,39 @@ class MainWindow(tk.Frame):
             num_links = len(self.system_model.links)
             
             # Генерируем данные надежности
-            import numpy as np
-            
-            # Компоненты системы
-            components = []
-            reliability_values = []
+            # Компоненты системы: узлы, затем каналы (подписи готовы заранее;
+            # пересчитываются, только если состав системы изменился)
+            if len(self._component_labels) != num_nodes + num_links:
+                self._cache_system_labels()
+            components = self._component_labels
             
-            # Узлы
-            for i, node_id in enumerate(self.system_model.nodes.keys()):
-                components.append(f"Узел {node_id[:8]}")
-                reliability_values.append(0.95 + np.random.uniform(-0.05, 0.03))
-            
-            # Каналы
-            for i, (source, target) in enumerate(self.system_model.links.keys()):
-                components.append(f"Канал {source[:3]}-{target[:3]}")
-                reliability_values.append(0.98 + np.random.uniform(-0.03, 0.02))
+            # Значения для всех узлов и всех каналов разыгрываются двумя вызовами
+            node_rel = 0.95 + _rng.uniform(-0.05, 0.03, size=num_nodes)
+            link_rel = 0.98 + _rng.uniform(-0.03, 0.02, size=num_links)
+            reliability_values = np.concatenate((node_rel, link_rel))
             
             # Обновляем график надежности компонентов
-            if hasattr(self, 'reliability_ax'):
-                self.reliability_ax.clear()
-                self.reliability_ax.bar(range(len(components)), reliability_values, 
-                                                color=BLOOD_ANGELS_COLORS['primary_gold'], alpha=0.7)
-                self.reliability_ax.set_title("НАДЕЖНОСТЬ КОМПОНЕНТОВ")
-                self.reliability_ax.set_xlabel("Компоненты")
-                self.reliability_ax.set_ylabel("Надежность")
-                self.reliability_ax.set_ylim(0, 1)
+            with self._render_lock:
+                if hasattr(self, 'reliability_ax'):
+                    # Столбцы создаются один раз, далее меняется только их высота
+                    if not _set_bar_heights(self.reliability_ax, self._rel_bars, reliability_values):
+                        self.reliability_ax.clear()
+                        self._rel_bars = self.reliability_ax.bar(range(len(components)), reliability_values, 
+                                                                 color=BLOOD_ANGELS_COLORS['primary_gold'], alpha=0.7)
+                        self.reliability_ax.set_title("НАДЕЖНОСТЬ КОМПОНЕНТОВ")
+                        self.reliability_ax.set_xlabel("Компоненты")
+                        self.reliability_ax.set_ylabel("Надежность")
+                        self.reliability_ax.set_ylim(0, 1)
+                        self.reliability_ax.set_xticks(range(len(components)))
+                        self._rel_bar_labels = None
                 
-                # Поворачиваем подписи для лучшей читаемости
-                self.reliability_ax.set_xticks(range(len(components)))
-                self.reliability_ax.set_xticklabels(components, rotation=45, ha='right')
+                    # Подписи обновляются только при изменении состава компонентов
+                    if components is not self._rel_bar_labels:
+                        # Поворачиваем подписи для лучшей читаемости
+                        self.reliability_ax.set_xticklabels(components, rotation=45, ha='right')
+                        self._rel_bar_labels = components
                 
-                self.reliability_canvas.draw()
+                    self.reliability_canvas.draw_idle()
             
         except Exception as e:
             print(f"Ошибка обновления графиков надежности: {e}")
@@ -1190,28 +1703,30 @@ class MainWindow(tk.Frame):
             num_links = len(self.system_model.links)
             
             # Генерируем данные для What-if анализа
-            import numpy as np
-            
             # Анализ чувствительности
             parameters = ['Узлы', 'Каналы', 'Нагрузка', 'Отказы']
             sensitivity_values = [num_nodes/50.0, num_links/30.0, 0.7, 0.1]
             
             # Обновляем график чувствительности
-            if hasattr(self, 'sensitivity_ax'):
-                self.sensitivity_ax.clear()
-                self.sensitivity_ax.bar(parameters, sensitivity_values, 
-                                              color=BLOOD_ANGELS_COLORS['primary_gold'], alpha=0.7)
-                self.sensitivity_ax.set_title("ЧТО-ЕСЛИ ЧУВСТВИТЕЛЬНОСТЬ")
-                self.sensitivity_ax.set_ylabel("Влияние")
-                self.sensitivity_ax.set_ylim(0, 1)
+            with self._render_lock:
+                if hasattr(self, 'sensitivity_ax'):
+                    # Столбцы создаются один раз, далее меняется только их высота
+                    if not _set_bar_heights(self.sensitivity_ax, self._sensitivity_bars, sensitivity_values):
+                        self.sensitivity_ax.clear()
+                        self._sensitivity_bars = self.sensitivity_ax.bar(parameters, sensitivity_values, 
+                                                                         color=BLOOD_ANGELS_COLORS['primary_gold'], alpha=0.7)
+                        self.sensitivity_ax.set_title("ЧТО-ЕСЛИ ЧУВСТВИТЕЛЬНОСТЬ")
+                        self.sensitivity_ax.set_ylabel("Влияние")
+                        self.sensitivity_ax.set_ylim(0, 1)
                 
-                self.whatif_canvas.draw()
+                    self.whatif_canvas.draw_idle()
             
         except Exception as e:
             print(f"Ошибка обновления What-if графиков: {e}")
     
     def stop_simulation(self):
         """Останавливает симуляцию"""
+        self._stop_evt.set()
         self.is_simulation_running = False
         self.status_var.set("╔═══ СИМУЛЯЦИЯ ОСТАНОВЛЕНА ═══╗")
         
@@ -1229,98 +1744,263 @@ class MainWindow(tk.Frame):
         self.simulation_data = []
         
         # Очистка графиков
-        self.throughput_line.set_data([], [])
-        self.latency_line.set_data([], [])
-        self.reliability_line.set_data([], [])
-        self.availability_line.set_data([], [])
+        with self._render_lock:
+            self.throughput_line.set_data([], [])
+            self.latency_line.set_data([], [])
+            self.reliability_line.set_data([], [])
+            self.availability_line.set_data([], [])
         
         # Перерисовка
-        self.metrics_canvas.draw()
+        self.metrics_canvas.draw_idle()
         
         self.status_var.set("╔═══ СИСТЕМА СБРОШЕНА ═══╗")
     
-    def _run_simulation(self):
-        """Выполняет симуляцию"""
-        import random
-        import numpy as np
-        
-        # Проверяем, что система создана
-        if not hasattr(self, 'system_model') or self.system_model is None:
-            print("Ошибка: Сначала создайте систему")
-            self.root.after(0, self._simulation_finished)
-            return
-        
-        duration = float(self.duration_var.get())
-        time_step = float(self.time_step_var.get())
-        
-        time_points = []
-        throughput_data = []
-        latency_data = []
-        reliability_data = []
-        availability_data = []
+    def _run_simulation(self, stop_evt, update_q, duration, time_step):
+        """Выполняет симуляцию
         
+        Поток не обращается к tkinter: параметры передает start_simulation
+        (он же проверяет, что система создана), а состояние публикуется
+        в update_q, которую опрашивает _drain_updates в главном потоке.
+        """
         # Используем количество узлов из созданной системы
         num_nodes = len(self.system_model.nodes)
         num_links = len(self.system_model.links)
         
-        for t in np.arange(0, duration, time_step):
-            if not self.is_simulation_running:
+        # Генерация данных симуляции на основе созданной системы:
+        # все точки рассчитываются массивами заранее, цикл только выдает их
+        # в реальном времени
+        t = np.arange(0, duration, time_step)
+        n = t.size
+        
+        # Пропускная способность зависит от количества каналов
+        base_throughput = num_links * 20  # Базовое значение
+        throughput = np.maximum(0, base_throughput + 50 * np.sin(t / 10) + _rng.uniform(-10, 10, n))
+        
+        # Задержка зависит от сложности сети
+        base_latency = 10 + num_nodes * 2  # Базовая задержка
+        latency = np.maximum(0, base_latency + 10 * np.cos(t / 5) + _rng.uniform(-5, 5, n))
+        
+        # Надежность зависит от количества узлов
+        base_reliability = 0.95 - (num_nodes - 5) * 0.01  # Чем больше узлов, тем ниже надежность
+        reliability = np.clip(base_reliability + 0.05 * np.sin(t / 20) + _rng.uniform(-0.02, 0.02, n), 0, 1)
+        
+        # Доступность
+        availability = np.clip(0.98 + 0.02 * np.cos(t / 15) + _rng.uniform(-0.01, 0.01, n), 0, 1)
+        
+        # Ряды читаются главным потоком в _do_redraw: готовы первые _sim_count точек.
+        # Все пять рядов - строки одного непрерывного массива (5, n)
+        self._sim_series = np.stack((t, throughput, latency, reliability, availability))
+        self._downsample_cache = {}
+        
+        count = 0
+        for i in range(n):
+            if stop_evt.is_set():
                 break
             
-            # Генерация данных симуляции на основе созданной системы
-            # Пропускная способность зависит от количества каналов
-            base_throughput = num_links * 20  # Базовое значение
-            throughput = base_throughput + 50 * np.sin(t/10) + random.uniform(-10, 10)
-            
-            # Задержка зависит от сложности сети
-            base_latency = 10 + num_nodes * 2  # Базовая задержка
-            latency = base_latency + 10 * np.cos(t/5) + random.uniform(-5, 5)
-            
-            # Надежность зависит от количества узлов
-            base_reliability = 0.95 - (num_nodes - 5) * 0.01  # Чем больше узлов, тем ниже надежность
-            reliability = base_reliability + 0.05 * np.sin(t/20) + random.uniform(-0.02, 0.02)
-            
-            # Доступность
-            availability = 0.98 + 0.02 * np.cos(t/15) + random.uniform(-0.01, 0.01)
-            
-            time_points.append(t)
-            throughput_data.append(max(0, throughput))
-            latency_data.append(max(0, latency))
-            reliability_data.append(max(0, min(1, reliability)))
-            availability_data.append(max(0, min(1, availability)))
+            count = i + 1
             
-            # Обновление графиков каждые 10 точек
-            if len(time_points) % 10 == 0:
-                self.root.after(0, self._update_plots, 
-                              time_points.copy(), throughput_data.copy(),
-                              latency_data.copy(), reliability_data.copy(),
-                              availability_data.copy())
+            # В очереди хранится только последнее число готовых точек:
+            # если GUI не успевает, старые состояния отбрасываются
+            _put_latest(update_q, (count, False))
             
-            time.sleep(time_step)
+            # Ожидание прерывается сразу при остановке симуляции
+            if stop_evt.wait(time_step):
+                break
         
         # Завершение симуляции
-        self.root.after(0, self._simulation_finished)
+        _put_latest(update_q, (count, True))
     
-    def _update_plots(self, times, throughput, latency, reliability, availability):
-        """Обновляет графики"""
-        # Обновление данных
-        self.throughput_line.set_data(times, throughput)
-        self.latency_line.set_data(times, latency)
-        self.reliability_line.set_data(times, reliability)
-        self.availability_line.set_data(times, availability)
+    def _drain_updates(self, update_q):
+        """Забирает последнее состояние симуляции и перерисовывает графики"""
+        # Очередь прошлого запуска больше не опрашивается
+        if update_q is not self._update_q:
+            return
+        
+        try:
+            count, finished = update_q.get_nowait()
+        except queue.Empty:
+            self.root.after(_UPDATE_INTERVAL_MS, self._drain_updates, update_q)
+            return
+        
+        self._sim_count = count
+        self._schedule_redraw()
+        
+        if finished:
+            self._simulation_finished()
+        else:
+            self.root.after(_UPDATE_INTERVAL_MS, self._drain_updates, update_q)
+    
+    def _request_render(self):
+        """Запрашивает полный кадр графиков метрик у потока растеризации"""
+        if self._render_thread is None:
+            self._render_thread = threading.Thread(target=self._render_worker, daemon=True)
+            self._render_thread.start()
+        
+        # Очередь на один элемент: повторные запросы объединяются
+        try:
+            self._render_queue.put_nowait(None)
+        except queue.Full:
+            return
+        
+        # Результаты потока забирает опрос главного потока
+        self._renders_pending += 1
+        if self._renders_pending == 1:
+            self.root.after(_UPDATE_INTERVAL_MS, self._poll_render)
+    
+    def _render_worker(self):
+        """Растеризует фигуру в буфер Agg вне главного потока
+        
+        Поток не обращается к tkinter: о готовом кадре он сообщает через
+        _render_done, которую опрашивает _poll_render.
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        while True:
+            self._render_queue.get()
+            with self._render_lock:
+                rendered = self._active_view is self._metrics_view
+                if rendered:
+                    # Фон для blitting сохраняет _on_metrics_draw (draw_event)
+                    FigureCanvasAgg.draw(self._canvas)
+            self._render_done.put(rendered)
+    
+    def _poll_render(self):
+        """Забирает результаты потока растеризации, пока есть незавершенные запросы"""
+        rendered = False
+        try:
+            while True:
+                rendered |= self._render_done.get_nowait()
+                self._renders_pending -= 1
+        except queue.Empty:
+            pass
+        
+        if rendered:
+            self._render_finished()
+        if self._renders_pending:
+            self.root.after(_UPDATE_INTERVAL_MS, self._poll_render)
+    
+    def _render_finished(self):
+        """Переносит готовый буфер Agg на холст tkinter"""
+        if self._active_view is self._metrics_view:
+            self._canvas.blit()
+        # Данные, пришедшие во время растеризации, рисуются следующим кадром
+        self._schedule_redraw()
+    
+    def _schedule_redraw(self):
+        """Ставит в очередь перерисовку графиков, если она еще не запланирована"""
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.root.after_idle(self._do_redraw)
+    
+    def _do_redraw(self):
+        """Перерисовывает графики по текущему состоянию рядов симуляции"""
+        self._redraw_pending = False
+        
+        # Во время растеризации фигуру не изменяем: _render_finished
+        # запланирует перерисовку повторно
+        if not self._render_lock.acquire(blocking=False):
+            return
+        try:
+            # Все точки симуляции рассчитаны заранее, поэтому пределы осей
+            # задаются один раз на симуляцию, а не пересчитываются на каждом шаге
+            series = self._sim_series
+            count = self._sim_count
+            if not count:
+                return
+            if series is not self._sim_limits_series:
+                self._fix_metric_limits(series)
+            
+            # Срез - представление общего массива, данные не копируются
+            self._update_plots(*series[:, :count], autoscale=False)
+        finally:
+            self._render_lock.release()
+    
+    def _on_metrics_draw(self, event):
+        """Сохраняет фон каждого графика метрик после полной перерисовки холста"""
+        if self._active_view is not self._metrics_view:
+            return
+        from matplotlib.transforms import Bbox
+        
+        self._metrics_bg = [self.metrics_canvas.copy_from_bbox(line.axes.bbox)
+                            for line in self._metric_lines]
+        # Общая область всех графиков: кадр переносится на холст одним blit
+        self._metrics_blit_bbox = Bbox.union([line.axes.bbox for line in self._metric_lines])
+        
+        if threading.current_thread() is not threading.main_thread():
+            # Поток растеризации: линии только дорисовываются в буфер,
+            # на холст tkinter его переносит _render_finished
+            for line in self._metric_lines:
+                line.axes.draw_artist(line)
+            return
+        self._blit_metric_lines()
+    
+    def _on_metrics_resize(self, event):
+        """Сбрасывает фон графиков метрик: его заново сохранит полная перерисовка"""
+        self._metrics_bg = None
+    
+    def _fix_metric_limits(self, series):
+        """Задает пределы осей метрик по всем рядам симуляции сразу"""
+        times = series[0]
+        x_max = times[-1] if times[-1] > times[0] else times[0] + 1.0
+        for line, values in zip(self._metric_lines, series[1:]):
+            line.axes.set_xlim(times[0], x_max)
+            line.axes.set_ylim(*_padded_range(values))
+        
+        # Новым пределам нужен полный кадр с новым фоном
+        self._metrics_bg = None
+        self._sim_limits_series = series
+    
+    def _blit_metric_lines(self, restore=False):
+        """Рисует только линии метрик и переносит на холст область их осей"""
+        for line, background in zip(self._metric_lines, self._metrics_bg):
+            if restore:
+                self.metrics_canvas.restore_region(background)
+            line.axes.draw_artist(line)
+        self.metrics_canvas.blit(self._metrics_blit_bbox)
+    
+    def _update_plots(self, times, throughput, latency, reliability, availability,
+                      autoscale=True):
+        """Обновляет графики
+        
+        При autoscale=False пределы осей не пересчитываются (заданы заранее
+        в _fix_metric_limits), и кадр обновляется только blitting линий.
+        """
+        # Обновление данных (длинные ряды прореживаются, результат кэшируется
+        # до начала следующей симуляции)
+        for i, (line, values) in enumerate(zip(self._metric_lines,
+                                               (throughput, latency, reliability, availability))):
+            key = (i, len(values), _PLOT_MAX_POINTS)
+            data = self._downsample_cache.get(key)
+            if data is None:
+                data = _downsample(times, values)
+                if len(values) > _PLOT_MAX_POINTS:
+                    self._downsample_cache[key] = data
+            line.set_data(*data)
         
         # Автомасштабирование
-        self.throughput_ax.relim()
-        self.throughput_ax.autoscale_view()
-        self.latency_ax.relim()
-        self.latency_ax.autoscale_view()
-        self.reliability_ax.relim()
-        self.reliability_ax.autoscale_view()
-        self.availability_ax.relim()
-        self.availability_ax.autoscale_view()
+        limits_changed = False
+        for line in self._metric_lines if autoscale else ():
+            ax = line.axes
+            old_limits = (ax.get_xlim(), ax.get_ylim())
+            # Пределы могли быть зафиксированы прошлой симуляцией
+            ax.set_autoscale_on(True)
+            ax.relim()
+            ax.autoscale_view()
+            if (ax.get_xlim(), ax.get_ylim()) != old_limits:
+                limits_changed = True
+        
+        # Вид метрик скрыт: данные будут показаны при переключении на вкладку
+        if self._active_view is not self._metrics_view:
+            return
         
         # Перерисовка
-        self.metrics_canvas.draw_idle()
+        # Фон сбрасывается при изменении размеров окна (_on_metrics_resize)
+        if limits_changed or self._metrics_bg is None:
+            # Нужен полный кадр, фон обновит _on_metrics_draw
+            self._request_render()
+        else:
+            self._blit_metric_lines(restore=True)
     
     def _simulation_finished(self):
         """Обработчик завершения симуляции"""
@@ -1345,153 +2025,271 @@ class MainWindow(tk.Frame):
     # Новые методы для ИКС Анализатора
     def create_system(self):
         """Создает систему для анализа"""
+        # Пока идет анализ, система не заменяется
+        if self._active_tasks:
+            return
+        
         try:
-            nodes = int(self.nodes_var.get())
-            connection_prob = float(self.connection_prob_var.get())
+            nodes = self.nodes_var.get()
+            connection_prob = self.connection_prob_var.get()
             
             self.status_var.set("╔═══ СОЗДАНИЕ СИСТЕМЫ ═══╗")
             
+            from src.system_model import SystemModel
+            
             # Создаем систему
             self.system_model = SystemModel("Пользовательская ИКС")
-            self.system_model.generate_random_network(nodes, connection_prob)
+            self.system_model.generate_random_network(nodes, connection_prob,
+                                                      seed=self.seed_var.get())
+            self._soa = self.system_model.as_soa()
+            self._node_positions_system_id = None
+            self._cache_system_labels()
             
             # Обновляем визуализацию сети
             self._update_network_visualization()
             
             self.status_var.set("╔═══ СИСТЕМА СОЗДАНА ═══╗")
-            messagebox.showinfo("Успех", f"Система создана: {nodes} узлов, {len(self.system_model.links)} каналов")
+            system_info = f"Система создана: {nodes} узлов, {len(self.system_model.links)} каналов"
+            self._log_msg(system_info)
+            messagebox.showinfo("Успех", system_info)
             
         except Exception as e:
-            messagebox.showerror("Ошибка", f"Ошибка создания системы: {e}")
+            error_msg = f"Ошибка создания системы: {e}"
+            self._log_msg(error_msg)
+            messagebox.showerror("Ошибка", error_msg)
+    
+    def _get_pool(self):
+        """Возвращает пул рабочих процессов, создавая его при первом обращении
+        
+        Процессы запускаются через spawn, а не fork: копия процесса с живым
+        интерпретатором Tk и потоками симуляции, растеризации и экспорта
+        может зависнуть на блокировках, занятых в момент fork. Больше всего
+        задач одновременно отправляет полный анализ: надежность, все
+        стресс-тесты и What-if.
+        """
+        if self._pool is None:
+            max_jobs = len(self.stress_test_types) + 2
+            self._pool = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, max_jobs),
+                                             mp_context=multiprocessing.get_context('spawn'))
+        return self._pool
+    
+    def _poll_future(self, future, on_done, error_title):
+        """Ожидает завершения задачи пула, не блокируя цикл событий"""
+        self._poll_futures([future], lambda results: on_done(results[0]), error_title)
+    
+    def _poll_futures(self, futures, on_done, error_title):
+        """Ожидает завершения всех задач пула; результаты передаются списком по порядку"""
+        self._begin_task()
+        self._check_futures(futures, on_done, error_title)
+    
+    def _check_futures(self, futures, on_done, error_title):
+        """Проверяет задачи раз в 50 мс до завершения всех"""
+        if not all(future.done() for future in futures):
+            self.root.after(50, self._check_futures, futures, on_done, error_title)
+            return
+        
+        self._end_task()
+        try:
+            results = [future.result() for future in futures]
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"{error_title}: {e}")
+            return
+        
+        on_done(results)
+    
+    def _begin_task(self):
+        """Отмечает запуск фоновой задачи: индикатор активен, кнопки анализа заблокированы"""
+        self._active_tasks += 1
+        if self._active_tasks == 1:
+            self.analysis_progress.start(50)
+            for button in self._analysis_buttons:
+                button.state(['disabled'])
+    
+    def _end_task(self):
+        """Отмечает завершение фоновой задачи"""
+        self._active_tasks -= 1
+        if not self._active_tasks:
+            self.analysis_progress.stop()
+            for button in self._analysis_buttons:
+                button.state(['!disabled'])
+    
+    def _register_analysis_button(self, button):
+        """Добавляет кнопку к блокируемым на время фоновых задач"""
+        self._analysis_buttons.append(button)
+        # Вкладка могла быть построена во время выполнения задачи
+        if self._active_tasks:
+            button.state(['disabled'])
+    
+    def destroy(self):
+        """Останавливает пулы при закрытии окна"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        # Начатый экспорт дописывается: поток пула завершится сам
+        if self._export_pool is not None:
+            self._export_pool.shutdown(wait=False)
+            self._export_pool = None
+        super().destroy()
     
     def run_reliability_analysis(self):
         """Запускает анализ надежности"""
+        if self._active_tasks:
+            return
+        
         if not self.system_model:
             messagebox.showwarning("Предупреждение", "Сначала создайте систему!")
             return
         
         try:
-            hours = float(self.reliability_hours_var.get())
-            sims = int(self.monte_carlo_sims_var.get())
-            
             self.status_var.set("╔═══ АНАЛИЗ НАДЕЖНОСТИ ═══╗")
             
-            # Создаем анализатор надежности
-            self.reliability_analyzer = ReliabilityAnalyzer(self.system_model)
-            
-            # Настраиваем параметры
-            self._setup_reliability_parameters()
-            
-            # Анализ надежности
-            reliability_results = self.reliability_analyzer.calculate_system_reliability(hours)
-            
-            # Анализ Монте-Карло
-            mc_results = self.reliability_analyzer.monte_carlo_reliability_analysis(sims)
-            
-            # Сохраняем результаты
-            self.analysis_results['reliability'] = {
-                'component_reliability': reliability_results,
-                'monte_carlo': mc_results
-            }
-            
-            # Обновляем визуализацию
-            self._update_reliability_visualization(reliability_results, mc_results)
-            
-            self.status_var.set("╔═══ АНАЛИЗ НАДЕЖНОСТИ ЗАВЕРШЕН ═══╗")
-            messagebox.showinfo("Успех", f"Анализ надежности завершен!\nНадежность системы: {reliability_results.get('system_overall', 0):.4f}")
+            future = self._submit_reliability_analysis()
+            self._poll_future(future,
+                              lambda result: self._reliability_analysis_finished(*result),
+                              "Ошибка анализа надежности")
             
         except Exception as e:
             messagebox.showerror("Ошибка", f"Ошибка анализа надежности: {e}")
     
+    def _submit_reliability_analysis(self):
+        """Настраивает анализатор надежности и отправляет расчет в пул процессов"""
+        hours = self.reliability_hours_var.get()
+        sims = self.monte_carlo_sims_var.get()
+        
+        from src.reliability import ReliabilityAnalyzer
+        
+        # Создаем анализатор надежности
+        self.reliability_analyzer = ReliabilityAnalyzer(self.system_model)
+        
+        # Настраиваем параметры
+        self._setup_reliability_parameters()
+        
+        # Анализ надежности и Монте-Карло выполняются в отдельном процессе
+        return self._get_pool().submit(
+            _reliability_worker, self.system_model,
+            self.reliability_analyzer.failure_rates,
+            self.reliability_analyzer.repair_rates,
+            hours, sims
+        )
+    
+    def _store_reliability_results(self, reliability_results, mc_results):
+        """Сохраняет результаты анализа надежности и обновляет визуализацию"""
+        self.analysis_results['reliability'] = {
+            'component_reliability': reliability_results,
+            'monte_carlo': mc_results
+        }
+        self._update_reliability_visualization(reliability_results, mc_results)
+    
+    def _reliability_analysis_finished(self, reliability_results, mc_results):
+        """Обрабатывает результаты анализа надежности"""
+        self._store_reliability_results(reliability_results, mc_results)
+        
+        self.status_var.set("╔═══ АНАЛИЗ НАДЕЖНОСТИ ЗАВЕРШЕН ═══╗")
+        messagebox.showinfo("Успех", f"Анализ надежности завершен!\nНадежность системы: {reliability_results.get('system_overall', 0):.4f}")
+    
     def run_stress_tests(self):
         """Запускает стресс-тестирование"""
+        if self._active_tasks:
+            return
+        
         if not self.system_model:
             messagebox.showwarning("Предупреждение", "Сначала создайте систему!")
             return
         
         try:
-            duration = float(self.stress_duration_var.get())
-            
             self.status_var.set("╔═══ СТРЕСС-ТЕСТИРОВАНИЕ ═══╗")
             
-            # Создаем стресс-тестер
-            self.stress_tester = StressTester(self.system_model)
-            
-            # Запускаем выбранные тесты
-            results = []
-            
-            if self.stress_test_types['load_increase'].get():
-                results.append(self.stress_tester.run_load_increase_test(duration=duration))
-            
-            if self.stress_test_types['failure_injection'].get():
-                results.append(self.stress_tester.run_failure_injection_test(duration=duration))
-            
-            if self.stress_test_types['cascade_failure'].get():
-                results.append(self.stress_tester.run_cascade_failure_test(duration=duration))
-            
-            if self.stress_test_types['network_congestion'].get():
-                results.append(self.stress_tester.run_network_congestion_test(duration=duration))
-            
-            if self.stress_test_types['random_stress'].get():
-                results.append(self.stress_tester.run_random_stress_test(duration=duration))
-            
-            # Сохраняем результаты
-            self.analysis_results['stress_test'] = results
-            
-            # Обновляем визуализацию
-            self._update_stress_test_visualization(results)
-            
-            successful_tests = sum(1 for result in results if result.success)
-            self.status_var.set("╔═══ СТРЕСС-ТЕСТИРОВАНИЕ ЗАВЕРШЕНО ═══╗")
-            messagebox.showinfo("Успех", f"Стресс-тестирование завершено!\nУспешных тестов: {successful_tests}/{len(results)}")
+            futures = self._submit_stress_tests()
+            self._poll_futures(futures, self._stress_tests_finished,
+                               "Ошибка стресс-тестирования")
             
         except Exception as e:
             messagebox.showerror("Ошибка", f"Ошибка стресс-тестирования: {e}")
     
+    def _submit_stress_tests(self):
+        """Отправляет выбранные стресс-тесты в пул процессов"""
+        duration = self.stress_duration_var.get()
+        
+        # Выбранные тесты
+        selected_tests = [test_type for test_type, var in self.stress_test_types.items()
+                          if var.get()]
+        
+        # Тесты независимы: каждый выполняется в своем процессе пула
+        pool = self._get_pool()
+        return [pool.submit(_stress_worker, self.system_model, duration, test_type)
+                for test_type in selected_tests]
+    
+    def _store_stress_results(self, results):
+        """Сохраняет результаты стресс-тестирования и обновляет визуализацию"""
+        self.analysis_results['stress_test'] = results
+        self._update_stress_test_visualization(results)
+    
+    def _stress_tests_finished(self, results):
+        """Обрабатывает результаты стресс-тестирования"""
+        self._store_stress_results(results)
+        
+        successful_tests = sum(1 for result in results if result.success)
+        self.status_var.set("╔═══ СТРЕСС-ТЕСТИРОВАНИЕ ЗАВЕРШЕНО ═══╗")
+        messagebox.showinfo("Успех", f"Стресс-тестирование завершено!\nУспешных тестов: {successful_tests}/{len(results)}")
+    
     def run_whatif_analysis(self):
         """Запускает What-if анализ"""
+        if self._active_tasks:
+            return
+        
         if not self.system_model:
             messagebox.showwarning("Предупреждение", "Сначала создайте систему!")
             return
         
         try:
-            sims = int(self.whatif_sims_var.get())
-            
             self.status_var.set("╔═══ WHAT-IF АНАЛИЗ ═══╗")
             
-            # Создаем анализатор What-if
-            self.whatif_analyzer = WhatIfAnalyzer(self.system_model)
-            self.whatif_analyzer.create_baseline_system()
-            
-            # Настраиваем параметры
-            self._setup_whatif_parameters()
-            
-            results = {}
-            
-            if self.whatif_analysis_types['sensitivity'].get():
-                sensitivity_results = self.whatif_analyzer.analyze_parameter_sensitivity(
-                    list(self.whatif_analyzer.parameter_ranges.values()), num_samples=20
-                )
-                results['sensitivity'] = sensitivity_results
-            
-            if self.whatif_analysis_types['monte_carlo'].get():
-                mc_results = self.whatif_analyzer.monte_carlo_analysis(num_simulations=sims, simulation_duration=60)
-                results['monte_carlo'] = mc_results
-            
-            # Сохраняем результаты
-            self.analysis_results['whatif'] = results
-            
-            # Обновляем визуализацию
-            self._update_whatif_visualization(results)
-            
-            self.status_var.set("╔═══ WHAT-IF АНАЛИЗ ЗАВЕРШЕН ═══╗")
-            messagebox.showinfo("Успех", "What-if анализ завершен!")
+            future = self._submit_whatif_analysis()
+            self._poll_future(future, self._whatif_analysis_finished,
+                              "Ошибка What-if анализа")
             
         except Exception as e:
             messagebox.showerror("Ошибка", f"Ошибка What-if анализа: {e}")
     
+    def _submit_whatif_analysis(self):
+        """Настраивает анализатор What-if и отправляет расчет в пул процессов"""
+        sims = self.whatif_sims_var.get()
+        
+        from src.whatif import WhatIfAnalyzer
+        
+        # Создаем анализатор What-if
+        self.whatif_analyzer = WhatIfAnalyzer(self.system_model)
+        
+        # Настраиваем параметры
+        self._setup_whatif_parameters()
+        
+        # Анализ (базовая система, чувствительность, Монте-Карло)
+        # выполняется в отдельном процессе
+        return self._get_pool().submit(
+            _whatif_worker, self.system_model,
+            list(self.whatif_analyzer.parameter_ranges.values()),
+            sims, self.seed_var.get(),
+            self.whatif_analysis_types['sensitivity'].get(),
+            self.whatif_analysis_types['monte_carlo'].get()
+        )
+    
+    def _store_whatif_results(self, results):
+        """Сохраняет результаты What-if анализа и обновляет визуализацию"""
+        self.analysis_results['whatif'] = results
+        self._update_whatif_visualization(results)
+    
+    def _whatif_analysis_finished(self, results):
+        """Обрабатывает результаты What-if анализа"""
+        self._store_whatif_results(results)
+        
+        self.status_var.set("╔═══ WHAT-IF АНАЛИЗ ЗАВЕРШЕН ═══╗")
+        messagebox.showinfo("Успех", "What-if анализ завершен!")
+    
     def run_full_analysis(self):
         """Запускает полный анализ системы"""
+        if self._active_tasks:
+            return
+        
         if not self.system_model:
             messagebox.showwarning("Предупреждение", "Сначала создайте систему!")
             return
@@ -1499,21 +2297,33 @@ class MainWindow(tk.Frame):
         try:
             self.status_var.set("╔═══ ПОЛНЫЙ АНАЛИЗ СИСТЕМЫ ═══╗")
             
-            # Анализ надежности
-            self.run_reliability_analysis()
-            
-            # Стресс-тестирование
-            self.run_stress_tests()
-            
-            # What-if анализ
-            self.run_whatif_analysis()
-            
-            self.status_var.set("╔═══ ПОЛНЫЙ АНАЛИЗ ЗАВЕРШЕН ═══╗")
-            messagebox.showinfo("Успех", "Полный анализ системы завершен!")
+            # Этапы не зависят друг от друга: все задачи отправляются в пул
+            # сразу, результаты обрабатываются одним вызовом
+            stress_futures = self._submit_stress_tests()
+            futures = [self._submit_reliability_analysis(), *stress_futures,
+                       self._submit_whatif_analysis()]
+            self._poll_futures(futures,
+                               lambda results: self._full_analysis_finished(
+                                   results[0], results[1:-1], results[-1]),
+                               "Ошибка полного анализа")
             
         except Exception as e:
             messagebox.showerror("Ошибка", f"Ошибка полного анализа: {e}")
     
+    def _full_analysis_finished(self, reliability_result, stress_results, whatif_results):
+        """Обрабатывает результаты полного анализа: одна сводка вместо трех"""
+        reliability_results, mc_results = reliability_result
+        self._store_reliability_results(reliability_results, mc_results)
+        self._store_stress_results(stress_results)
+        self._store_whatif_results(whatif_results)
+        
+        successful_tests = sum(1 for result in stress_results if result.success)
+        self.status_var.set("╔═══ ПОЛНЫЙ АНАЛИЗ ЗАВЕРШЕН ═══╗")
+        messagebox.showinfo("Успех",
+                            f"Полный анализ системы завершен!\n"
+                            f"Надежность системы: {reliability_results.get('system_overall', 0):.4f}\n"
+                            f"Успешных стресс-тестов: {successful_tests}/{len(stress_results)}")
+    
     def export_analysis_results(self):
         """Экспортирует результаты анализа"""
         if not self.analysis_results:
@@ -1530,91 +2340,111 @@ class MainWindow(tk.Frame):
             if filename:
                 self.status_var.set("╔═══ ЭКСПОРТ РЕЗУЛЬТАТОВ ═══╗")
                 
-                with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                    # Система
-                    if self.system_model:
-                        nodes_df, links_df = self.system_model.export_to_dataframe()
-                        nodes_df.to_excel(writer, sheet_name='Узлы', index=False)
-                        links_df.to_excel(writer, sheet_name='Каналы', index=False)
-                    
-                    # Результаты надежности
-                    if 'reliability' in self.analysis_results:
-                        reliability_data = self.analysis_results['reliability']
-                        if 'report' in reliability_data:
-                            reliability_data['report'].to_excel(writer, sheet_name='Надежность', index=False)
-                    
-                    # Результаты стресс-тестирования
-                    if 'stress_test' in self.analysis_results:
-                        stress_results = self.analysis_results['stress_test']
-                        if stress_results:
-                            report_data = []
-                            for result in stress_results:
-                                report_data.append({
-                                    'scenario': result.scenario_name,
-                                    'success': result.success,
-                                    'failure_points': len(result.failure_points),
-                                    'performance_degradation': result.performance_degradation
-                                })
-                            df = pd.DataFrame(report_data)
-                            df.to_excel(writer, sheet_name='Стресс-тесты', index=False)
-                
-                self.status_var.set("╔═══ ЭКСПОРТ ЗАВЕРШЕН ═══╗")
-                messagebox.showinfo("Успех", f"Результаты экспортированы в {filename}")
+                # Запись книги идет в фоновом потоке, окно остается отзывчивым
+                future = self._get_export_pool().submit(self._do_export, filename)
+                self._poll_future(future, self._export_finished, "Ошибка экспорта")
                 
         except Exception as e:
             messagebox.showerror("Ошибка", f"Ошибка экспорта: {e}")
     
+    def _get_export_pool(self):
+        """Возвращает поток экспорта, создавая его при первом обращении"""
+        if self._export_pool is None:
+            self._export_pool = ThreadPoolExecutor(max_workers=1)
+        return self._export_pool
+    
+    def _do_export(self, filename):
+        """Записывает результаты анализа в Excel (выполняется вне главного потока)"""
+        import pandas as pd
+        
+        with _open_excel_writer(filename) as writer:
+            # Система
+            if self.system_model:
+                nodes_df, links_df = self._system_dataframes()
+                _write_sheet(writer, nodes_df, 'Узлы')
+                _write_sheet(writer, links_df, 'Каналы')
+            
+            # Результаты надежности
+            if 'reliability' in self.analysis_results:
+                reliability_data = self.analysis_results['reliability']
+                if 'report' in reliability_data:
+                    _write_sheet(writer, reliability_data['report'], 'Надежность')
+            
+            # Результаты стресс-тестирования
+            if 'stress_test' in self.analysis_results:
+                stress_results = self.analysis_results['stress_test']
+                if stress_results:
+                    # Таблица собирается по столбцам, без словаря на каждую строку
+                    num_results = len(stress_results)
+                    df = pd.DataFrame({
+                        'scenario': [result.scenario_name for result in stress_results],
+                        'success': np.fromiter((result.success for result in stress_results),
+                                               bool, num_results),
+                        'failure_points': np.fromiter((len(result.failure_points) for result in stress_results),
+                                                      np.int64, num_results),
+                        'performance_degradation': np.fromiter(
+                            (result.performance_degradation for result in stress_results),
+                            np.float64, num_results)
+                    })
+                    _write_sheet(writer, df, 'Стресс-тесты')
+        
+        return filename
+    
+    def _system_dataframes(self):
+        """Таблицы узлов и каналов системы; строятся заново только после изменения модели"""
+        system_model = self.system_model
+        key = (system_model, getattr(system_model, 'version', None))
+        cached_key = self._export_cache_key
+        if cached_key is None or cached_key[0] is not key[0] or cached_key[1] != key[1]:
+            self._export_cache = system_model.export_to_dataframe()
+            self._export_cache_key = key
+        return self._export_cache
+    
+    def _export_finished(self, filename):
+        """Сообщает о завершении экспорта"""
+        self.status_var.set("╔═══ ЭКСПОРТ ЗАВЕРШЕН ═══╗")
+        messagebox.showinfo("Успех", f"Результаты экспортированы в {filename}")
+    
+    def _system_cache_key(self):
+        """Ключ кэшей параметров анализа для текущей системы"""
+        return (id(self.system_model), len(self.system_model.nodes), len(self.system_model.links))
+    
     def _setup_reliability_parameters(self):
-        """Настраивает параметры надежности"""
+        """Настраивает параметры надежности (один раз для каждой системы и зерна)
+        
+        Интенсивности разыгрываются генератором с зерном из панели управления
+        симуляцией, поэтому при том же зерне результаты воспроизводимы.
+        """
         if self.system_model is None or self.reliability_analyzer is None:
             return
         
-        failure_rates = {}
-        repair_rates = {}
-        
-        for node_id in self.system_model.nodes:
-            failure_rates[node_id] = np.random.uniform(1e-5, 1e-3)
-            repair_rates[node_id] = np.random.uniform(0.1, 1.0)
-        
-        for (source, target), link in self.system_model.links.items():
-            link_id = f"{source}_{target}"
-            failure_rates[link_id] = np.random.uniform(1e-6, 1e-4)
-            repair_rates[link_id] = np.random.uniform(0.5, 2.0)
-        
+        seed = self.seed_var.get()
+        key = (*self._system_cache_key(), seed)
+        cached = self._reliability_params_cache.get(key)
+        if cached is None:
+            # Хранится только запись последней системы
+            self._reliability_params_cache.clear()
+            cached = self._reliability_params_cache[key] = (
+                self.system_model,
+                *_random_component_rates(self._soa, np.random.default_rng(seed)))
+        
+        _, failure_rates, repair_rates = cached
         self.reliability_analyzer.set_failure_rates(failure_rates)
         self.reliability_analyzer.set_repair_rates(repair_rates)
     
     def _setup_whatif_parameters(self):
-        """Настраивает параметры What-if анализа"""
+        """Настраивает параметры What-if анализа (один раз для каждой системы)"""
         if self.system_model is None or self.whatif_analyzer is None:
             return
         
-        parameter_ranges = []
-        
-        for node_id, node in self.system_model.nodes.items():
-            parameter_ranges.append(
-                ParameterRange(
-                    param_type=ParameterType.NODE_CAPACITY,
-                    component_id=node_id,
-                    min_value=node.capacity * 0.5,
-                    max_value=node.capacity * 2.0,
-                    default_value=node.capacity
-                )
-            )
+        key = self._system_cache_key()
+        cached = self._whatif_params_cache.get(key)
+        if cached is None:
+            self._whatif_params_cache.clear()
+            cached = self._whatif_params_cache[key] = (
+                self.system_model, _component_parameter_ranges(self._soa))
         
-        for (source, target), link in self.system_model.links.items():
-            link_id = f"{source}_{target}"
-            parameter_ranges.append(
-                ParameterRange(
-                    param_type=ParameterType.LINK_BANDWIDTH,
-                    component_id=link_id,
-                    min_value=link.bandwidth * 0.5,
-                    max_value=link.bandwidth * 2.0,
-                    default_value=link.bandwidth
-                )
-            )
-        
-        self.whatif_analyzer.set_parameter_ranges(parameter_ranges)
+        self.whatif_analyzer.set_parameter_ranges(cached[1])
     
     def _update_network_visualization(self):
         """Обновляет визуализацию сети"""
@@ -1622,123 +2452,141 @@ class MainWindow(tk.Frame):
             return
         
         # Переключаемся на вкладку сети
-        self.viz_notebook.select(1)  # Вкладка "СЕТЬ"
+        self._select_viz_tab(self._network_view)
         
         # Здесь можно добавить код для обновления визуализации сети
         # с использованием данных из self.system_model
     
+    def _show_result_bars(self, ax, labels, values, color, title, ylabel=None):
+        """Показывает столбцы результата анализа
+        
+        Если набор подписей не изменился, у существующих столбцов меняется
+        только высота; оси очищаются и строятся заново лишь при новом наборе.
+        """
+        labels = tuple(labels)
+        shown = self._result_bars.get(ax)
+        if shown is not None and shown[0] == labels and _set_bar_heights(ax, shown[1], values):
+            ax.relim()
+            ax.autoscale_view()
+            return
+        
+        _clear_axes(ax)
+        self._result_bars[ax] = (labels, ax.bar(labels, values, color=color, alpha=0.7))
+        ax.title.set_text(title)
+        if ylabel is not None:
+            ax.set_ylabel(ylabel)
+    
+    def _clear_result_bars(self, ax):
+        """Убирает с осей столбцы результата, для которого нет данных"""
+        if self._result_bars.pop(ax, None) is not None:
+            _clear_axes(ax)
+    
     def _update_reliability_visualization(self, reliability_results, mc_results):
         """Обновляет визуализацию надежности"""
         # Переключаемся на вкладку надежности
-        self.viz_notebook.select(3)  # Вкладка "НАДЕЖНОСТЬ"
-        
-        # Очищаем оси
-        self.reliability_ax.clear()
-        self.mttf_ax.clear()
-        self.monte_carlo_ax.clear()
-        self.fault_tree_ax.clear()
+        self._select_viz_tab(self._reliability_view)
         
-        # График надежности компонентов
-        if reliability_results:
-            components = list(reliability_results.keys())
-            values = list(reliability_results.values())
+        with self._render_lock:
+            # График надежности компонентов
+            if reliability_results:
+                components = list(reliability_results.keys())
+                values = list(reliability_results.values())
             
-            self.reliability_ax.bar(components[:5], values[:5], 
-                                  color=BLOOD_ANGELS_COLORS['primary_red'], alpha=0.7)
-            self.reliability_ax.set_title("НАДЕЖНОСТЬ КОМПОНЕНТОВ")
-            self.reliability_ax.set_ylabel("Надежность")
-        
-        # График Монте-Карло
-        if mc_results and 'throughput_samples' in mc_results:
-            throughput_stats = mc_results['throughput_samples']
-            self.monte_carlo_ax.bar(['Mean', 'Std', 'Min', 'Max'], 
-                                  [throughput_stats['mean'], throughput_stats['std'], 
-                                   throughput_stats['min'], throughput_stats['max']],
-                                  color=BLOOD_ANGELS_COLORS['primary_gold'], alpha=0.7)
-            self.monte_carlo_ax.set_title("АНАЛИЗ МОНТЕ-КАРЛО")
+                self._show_result_bars(self.reliability_ax, components[:5], values[:5],
+                                       BLOOD_ANGELS_COLORS['primary_red'],
+                                       "НАДЕЖНОСТЬ КОМПОНЕНТОВ", "Надежность")
+            else:
+                self._clear_result_bars(self.reliability_ax)
+            
+            # График Монте-Карло
+            if mc_results and 'throughput_samples' in mc_results:
+                throughput_stats = mc_results['throughput_samples']
+                self._show_result_bars(self.monte_carlo_ax, ('Mean', 'Std', 'Min', 'Max'),
+                                       [throughput_stats['mean'], throughput_stats['std'],
+                                        throughput_stats['min'], throughput_stats['max']],
+                                       BLOOD_ANGELS_COLORS['primary_gold'], "АНАЛИЗ МОНТЕ-КАРЛО")
+            else:
+                self._clear_result_bars(self.monte_carlo_ax)
         
         # Перерисовка
-        self.reliability_canvas.draw()
+        self.reliability_canvas.draw_idle()
     
     def _update_stress_test_visualization(self, results):
         """Обновляет визуализацию стресс-тестов"""
         # Переключаемся на вкладку стресс-тестов
-        self.viz_notebook.select(4)  # Вкладка "СТРЕСС-ТЕСТЫ"
-        
-        # Очищаем оси
-        self.stress_results_ax.clear()
-        self.degradation_ax.clear()
-        self.failure_points_ax.clear()
-        self.recovery_ax.clear()
-        
-        if results:
-            # График результатов
-            scenarios = [result.scenario_name for result in results]
-            success_rates = [1 if result.success else 0 for result in results]
-            
-            self.stress_results_ax.bar(scenarios, success_rates, 
-                                     color=BLOOD_ANGELS_COLORS['success'], alpha=0.7)
-            self.stress_results_ax.set_title("РЕЗУЛЬТАТЫ СТРЕСС-ТЕСТОВ")
-            self.stress_results_ax.set_ylabel("Успех (0/1)")
-            
-            # График деградации
-            degradations = [result.performance_degradation for result in results]
-            self.degradation_ax.bar(scenarios, degradations, 
-                                  color=BLOOD_ANGELS_COLORS['warning'], alpha=0.7)
-            self.degradation_ax.set_title("ДЕГРАДАЦИЯ ПРОИЗВОДИТЕЛЬНОСТИ")
-            self.degradation_ax.set_ylabel("Деградация")
+        self._select_viz_tab(self._stress_view)
+        
+        with self._render_lock:
+            if results:
+                # График результатов
+                scenarios = [result.scenario_name for result in results]
+                success_rates = [1 if result.success else 0 for result in results]
+                self._show_result_bars(self.stress_results_ax, scenarios, success_rates,
+                                       BLOOD_ANGELS_COLORS['success'],
+                                       "РЕЗУЛЬТАТЫ СТРЕСС-ТЕСТОВ", "Успех (0/1)")
+            
+                # График деградации
+                degradations = [result.performance_degradation for result in results]
+                self._show_result_bars(self.degradation_ax, scenarios, degradations,
+                                       BLOOD_ANGELS_COLORS['warning'],
+                                       "ДЕГРАДАЦИЯ ПРОИЗВОДИТЕЛЬНОСТИ", "Деградация")
+            else:
+                self._clear_result_bars(self.stress_results_ax)
+                self._clear_result_bars(self.degradation_ax)
         
         # Перерисовка
-        self.stress_canvas.draw()
+        self.stress_canvas.draw_idle()
     
     def _update_whatif_visualization(self, results):
         """Обновляет визуализацию What-if анализа"""
         # Переключаемся на вкладку What-if
-        self.viz_notebook.select(5)  # Вкладка "WHAT-IF"
-        
-        # Очищаем оси
-        self.sensitivity_ax.clear()
-        self.whatif_monte_carlo_ax.clear()
-        self.scenarios_ax.clear()
-        self.optimization_ax.clear()
-        
-        # График чувствительности
-        if 'sensitivity' in results:
-            sensitivity_data = results['sensitivity']
-            params = list(sensitivity_data.keys())
-            means = [np.mean(values) if values else 0 for values in sensitivity_data.values()]
-            
-            self.sensitivity_ax.bar(params[:5], means[:5], 
-                                  color=BLOOD_ANGELS_COLORS['info'], alpha=0.7)
-            self.sensitivity_ax.set_title("ЧУВСТВИТЕЛЬНОСТЬ ПАРАМЕТРОВ")
-            self.sensitivity_ax.set_ylabel("Среднее значение")
-        
-        # График Монте-Карло
-        if 'monte_carlo' in results and 'throughput_samples' in results['monte_carlo']:
-            mc_stats = results['monte_carlo']['throughput_samples']
-            self.whatif_monte_carlo_ax.bar(['Mean', 'Std', 'Min', 'Max'], 
-                                         [mc_stats['mean'], mc_stats['std'], 
-                                          mc_stats['min'], mc_stats['max']],
-                                         color=BLOOD_ANGELS_COLORS['primary_gold'], alpha=0.7)
-            self.whatif_monte_carlo_ax.set_title("ЧТО-ЕСЛИ МОНТЕ-КАРЛО")
+        self._select_viz_tab(self._whatif_view)
+        
+        with self._render_lock:
+            # График чувствительности
+            if 'sensitivity' in results:
+                sensitivity_data = results['sensitivity']
+                params = list(sensitivity_data.keys())
+                means = [np.mean(values) if values else 0 for values in sensitivity_data.values()]
+            
+                self._show_result_bars(self.sensitivity_ax, params[:5], means[:5],
+                                       BLOOD_ANGELS_COLORS['info'],
+                                       "ЧУВСТВИТЕЛЬНОСТЬ ПАРАМЕТРОВ", "Среднее значение")
+            else:
+                self._clear_result_bars(self.sensitivity_ax)
+            
+            # График Монте-Карло
+            if 'monte_carlo' in results and 'throughput_samples' in results['monte_carlo']:
+                mc_stats = results['monte_carlo']['throughput_samples']
+                self._show_result_bars(self.whatif_monte_carlo_ax, ('Mean', 'Std', 'Min', 'Max'),
+                                       [mc_stats['mean'], mc_stats['std'],
+                                        mc_stats['min'], mc_stats['max']],
+                                       BLOOD_ANGELS_COLORS['primary_gold'], "ЧТО-ЕСЛИ МОНТЕ-КАРЛО")
+            else:
+                self._clear_result_bars(self.whatif_monte_carlo_ax)
         
         # Перерисовка
-        self.whatif_canvas.draw()
+        self.whatif_canvas.draw_idle()
 
 
 class ICSAnalyzer:
     """Основной класс ИКС Анализатора для CLI режима"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.system_model = None
         self.reliability_analyzer = None
         self.simulator = None
         self.stress_tester = None
         self.whatif_analyzer = None
         self.results = {}
+        
+        # Генератор случайных параметров анализа (seed задает воспроизводимость)
+        self._rng = np.random.default_rng(seed)
     
-    def create_sample_system(self) -> SystemModel:
+    def create_sample_system(self) -> 'SystemModel':
         """Создать пример системы для анализа"""
+        from src.system_model import create_sample_network
+        
         print("Создание примерной ИКС...")
         self.system_model = create_sample_network()
         
@@ -1748,8 +2596,10 @@ class ICSAnalyzer:
         
         return self.system_model
     
-    def create_custom_system(self, num_nodes: int = 10, connection_prob: float = 0.3) -> SystemModel:
+    def create_custom_system(self, num_nodes: int = 10, connection_prob: float = 0.3) -> 'SystemModel':
         """Создать пользовательскую систему"""
+        from src.system_model import SystemModel
+        
         print(f"Создание пользовательской ИКС ({num_nodes} узлов, вероятность соединения {connection_prob})...")
         
         self.system_model = SystemModel("Пользовательская ИКС")
@@ -1768,6 +2618,8 @@ class ICSAnalyzer:
         
         print(f"\n=== Анализ надежности (на {duration_hours} часов) ===")
         
+        from src.reliability import ReliabilityAnalyzer
+        
         # Создаем анализатор надежности
         self.reliability_analyzer = ReliabilityAnalyzer(self.system_model)
         
@@ -1808,6 +2660,8 @@ class ICSAnalyzer:
         
         print(f"\n=== Имитационное моделирование ({duration} секунд) ===")
         
+        from src.simulation import NetworkSimulator
+        
         # Создаем симулятор
         self.simulator = NetworkSimulator(self.system_model, duration)
         
@@ -1845,6 +2699,8 @@ class ICSAnalyzer:
         
         print(f"\n=== Стресс-тестирование ({duration} секунд) ===")
         
+        from src.stress_test import StressTester
+        
         # Создаем стресс-тестер
         self.stress_tester = StressTester(self.system_model)
         
@@ -1856,11 +2712,14 @@ class ICSAnalyzer:
         
         self.results['stress_test'] = {
             'results': stress_results,
-            'report': report
+            'report': report,
+            # Признаки успеха тестов для подсчета без обхода объектов результатов
+            'success_mask': np.fromiter((result.success for result in stress_results),
+                                        bool, len(stress_results))
         }
         
         print(f"Выполнено {len(stress_results)} стресс-тестов")
-        successful_tests = sum(1 for result in stress_results if result.success)
+        successful_tests = int(self.results['stress_test']['success_mask'].sum())
         print(f"Успешных тестов: {successful_tests}/{len(stress_results)}")
         
         return self.results['stress_test']
@@ -1872,6 +2731,8 @@ class ICSAnalyzer:
         
         print(f"\n=== What-if анализ ===")
         
+        from src.whatif import WhatIfAnalyzer
+        
         # Создаем анализатор What-if
         self.whatif_analyzer = WhatIfAnalyzer(self.system_model)
         self.whatif_analyzer.create_baseline_system()
@@ -1914,24 +2775,7 @@ class ICSAnalyzer:
         if self.system_model is None or self.reliability_analyzer is None:
             return
         
-        # Частоты отказов (отказов в час)
-        failure_rates = {}
-        for node_id in self.system_model.nodes:
-            failure_rates[node_id] = np.random.uniform(1e-5, 1e-3)
-        
-        for (source, target), link in self.system_model.links.items():
-            link_id = f"{source}_{target}"
-            failure_rates[link_id] = np.random.uniform(1e-6, 1e-4)
-        
-        # Частоты восстановления (восстановлений в час)
-        repair_rates = {}
-        for node_id in self.system_model.nodes:
-            repair_rates[node_id] = np.random.uniform(0.1, 1.0)  # 1-10 часов на восстановление
-        
-        for (source, target), link in self.system_model.links.items():
-            link_id = f"{source}_{target}"
-            repair_rates[link_id] = np.random.uniform(0.5, 2.0)  # 0.5-2 часа на восстановление
-        
+        failure_rates, repair_rates = _random_component_rates(self.system_model.as_soa(), self._rng)
         self.reliability_analyzer.set_failure_rates(failure_rates)
         self.reliability_analyzer.set_repair_rates(repair_rates)
     
@@ -1940,34 +2784,7 @@ class ICSAnalyzer:
         if self.system_model is None or self.whatif_analyzer is None:
             return
         
-        parameter_ranges = []
-        
-        # Диапазоны для узлов
-        for node_id, node in self.system_model.nodes.items():
-            parameter_ranges.append(
-                ParameterRange(
-                    param_type=ParameterType.NODE_CAPACITY,
-                    component_id=node_id,
-                    min_value=node.capacity * 0.5,
-                    max_value=node.capacity * 2.0,
-                    default_value=node.capacity
-                )
-            )
-        
-        # Диапазоны для каналов
-        for (source, target), link in self.system_model.links.items():
-            link_id = f"{source}_{target}"
-            parameter_ranges.append(
-                ParameterRange(
-                    param_type=ParameterType.LINK_BANDWIDTH,
-                    component_id=link_id,
-                    min_value=link.bandwidth * 0.5,
-                    max_value=link.bandwidth * 2.0,
-                    default_value=link.bandwidth
-                )
-            )
-        
-        self.whatif_analyzer.set_parameter_ranges(parameter_ranges)
+        self.whatif_analyzer.set_parameter_ranges(_component_parameter_ranges(self.system_model.as_soa()))
     
     def _analyze_custom_scenarios(self, scenarios: List[Dict]) -> List:
         """Анализ пользовательских сценариев"""
@@ -1988,95 +2805,107 @@ class ICSAnalyzer:
         
         return self.whatif_analyzer.scenario_analysis(whatif_scenarios)
     
-    def export_results(self, filename: str = "ics_analysis_results.xlsx"):
-        """Экспорт результатов в Excel"""
+    def export_results(self, filename: str = "ics_analysis_results.xlsx",
+                       export_format: str = "xlsx"):
+        """Экспорт результатов
+        
+        xlsx - одна книга Excel с листом на каждую таблицу; parquet и feather -
+        отдельный файл <имя>_<таблица>.<формат> на каждую таблицу (нужен pyarrow).
+        """
         if not self.results:
             print("Нет результатов для экспорта")
             return
         
-        print(f"Экспорт результатов в {filename}...")
+        if export_format != 'xlsx' and find_spec('pyarrow') is None:
+            print(f"Для экспорта в {export_format} требуется pyarrow")
+            return
         
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            # Общие метрики системы
-            if self.system_model:
-                nodes_df, links_df = self.system_model.export_to_dataframe()
-                nodes_df.to_excel(writer, sheet_name='Узлы', index=False)
-                links_df.to_excel(writer, sheet_name='Каналы', index=False)
-            
-            # Результаты надежности
-            if 'reliability' in self.results:
-                reliability_data = self.results['reliability']
-                if 'report' in reliability_data:
-                    reliability_data['report'].to_excel(writer, sheet_name='Надежность', index=False)
-            
-            # Результаты симуляции
-            if 'simulation' in self.results:
-                simulation_data = self.results['simulation']
-                if 'events_dataframe' in simulation_data and not simulation_data['events_dataframe'].empty:
-                    simulation_data['events_dataframe'].to_excel(writer, sheet_name='События', index=False)
-                if 'metrics_dataframe' in simulation_data and not simulation_data['metrics_dataframe'].empty:
-                    simulation_data['metrics_dataframe'].to_excel(writer, sheet_name='Метрики', index=False)
-            
-            # Результаты стресс-тестирования
-            if 'stress_test' in self.results:
-                stress_data = self.results['stress_test']
-                if 'report' in stress_data and not stress_data['report'].empty:
-                    stress_data['report'].to_excel(writer, sheet_name='Стресс-тесты', index=False)
-            
-            # Результаты What-if анализа
-            if 'whatif' in self.results:
-                whatif_data = self.results['whatif']
-                if 'report' in whatif_data and not whatif_data['report'].empty:
-                    whatif_data['report'].to_excel(writer, sheet_name='What-if', index=False)
+        tables = self._result_tables()
+        if not tables:
+            print("Все таблицы результатов пусты, файл не создан")
+            return
+        
+        base = os.path.splitext(filename)[0]
+        target = filename if export_format == 'xlsx' else f"{base}_*.{export_format}"
+        print(f"Экспорт результатов в {target}...")
+        
+        if export_format == 'xlsx':
+            with _open_excel_writer(filename) as writer:
+                for sheet_name, df in tables:
+                    _write_sheet(writer, df, sheet_name)
+        else:
+            # Файлы независимы, а pyarrow отпускает GIL при кодировании и
+            # записи, поэтому таблицы пишутся параллельно
+            jobs = [(f"{base}_{sheet_name}.{export_format}", df, export_format)
+                    for sheet_name, df in tables]
+            with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as pool:
+                list(pool.map(_write_columnar_table, *zip(*jobs)))
+        
+        print(f"Результаты экспортированы в {target}")
+    
+    def _result_tables(self) -> List:
+        """Непустые таблицы результатов для экспорта: пары (имя листа, DataFrame)"""
+        candidates = []
+        
+        # Общие метрики системы
+        if self.system_model:
+            nodes_df, links_df = self.system_model.export_to_dataframe()
+            candidates += [('Узлы', nodes_df), ('Каналы', links_df)]
+        
+        simulation_data = self.results.get('simulation', {})
+        candidates += [
+            ('Надежность', self.results.get('reliability', {}).get('report')),
+            ('События', simulation_data.get('events_dataframe')),
+            ('Метрики', simulation_data.get('metrics_dataframe')),
+            ('Стресс-тесты', self.results.get('stress_test', {}).get('report')),
+            ('What-if', self.results.get('whatif', {}).get('report')),
+        ]
         
-        print(f"Результаты экспортированы в {filename}")
+        return [(name, df) for name, df in candidates if df is not None and not df.empty]
     
     def print_summary(self):
         """Вывести краткое резюме анализа"""
-        print("\n" + "="*60)
-        print("           РЕЗЮМЕ АНАЛИЗА ИКС")
-        print("="*60)
+        # Резюме собирается целиком и выводится одной записью в stdout
+        lines = ["", "="*60, "           РЕЗЮМЕ АНАЛИЗА ИКС", "="*60]
         
         if not self.results:
-            print("Анализ не проводился")
+            lines.append("Анализ не проводился")
+            sys.stdout.write('\n'.join(lines) + '\n')
             return
         
         # Информация о системе
         if self.system_model:
-            print(f"Система: {self.system_model.name}")
-            print(f"Узлов: {len(self.system_model.nodes)}")
-            print(f"Каналов: {len(self.system_model.links)}")
+            lines.append(f"Система: {self.system_model.name}")
+            lines.append(f"Узлов: {len(self.system_model.nodes)}")
+            lines.append(f"Каналов: {len(self.system_model.links)}")
         
         # Результаты надежности
         if 'reliability' in self.results:
             reliability = self.results['reliability']
-            print(f"\nНадежность:")
-            print(f"  Общая надежность: {reliability['component_reliability'].get('system_overall', 0):.4f}")
-            print(f"  Надежность связности: {reliability['connectivity_reliability']:.4f}")
+            lines.append("\nНадежность:")
+            lines.append(f"  Общая надежность: {reliability['component_reliability'].get('system_overall', 0):.4f}")
+            lines.append(f"  Надежность связности: {reliability['connectivity_reliability']:.4f}")
         
         # Результаты симуляции
         if 'simulation' in self.results:
             simulation = self.results['simulation']['metrics']
-            print(f"\nСимуляция:")
-            print(f"  Успешность: {simulation.get('success_rate', 0):.3f}")
-            print(f"  Пропускная способность: {simulation.get('network_throughput', 0):.2f} Мбит/сек")
-            print(f"  Время отклика: {simulation.get('average_response_time', 0):.3f} сек")
+            lines.append("\nСимуляция:")
+            lines.append(f"  Успешность: {simulation.get('success_rate', 0):.3f}")
+            lines.append(f"  Пропускная способность: {simulation.get('network_throughput', 0):.2f} Мбит/сек")
+            lines.append(f"  Время отклика: {simulation.get('average_response_time', 0):.3f} сек")
         
         # Результаты стресс-тестирования
         if 'stress_test' in self.results:
-            stress_results = self.results['stress_test']['results']
-            successful_tests = sum(1 for result in stress_results if result.success)
-            print(f"\nСтресс-тестирование:")
-            print(f"  Успешных тестов: {successful_tests}/{len(stress_results)}")
+            success_mask = self.results['stress_test']['success_mask']
+            lines.append("\nСтресс-тестирование:")
+            lines.append(f"  Успешных тестов: {int(success_mask.sum())}/{len(success_mask)}")
         
-        print("="*60)
+        lines.append("="*60)
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def main():
     """Главная функция запуска приложения"""
-    import argparse
-    import sys
-    
     # Проверяем аргументы командной строки
     if len(sys.argv) > 1:
         # Проверяем специальный аргумент для GUI
@@ -2091,7 +2920,6 @@ def main():
 
 def run_cli_mode():
     """Запуск в режиме командной строки"""
-    import argparse
     parser = argparse.ArgumentParser(
         description="ИКС Анализатор Системы - Анализ информационно-коммуникационных систем",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2140,15 +2968,20 @@ def run_cli_mode():
                        help='Длительность симуляции в секундах (по умолчанию: 300)')
     parser.add_argument('--reliability-hours', type=float, default=8760,
                        help='Время для анализа надежности в часах (по умолчанию: 8760)')
+    parser.add_argument('--seed', type=int, default=None,
+                       help='Зерно генератора случайных параметров анализа (по умолчанию: случайное)')
     
     # Экспорт результатов
     parser.add_argument('--export', type=str, default='ics_analysis_results.xlsx',
                        help='Имя файла для экспорта результатов (по умолчанию: ics_analysis_results.xlsx)')
+    parser.add_argument('--export-format', choices=['xlsx', 'parquet', 'feather'], default='xlsx',
+                       help='Формат экспорта: книга Excel или по файлу parquet/feather на таблицу '
+                            '(по умолчанию: xlsx)')
     
     args = parser.parse_args()
     
     # Создаем анализатор
-    analyzer = ICSAnalyzer()
+    analyzer = ICSAnalyzer(seed=args.seed)
     
     try:
         # Создаем систему
@@ -2157,61 +2990,70 @@ def run_cli_mode():
         else:
             analyzer.create_sample_system()
         
-        # Выполняем анализ
+        # Виды анализа в порядке выполнения: флаг -> запуск
+        stages = (
+            ('reliability', partial(analyzer.analyze_reliability, args.reliability_hours)),
+            ('simulation', partial(analyzer.run_simulation, args.duration)),
+            ('stress_tests', partial(analyzer.run_stress_tests, args.duration)),
+            ('whatif_analysis', analyzer.run_whatif_analysis),
+        )
+        
+        # Выполняем анализ: полный или только выбранные виды
         if args.full_analysis:
             print("\n=== ПОЛНЫЙ АНАЛИЗ СИСТЕМЫ ===")
-            analyzer.analyze_reliability(args.reliability_hours)
-            analyzer.run_simulation(args.duration)
-            analyzer.run_stress_tests(args.duration)
-            analyzer.run_whatif_analysis()
-        else:
-            # Отдельные виды анализа
-            if args.reliability:
-                analyzer.analyze_reliability(args.reliability_hours)
-            
-            if args.simulation:
-                analyzer.run_simulation(args.duration)
-            
-            if args.stress_tests:
-                analyzer.run_stress_tests(args.duration)
-            
-            if args.whatif_analysis:
-                analyzer.run_whatif_analysis()
+        for flag, run_stage in stages:
+            if args.full_analysis or getattr(args, flag):
+                run_stage()
         
         # Экспортируем результаты
-        analyzer.export_results(args.export)
+        analyzer.export_results(args.export, args.export_format)
         
         # Выводим резюме
         analyzer.print_summary()
         
     except Exception as e:
         print(f"Ошибка при выполнении анализа: {e}")
-        import traceback
         traceback.print_exc()
         return 1
     
     return 0
 
 
+@lru_cache(maxsize=4)
+def _load_config(path, mtime_ns):
+    """Читает файл конфигурации
+    
+    Время изменения файла входит в ключ кэша: файл разбирается заново только
+    после его изменения. Возвращаемый словарь общий для всех вызовов.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+_GUI_BANNER = """\
+=== ИКС АНАЛИЗАТОР СИСТЕМЫ ===
+Система мониторинга и анализа информационно-коммуникационных сетей
+в неблагоприятных условиях с использованием передовых технологий
+и современного интерфейса для профессионального анализа
+
+Цветовая схема:
+• Темно-красный (#8B0000) - основной цвет интерфейса
+• Кримсон (#DC143C) - вторичный красный
+• Золотой (#DAA520) - акцентный цвет
+• Черный (#1C1C1C) - базовый фон
+
+Особенности интерфейса:
+• Современная эстетика с ASCII-рамками
+• Темная цветовая схема для снижения усталости глаз
+• Высококонтрастные элементы управления
+• Стилизованные графики и визуализации
+
+"""
+
+
 def run_gui_mode():
     """Запуск в режиме графического интерфейса"""
-    print("=== ИКС АНАЛИЗАТОР СИСТЕМЫ ===")
-    print("Система мониторинга и анализа информационно-коммуникационных сетей")
-    print("в неблагоприятных условиях с использованием передовых технологий")
-    print("и современного интерфейса для профессионального анализа")
-    print()
-    print("Цветовая схема:")
-    print("• Темно-красный (#8B0000) - основной цвет интерфейса")
-    print("• Кримсон (#DC143C) - вторичный красный")
-    print("• Золотой (#DAA520) - акцентный цвет")
-    print("• Черный (#1C1C1C) - базовый фон")
-    print()
-    print("Особенности интерфейса:")
-    print("• Современная эстетика с ASCII-рамками")
-    print("• Темная цветовая схема для снижения усталости глаз")
-    print("• Высококонтрастные элементы управления")
-    print("• Стилизованные графики и визуализации")
-    print()
+    sys.stdout.write(_GUI_BANNER)
     
     # Создание главного окна
     root = tk.Tk()
@@ -2219,9 +3061,7 @@ def run_gui_mode():
     # Загрузка конфигурации
     config_path = 'config.json'
     if os.path.exists(config_path):
-        import json
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = _load_config(config_path, os.stat(config_path).st_mtime_ns)
     else:
         # Базовая конфигурация по умолчанию
         config = {
@@ -2230,6 +3070,8 @@ def run_gui_mode():
             "adverse_conditions": {"noise_level": 0.1, "interference_probability": 0.05, "failure_rate": 0.02}
         }
     
+    from src.gui.main_window import MainWindow as NewMainWindow
+    
     # Создание главного окна приложения с пагинацией
     app = NewMainWindow(root, config)
     
@@ -7,6 +7,8 @@
 
 import sys
 import os
+import heapq
+from operator import itemgetter
 import numpy as np
 import pandas as pd
 from typing import Dict, List
@@ -36,14 +38,15 @@ def demonstrate_birnbaum_analysis():
     print("\nКоэффициенты значимости Бирнбаума:")
     print("-" * 50)
     
-    # Сортируем по убыванию значимости
-    sorted_coeffs = sorted(birnbaum_coeffs.items(), key=lambda x: x[1], reverse=True)
+    # Сортируем по убыванию значимости (уровни критичности - одним вызовом)
+    nodes = list(birnbaum_coeffs)
+    coeffs = np.fromiter(birnbaum_coeffs.values(), np.float64, len(nodes))
+    criticality_levels = analyzer._get_criticality_levels(coeffs)
     
-    for i, (node, coeff) in enumerate(sorted_coeffs, 1):
-        criticality = analyzer._get_criticality_level(coeff)
-        print(f"{i:2d}. {node:12s}: {coeff:8.4f} ({criticality})")
+    for i, index in enumerate(np.argsort(-coeffs, kind='stable'), 1):
+        print(f"{i:2d}. {nodes[index]:12s}: {coeffs[index]:8.4f} ({criticality_levels[index]})")
     
-    print(f"\nОбщая сумма коэффициентов: {sum(birnbaum_coeffs.values()):.4f}")
+    print(f"\nОбщая сумма коэффициентов: {coeffs.sum():.4f}")
     
     return birnbaum_coeffs
 
@@ -68,8 +71,7 @@ def demonstrate_probability_theory():
     
     print("\nВероятности отказа отдельных узлов:")
     print("-" * 50)
-    for node, prob in failure_probs.items():
-        print(f"{node:12s}: {prob:8.4f}")
+    print("\n".join(f"{node:12s}: {prob:8.4f}" for node, prob in failure_probs.items()))
     
     # Распределение вероятностей состояний
     state_distribution = analyzer.calculate_probability_distribution(probabilities)
@@ -77,12 +79,12 @@ def demonstrate_probability_theory():
     print(f"\nРаспределение вероятностей состояний:")
     print(f"Всего возможных состояний: {len(state_distribution)}")
     
-    # Показываем наиболее вероятные состояния
-    sorted_states = sorted(state_distribution.items(), key=lambda x: x[1], reverse=True)
+    # Показываем наиболее вероятные состояния (без сортировки всех 2^n состояний)
+    top_states = heapq.nlargest(5, state_distribution.items(), key=itemgetter(1))
     
     print("\nТоп-5 наиболее вероятных состояний:")
     print("-" * 50)
-    for i, (state, prob) in enumerate(sorted_states[:5], 1):
+    for i, (state, prob) in enumerate(top_states, 1):
         print(f"{i}. {prob:.6f} - {state}")
     
     return {
@@ -101,21 +103,23 @@ def demonstrate_durbin_watson_test():
     analyzer = AdvancedReliabilityAnalyzer()
     
     # Генерируем различные типы остатков для демонстрации
-    np.random.seed(42)
+    # (один генератор, каждый ряд - одним вызовом)
+    rng = np.random.default_rng(42)
+    steps = np.arange(25)
     
     test_cases = [
-        ("Остатки без автокорреляции", np.random.normal(0, 1, 25)),
+        ("Остатки без автокорреляции", rng.normal(0, 1, 25)),
         ("Остатки с положительной автокорреляцией", 
-         np.array([0.5 * i + np.random.normal(0, 0.5) for i in range(25)])),
+         0.5 * steps + rng.normal(0, 0.5, 25)),
         ("Остатки с отрицательной автокорреляцией",
-         np.array([(-1)**i * 0.3 + np.random.normal(0, 1) for i in range(25)]))
+         (-1) ** steps * 0.3 + rng.normal(0, 1, 25))
     ]
     
     for case_name, residuals in test_cases:
         print(f"\n{case_name}:")
         print("-" * 40)
         
-        dw_stat, interpretation = analyzer.durbin_watson_test(residuals.tolist())
+        dw_stat, interpretation = analyzer.durbin_watson_test(residuals)
         
         print(f"Статистика Дарбина-Уотсона: {dw_stat:.4f}")
         print(f"Интерпретация: {interpretation}")
@@ -137,17 +141,25 @@ def demonstrate_fragility_assessment():
     print(f"Критический порог системы: {CRITICAL_NODE_THRESHOLD} узлов")
     print(f"Исходное количество узлов: {len(network_structure['nodes'])}")
     
-    # Рассчитываем исходную надежность системы
-    connections = analyzer._get_connections_from_matrix()
-    initial_reliability = analyzer.system_reliability(probabilities, connections)
+    # Узлы системы - маска над массивом вероятностей: удаление узла
+    # сбрасывает элемент маски
+    node_names = list(probabilities)
+    probability_array = np.fromiter(probabilities.values(), np.float64, len(node_names))
+    alive = np.ones(len(node_names), dtype=bool)
+    
+    # Рассчитываем исходную надежность системы (связи анализатора, как в
+    # _get_connections_from_matrix)
+    initial_reliability = analyzer.system_reliability_masked(probability_array, alive,
+                                                             analyzer.structure_matrix)
     print(f"Исходная надежность системы: {initial_reliability:.6f}")
     
     # Пошаговое удаление узлов
     print("\nПошаговое удаление узлов:")
     print("-" * 50)
     
-    current_network = network_structure.copy()
-    current_probabilities = probabilities.copy()
+    # remove_nodes возвращает новую структуру, не изменяя переданную,
+    # поэтому исходная сеть не копируется
+    current_network = network_structure
     removal_order = ['switch1', 'switch2', 'router1', 'router2', 'server1']
     
     for i, node_to_remove in enumerate(removal_order, 1):
@@ -156,18 +168,18 @@ def demonstrate_fragility_assessment():
         # Удаляем узел из сети
         current_network = analyzer.remove_nodes(current_network, [node_to_remove])
         
-        # Удаляем узел из вероятностей
-        if node_to_remove in current_probabilities:
-            del current_probabilities[node_to_remove]
+        # Исключаем узел из маски
+        if node_to_remove in node_names:
+            alive[node_names.index(node_to_remove)] = False
         
         # Проверяем критический порог
         is_critical, message = analyzer.check_critical_threshold(current_network)
         print(f"  {message}")
         
         # Рассчитываем новую надежность системы
-        if len(current_probabilities) > 0:
-            new_connections = analyzer._get_connections_from_matrix()
-            new_reliability = analyzer.system_reliability(current_probabilities, new_connections)
+        if alive.any():
+            new_reliability = analyzer.system_reliability_masked(probability_array, alive,
+                                                                 analyzer.structure_matrix)
             reliability_change = new_reliability - initial_reliability
             
             print(f"  Надежность системы: {new_reliability:.6f}")
@@ -194,16 +206,16 @@ def demonstrate_external_events():
     print("- Случайный отказ оборудования (вероятность: 15%, отказ: 20%)")
     
     # Исходные вероятности отказов
-    initial_failure_probs = analyzer.calculate_node_failure_probabilities(probabilities)
+    initial_failure_probs = pd.Series(analyzer.calculate_node_failure_probabilities(probabilities))
     print(f"\nИсходные вероятности отказов узлов:")
-    for node, prob in initial_failure_probs.items():
-        print(f"  {node:12s}: {prob:.4f}")
+    print("\n".join(f"  {node:12s}: {prob:.4f}" for node, prob in initial_failure_probs.items()))
     
     # Симулируем несколько раундов внешних воздействий
     print(f"\nСимуляция внешних воздействий:")
     print("-" * 50)
     
-    current_network = network_structure.copy()
+    # Каждый раунд получает новую структуру от simulate_external_events
+    current_network = network_structure
     
     for round_num in range(1, 4):
         print(f"\nРаунд {round_num}:")
@@ -223,14 +235,21 @@ def demonstrate_external_events():
         # Показываем обновленные вероятности отказов
         if 'node_failure_probabilities' in current_network:
             print("  Обновленные вероятности отказов:")
-            for node, prob in current_network['node_failure_probabilities'].items():
-                initial_prob = initial_failure_probs.get(node, 0)
-                change = prob - initial_prob
-                print(f"    {node:12s}: {prob:.4f} ({change:+.4f})")
+            # Изменения рассчитываются для всех узлов одной операцией
+            updated_probs = pd.Series(current_network['node_failure_probabilities'], dtype=np.float64)
+            changes = updated_probs - initial_failure_probs.reindex(updated_probs.index, fill_value=0)
+            if not updated_probs.empty:
+                print("\n".join(f"    {node:12s}: {prob:.4f} ({change:+.4f})"
+                                for node, prob, change in zip(updated_probs.index, updated_probs.tolist(),
+                                                              changes.tolist())))
 
 
-def generate_comprehensive_report():
-    """Генерация комплексного отчета"""
+def generate_comprehensive_report(birnbaum_coeffs=None):
+    """Генерация комплексного отчета
+    
+    birnbaum_coeffs - коэффициенты Бирнбаума, уже рассчитанные для примерной сети
+    (если не заданы, рассчитываются заново).
+    """
     print("\n" + "=" * 60)
     print("КОМПЛЕКСНЫЙ ОТЧЕТ ПО НАДЕЖНОСТИ")
     print("=" * 60)
@@ -239,7 +258,7 @@ def generate_comprehensive_report():
     probabilities, structure_matrix, network_structure = create_sample_network()
     
     # Генерируем подробный отчет
-    report = analyzer.generate_reliability_report(probabilities, structure_matrix)
+    report = analyzer.generate_reliability_report(probabilities, structure_matrix, birnbaum_coeffs)
     
     print("\nДетальный отчет по надежности:")
     print("-" * 80)
@@ -252,10 +271,8 @@ def generate_comprehensive_report():
     print(f"  Минимальная надежность: {min(probabilities.values()):.4f}")
     print(f"  Максимальная надежность: {max(probabilities.values()):.4f}")
     
-    # Анализ критичности
-    birnbaum_coeffs = analyzer.calculate_birnbaum_criterion(probabilities, structure_matrix)
-    critical_nodes = [node for node, coeff in birnbaum_coeffs.items() 
-                     if analyzer._get_criticality_level(coeff) == 'КРИТИЧЕСКИЙ']
+    # Анализ критичности (уровни уже определены в отчете)
+    critical_nodes = report.loc[report['criticality_level'] == 'КРИТИЧЕСКИЙ', 'node_id'].tolist()
     
     print(f"\nКритически важные узлы: {critical_nodes}")
     
@@ -284,7 +301,7 @@ def main():
         demonstrate_external_events()
         
         # 6. Комплексный отчет
-        comprehensive_report = generate_comprehensive_report()
+        comprehensive_report = generate_comprehensive_report(birnbaum_results)
         
         print("\n" + "=" * 80)
         print("ДЕМОНСТРАЦИЯ ЗАВЕРШЕНА УСПЕШНО")
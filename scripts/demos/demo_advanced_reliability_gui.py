@@ -7,8 +7,8 @@
 
 import sys
 import os
+from functools import lru_cache
 import numpy as np
-import matplotlib.pyplot as plt
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QMenuBar, QAction
 from PyQt5.QtCore import Qt
 
@@ -22,10 +22,23 @@ from src.gui.advanced_reliability_panel import (
     ExternalThreatsModule,
     NetworkVisualizationWidget,
     BirnbaumVisualizationWidget,
-    ACFVisualizationWidget
+    ACFVisualizationWidget,
+    BIRNBAUM_COLOR_BINS,
+    BIRNBAUM_BAR_COLORS
 )
 
 
+@lru_cache(maxsize=1)
+def _sample_network():
+    """
+    Пример сети с состояниями узлов, общий для всех окон и консольного режима.
+    
+    Строится один раз на процесс; панель анализа копирует структуры перед
+    изменением, поэтому общий экземпляр не портится.
+    """
+    return create_sample_network_with_states()
+
+
 class MainWindow(QMainWindow):
     """Главное окно приложения"""
     
@@ -46,7 +59,7 @@ class MainWindow(QMainWindow):
         self.analysis_panel = AdvancedReliabilityPanel()
         
         # Загружаем пример данных
-        network, probabilities, node_states = create_sample_network_with_states()
+        network, probabilities, node_states = _sample_network()
         self.analysis_panel.set_network_data(network, probabilities)
         
         # Размещаем панель
@@ -58,7 +71,7 @@ class MainWindow(QMainWindow):
         self.create_menu()
         
         # Запускаем начальный анализ
-        self.analysis_panel.run_analysis()
+        self.analysis_panel.refresh()
     
     def create_menu(self):
         """Создает меню приложения"""
@@ -109,13 +122,16 @@ class MainWindow(QMainWindow):
     
     def new_analysis(self):
         """Создает новый анализ"""
-        self.analysis_panel.clear_results()
-        self.analysis_panel.run_analysis()
+        # Таблица и графики перезаписываются на месте, без предварительной очистки;
+        # сбрасываются только результаты хрупкости и внешних угроз
+        self.analysis_panel.fragility_results.clear()
+        self.analysis_panel.reset_threats()
+        self.analysis_panel.refresh(force=True)
     
     def run_birnbaum_analysis(self):
         """Запускает анализ по критерию Бирнбаума"""
         self.analysis_panel.tab_widget.setCurrentIndex(0)  # Вкладка анализа
-        self.analysis_panel.run_analysis()
+        self.analysis_panel.refresh()
     
     def run_fragility_analysis(self):
         """Запускает анализ хрупкости"""
@@ -145,7 +161,7 @@ def demonstrate_console_analysis():
     print("=" * 80)
     
     # Создаем пример сети
-    network, probabilities, node_states = create_sample_network_with_states()
+    network, probabilities, node_states = _sample_network()
     
     print("\n1. Инициализация тестовой сети:")
     print(f"   Узлы: {list(probabilities.keys())}")
@@ -162,17 +178,20 @@ def demonstrate_console_analysis():
         network, probabilities, removal_order
     )
     
+    # Строки раздела собираются и выводятся одной записью
+    lines = []
     for i, state in enumerate(states):
-        print(f"Шаг {i+1}:")
-        print(f"  Количество узлов: {len(state.node_states)}")
-        print(f"  Надежность системы: {state.system_reliability:.6f}")
-        print(f"  Связность: {'Да' if state.connectivity_status else 'Нет'}")
+        lines.append(f"Шаг {i+1}:")
+        lines.append(f"  Количество узлов: {len(state.node_states)}")
+        lines.append(f"  Надежность системы: {state.system_reliability:.6f}")
+        lines.append(f"  Связность: {'Да' if state.connectivity_status else 'Нет'}")
         
         if state.critical_threshold_reached:
-            print("  ⚠️ КРИТИЧЕСКИЙ ПОРОГ ДОСТИГНУТ!")
-            print("  Система перестает функционировать.")
+            lines.append("  ⚠️ КРИТИЧЕСКИЙ ПОРОГ ДОСТИГНУТ!")
+            lines.append("  Система перестает функционировать.")
             break
-        print()
+        lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Демонстрация внешних угроз
     print("\n3. Моделирование внешних угроз:")
@@ -180,27 +199,28 @@ def demonstrate_console_analysis():
     
     threats_module = ExternalThreatsModule()
     
-    # Симулируем несколько раундов угроз
-    for round_num in range(1, 4):
-        print(f"Раунд {round_num}:")
-        
-        updated_probs, events = threats_module.simulate_threats(network, probabilities)
+    # Симулируем несколько раундов угроз (все раунды разыгрываются одним вызовом)
+    rounds_probs, rounds_events = threats_module.simulate_threats_batch(network, probabilities, 3)
+    
+    lines = []
+    for round_num, (round_probs, events) in enumerate(zip(rounds_probs, rounds_events), 1):
+        lines.append(f"Раунд {round_num}:")
         
         if events:
-            print("  Произошедшие события:")
+            lines.append("  Произошедшие события:")
             for event in events:
-                print(f"    - {event['description']}")
-                print(f"      Тип: {event['type']}")
-                print(f"      Воздействие: {event['impact']:.2f}")
+                lines.append(f"    - {event['description']}")
+                lines.append(f"      Тип: {event['type']}")
+                lines.append(f"      Воздействие: {event['impact']:.2f}")
         else:
-            print("  Внешние события не произошли")
+            lines.append("  Внешние события не произошли")
         
-        print("  Обновленные вероятности:")
-        for node, prob in updated_probs.items():
-            original_prob = probabilities[node]
+        lines.append("  Обновленные вероятности:")
+        for (node, original_prob), prob in zip(probabilities.items(), round_probs):
             change = prob - original_prob
-            print(f"    {node}: {prob:.4f} ({change:+.4f})")
-        print()
+            lines.append(f"    {node}: {prob:.4f} ({change:+.4f})")
+        lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Демонстрация визуализации
     print("\n4. Создание графиков:")
@@ -223,35 +243,26 @@ def demonstrate_console_analysis():
         
         birnbaum_coeffs = analyzer.calculate_birnbaum_criterion(probabilities, structure_matrix)
         
-        print("Коэффициенты значимости Бирнбаума:")
-        for node, coeff in sorted(birnbaum_coeffs.items(), key=lambda x: x[1], reverse=True):
-            if coeff >= 0.5:
-                criticality = "КРИТИЧЕСКИЙ"
-            elif coeff >= 0.2:
-                criticality = "ВЫСОКИЙ"
-            elif coeff >= 0.1:
-                criticality = "СРЕДНИЙ"
-            else:
-                criticality = "НИЗКИЙ"
-            
-            print(f"  {node:12s}: {coeff:8.4f} ({criticality})")
+        nodes = list(birnbaum_coeffs.keys())
+        values = np.fromiter(birnbaum_coeffs.values(), np.float64, len(nodes))
+        
+        # Уровни критичности и цвета столбцов - для всех узлов одним вызовом
+        criticality_levels = analyzer._get_criticality_levels(values)
+        colors = BIRNBAUM_BAR_COLORS[np.searchsorted(BIRNBAUM_COLOR_BINS, values, side='right')].tolist()
+        
+        lines = ["Коэффициенты значимости Бирнбаума:"]
+        lines.extend(f"  {nodes[index]:12s}: {values[index]:8.4f} ({criticality_levels[index]})"
+                     for index in np.argsort(-values, kind='stable'))
+        sys.stdout.write("\n".join(lines) + "\n")
+        
+        # pyplot нужен только здесь: импортируем его с бэкендом Agg (файл без окна),
+        # чтобы GUI-режим и печать результатов не платили за загрузку pyplot
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
         
         # Создаем график
         plt.figure(figsize=(10, 6))
-        nodes = list(birnbaum_coeffs.keys())
-        values = list(birnbaum_coeffs.values())
-        
-        colors = []
-        for value in values:
-            if value >= 0.5:
-                colors.append('#8B0000')  # Темно-красный
-            elif value >= 0.2:
-                colors.append('#DC143C')  # Красный
-            elif value >= 0.1:
-                colors.append('#FFD700')  # Золотой
-            else:
-                colors.append('#2E8B57')  # Зеленый
-        
         bars = plt.bar(range(len(nodes)), values, color=colors, alpha=0.8)
         plt.xlabel('Узлы системы')
         plt.ylabel('Коэффициент значимости Бирнбаума')
@@ -291,7 +302,8 @@ def main():
         demonstrate_console_analysis()
     else:
         # GUI режим
-        app = QApplication(sys.argv)
+        # Приложение может быть уже создано, если демонстрация запущена из другого Qt-кода
+        app = QApplication.instance() or QApplication(sys.argv)
         
         # Создаем главное окно
         window = MainWindow()
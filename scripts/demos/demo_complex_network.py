@@ -5,11 +5,13 @@
 
 import os
 import sys
+import numpy as np
 
 # Добавляем путь к модулям
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.storage.network_storage import NetworkStorage
+from src.utils.graph_csr import network_to_csr, reachable_csr
 
 def create_complex_network():
     """Создает более сложную сеть для демонстрации"""
@@ -54,33 +56,33 @@ def create_complex_network():
     print("Структура сложной сети:")
     print("-" * 30)
     
-    # Группируем узлы по типам
-    server_nodes = [node for node in complex_network.keys() if 'server' in node]
-    router_nodes = [node for node in complex_network.keys() if 'router' in node]
-    client_nodes = [node for node in complex_network.keys() if 'client' in node]
-    other_nodes = [node for node in complex_network.keys() 
-                   if node not in server_nodes and node not in router_nodes and node not in client_nodes]
-    
-    print(f"Серверы ({len(server_nodes)}):")
-    for node in server_nodes:
-        connections = complex_network[node]
-        print(f"  {node}: {len(connections)} связей -> {', '.join(connections) if connections else 'нет'}")
-    
-    print(f"\nМаршрутизаторы ({len(router_nodes)}):")
-    for node in router_nodes:
-        connections = complex_network[node]
-        print(f"  {node}: {len(connections)} связей -> {', '.join(connections) if connections else 'нет'}")
-    
-    print(f"\nКлиентские станции ({len(client_nodes)}):")
-    for node in client_nodes:
-        connections = complex_network[node]
-        print(f"  {node}: {len(connections)} связей -> {', '.join(connections) if connections else 'нет'}")
-    
+    # Группируем узлы по типам за один проход
+    server_nodes, router_nodes, client_nodes, other_nodes = [], [], [], []
+    for node in complex_network:
+        if 'server' in node:
+            server_nodes.append(node)
+        elif 'router' in node:
+            router_nodes.append(node)
+        elif 'client' in node:
+            client_nodes.append(node)
+        else:
+            other_nodes.append(node)
+    
+    groups = [("Серверы", server_nodes), ("Маршрутизаторы", router_nodes),
+              ("Клиентские станции", client_nodes)]
     if other_nodes:
-        print(f"\nДругие узлы ({len(other_nodes)}):")
-        for node in other_nodes:
+        groups.append(("Другие узлы", other_nodes))
+    
+    # Строки всех групп собираются и выводятся одной записью
+    lines = []
+    for title, group in groups:
+        if lines:
+            lines.append("")
+        lines.append(f"{title} ({len(group)}):")
+        for node in group:
             connections = complex_network[node]
-            print(f"  {node}: {len(connections)} связей -> {', '.join(connections) if connections else 'нет'}")
+            lines.append(f"  {node}: {len(connections)} связей -> {', '.join(connections) if connections else 'нет'}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return complex_network
 
@@ -88,62 +90,53 @@ def create_complex_network():
 def analyze_network_topology(network):
     """Анализирует топологию сети"""
     
-    print(f"\n\nАнализ топологии сети")
-    print("=" * 30)
+    # Отчет собирается построчно и выводится одной записью в конце
+    lines = ["\n\nАнализ топологии сети", "=" * 30]
     
-    # Подсчитываем статистику
-    total_nodes = len(network)
-    total_connections = sum(len(connections) for connections in network.values())
+    # Вся статистика считается по массивам CSR, а не по спискам Python
+    names, indptr, indices = network_to_csr(network)
+    node_names = np.array(names)
+    total_nodes = len(names)
+    degrees = np.diff(indptr)
+    total_connections = int(indptr[-1])
     
     # Находим узлы с наибольшим количеством связей
-    max_connections = max(len(connections) for connections in network.values())
-    hub_nodes = [node for node, connections in network.items() if len(connections) == max_connections]
+    max_connections = int(degrees.max())
+    hub_nodes = node_names[degrees == max_connections].tolist()
     
     # Находим изолированные узлы
-    isolated_nodes = [node for node, connections in network.items() if len(connections) == 0]
+    isolated_nodes = node_names[degrees == 0].tolist()
     
     # Находим узлы с одной связью (концевые узлы)
-    end_nodes = [node for node, connections in network.items() if len(connections) == 1]
+    end_nodes = node_names[degrees == 1].tolist()
     
-    print(f"Общая статистика:")
-    print(f"  Всего узлов: {total_nodes}")
-    print(f"  Всего связей: {total_connections}")
-    print(f"  Среднее количество связей на узел: {total_connections/total_nodes:.2f}")
+    lines.append("Общая статистика:")
+    lines.append(f"  Всего узлов: {total_nodes}")
+    lines.append(f"  Всего связей: {total_connections}")
+    lines.append(f"  Среднее количество связей на узел: {total_connections/total_nodes:.2f}")
     
-    print(f"\nАнализ узлов:")
-    print(f"  Центральные узлы (макс. связей): {', '.join(hub_nodes)} ({max_connections} связей)")
-    print(f"  Изолированные узлы: {', '.join(isolated_nodes) if isolated_nodes else 'нет'}")
-    print(f"  Концевые узлы: {', '.join(end_nodes) if end_nodes else 'нет'}")
+    lines.append("\nАнализ узлов:")
+    lines.append(f"  Центральные узлы (макс. связей): {', '.join(hub_nodes)} ({max_connections} связей)")
+    lines.append(f"  Изолированные узлы: {', '.join(isolated_nodes) if isolated_nodes else 'нет'}")
+    lines.append(f"  Концевые узлы: {', '.join(end_nodes) if end_nodes else 'нет'}")
     
     # Анализ связности
-    print(f"\nАнализ связности:")
-    
-    # Проверяем, есть ли пути между всеми узлами
-    def find_path(start, end, visited=None):
-        if visited is None:
-            visited = set()
-        if start == end:
-            return True
-        visited.add(start)
-        for neighbor in network[start]:
-            if neighbor not in visited:
-                if find_path(neighbor, end, visited.copy()):
-                    return True
-        return False
-    
-    # Проверяем связность для нескольких пар узлов
-    nodes = list(network.keys())
+    lines.append("\nАнализ связности:")
+    
+    # Проверяем связность для пар из первых 5 узлов: один обход в ширину
+    # от каждого источника дает достижимость сразу всех узлов
+    checked = min(5, total_nodes)
     connected_pairs = 0
     total_pairs = 0
     
-    for i in range(min(5, len(network))):  # Проверяем первые 5 узлов
-        for j in range(i+1, min(5, len(network))):
-            total_pairs += 1
-            if find_path(nodes[i], nodes[j]):
-                connected_pairs += 1
+    for i in range(checked):
+        reachable = reachable_csr(indptr, indices, i)
+        total_pairs += checked - i - 1
+        connected_pairs += int(reachable[i + 1:checked].sum())
     
     connectivity_ratio = connected_pairs / total_pairs if total_pairs > 0 else 0
-    print(f"  Коэффициент связности: {connectivity_ratio:.2f}")
+    lines.append(f"  Коэффициент связности: {connectivity_ratio:.2f}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demonstrate_file_operations():
@@ -182,8 +175,8 @@ def demonstrate_file_operations():
         if loaded_network:
             print("Сеть загружена успешно")
             
-            # Проверяем целостность
-            if loaded_network == complex_network:
+            # Проверяем целостность по хешу файла, без сравнения словарей
+            if storage.verify_network('complex_enterprise_network', complex_network):
                 print("Данные сохранены и загружены без изменений")
             else:
                 print("ВНИМАНИЕ: Данные изменились при сохранении/загрузке")
@@ -197,13 +190,17 @@ def demonstrate_file_operations():
         if export_success:
             print("Экспорт выполнен успешно")
             
-            # Показываем размеры файлов
-            db_file = 'complex_networks/complex_enterprise_network.db'
-            txt_file = 'complex_networks/complex_enterprise_network.txt'
+            # Показываем размеры файлов: один проход по каталогу вместо
+            # пар exists + getsize для каждого файла
+            db_file = 'complex_enterprise_network.db'
+            txt_file = 'complex_enterprise_network.txt'
+            with os.scandir('complex_networks') as entries:
+                file_sizes = {entry.name: entry.stat().st_size for entry in entries
+                              if entry.name in (db_file, txt_file)}
             
-            if os.path.exists(db_file) and os.path.exists(txt_file):
-                db_size = os.path.getsize(db_file)
-                txt_size = os.path.getsize(txt_file)
+            if len(file_sizes) == 2:
+                db_size = file_sizes[db_file]
+                txt_size = file_sizes[txt_file]
                 print(f"Размер .db файла: {db_size} байт")
                 print(f"Размер .txt файла: {txt_size} байт")
                 print(f"Коэффициент сжатия: {txt_size/db_size:.2f}x")
@@ -4,7 +4,9 @@
 """
 
 import os
+import shutil
 import sys
+import numpy as np
 
 # Добавляем путь к модулям
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -29,12 +31,14 @@ def demonstrate_db_storage():
         'router2': ['server3']              # router2 связан только с server3
     }
     
-    print("Исходная структура сети:")
+    # Списки узлов выводятся одной записью, а не строкой на узел
+    lines = ["Исходная структура сети:"]
     for node, connections in test_network.items():
         if connections:
-            print(f"  {node} связан с: {', '.join(connections)}")
+            lines.append(f"  {node} связан с: {', '.join(connections)}")
         else:
-            print(f"  {node} не имеет исходящих связей")
+            lines.append(f"  {node} не имеет исходящих связей")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Сохраняем сеть
     print(f"\nСохранение сети в файл demo_network.db...")
@@ -55,28 +59,30 @@ def demonstrate_db_storage():
         
         if loaded_network:
             print("Данные загружены успешно")
-            print("\nСодержимое файла demo_network.db:")
-            print("-" * 40)
+            lines = ["\nСодержимое файла demo_network.db:", "-" * 40]
             for node, connections in loaded_network.items():
                 if connections:
-                    print(f"{node} связан с: {', '.join(connections)}")
+                    lines.append(f"{node} связан с: {', '.join(connections)}")
                 else:
-                    print(f"{node} не имеет исходящих связей")
+                    lines.append(f"{node} не имеет исходящих связей")
+            sys.stdout.write("\n".join(lines) + "\n")
             
             # Показываем статистику связей
             print(f"\nСтатистика связей:")
             print("-" * 25)
-            total_connections = sum(len(connections) for connections in loaded_network.values())
+            # Число связей каждого узла считается один раз для всей статистики
+            degrees = np.fromiter(map(len, loaded_network.values()), np.int64, len(loaded_network))
             print(f"Всего узлов: {len(loaded_network)}")
-            print(f"Всего связей: {total_connections}")
+            print(f"Всего связей: {int(degrees.sum())}")
             
-            print(f"\nДетальная статистика по узлам:")
-            for node, connections in loaded_network.items():
-                print(f"  {node}: {len(connections)} исходящих связей")
+            lines = ["\nДетальная статистика по узлам:"]
+            lines.extend(f"  {node}: {degree} исходящих связей"
+                         for node, degree in zip(loaded_network, degrees))
+            sys.stdout.write("\n".join(lines) + "\n")
             
-            # Проверяем, что данные идентичны
+            # Проверяем, что данные идентичны (по хешу файла, без сравнения словарей)
             print(f"\nПроверка целостности данных:")
-            if loaded_network == test_network:
+            if storage.verify_network('demo_network', test_network):
                 print("Данные сохранены и загружены без изменений")
             else:
                 print("Данные изменились при сохранении/загрузке")
@@ -96,8 +102,10 @@ def demonstrate_db_storage():
         if os.path.exists(txt_file):
             print(f"\nСодержимое текстового файла:")
             print("-" * 30)
+            # Файл копируется в консоль блоками, а не читается целиком в память
             with open(txt_file, 'r', encoding='utf-8') as f:
-                print(f.read())
+                shutil.copyfileobj(f, sys.stdout)
+            print()
     else:
         print("Не удалось экспортировать в текст")
     
@@ -111,12 +119,16 @@ def show_file_structure():
     print(f"\nСтруктура файлов в директории demo_networks:")
     print("-" * 45)
     
-    if os.path.exists('demo_networks'):
-        for filename in os.listdir('demo_networks'):
-            file_path = os.path.join('demo_networks', filename)
-            file_size = os.path.getsize(file_path)
-            print(f"{filename} - {file_size} байт")
-    else:
+    # scandir отдает записи каталога вместе с их stat, без отдельного
+    # getsize по пути для каждого файла
+    try:
+        with os.scandir('demo_networks') as entries:
+            # Скрытые служебные записи (хеши хранилища) не показываются
+            lines = [f"{entry.name} - {entry.stat().st_size} байт" for entry in entries
+                     if not entry.name.startswith('.')]
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+    except FileNotFoundError:
         print("Директория demo_networks не найдена")
 
 
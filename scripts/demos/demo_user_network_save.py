@@ -4,6 +4,7 @@
 """
 
 import os
+import shutil
 import sys
 
 # Добавляем путь к модулям
@@ -175,8 +176,10 @@ def save_user_network():
             if os.path.exists(txt_file):
                 print(f"\nСодержимое текстового файла:")
                 print("-" * 30)
+                # Файл копируется в консоль блоками, а не читается целиком в память
                 with open(txt_file, 'r', encoding='utf-8') as f:
-                    print(f.read())
+                    shutil.copyfileobj(f, sys.stdout)
+                print()
     
     else:
         print("Ошибка при сохранении сети")
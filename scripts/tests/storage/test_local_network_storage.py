@@ -3,6 +3,7 @@
 test_local_network_storage.py - тестирование NetworkStorage
 """
 
+import json
 import os
 import sys
 import logging
@@ -175,6 +176,48 @@ def test_edge_cases():
     print("\n✅ Тестирование граничных случаев завершено!")
 
 
+def test_verify_network():
+    """Тестирует проверку целостности файла сети по хешу"""
+    
+    print("\n🔐 Тестирование проверки целостности")
+    print("=" * 50)
+    
+    storage = NetworkStorage("test_verify")
+    network = {'a': ['b', 'c'], 'b': ['c'], 'c': []}
+    
+    try:
+        storage.save_network("verify_network", network)
+        
+        matches = storage.verify_network("verify_network", network)
+        print(f"Совпадение с сохраненными данными: {'✅ Да' if matches else '❌ Нет'}")
+        assert matches
+        
+        changed = storage.verify_network("verify_network", {'a': ['b'], 'b': ['c'], 'c': []})
+        print(f"Совпадение с измененными данными: {'❌ Да' if changed else '✅ Нет'}")
+        assert not changed
+        
+        # Равная сеть с другими объектами строк и другим порядком ключей
+        equal_copy = json.loads(json.dumps(dict(reversed(list(network.items())))))
+        assert storage.verify_network("verify_network", equal_copy)
+        
+        # Общие строки меняют байты pickle, но не канонический хеш
+        shared = {'central server': ['web-01'], 'web-01': ['central server']}
+        storage.save_network("shared_strings", shared)
+        assert storage.verify_network("shared_strings", json.loads(json.dumps(shared)))
+        
+        # Изменение файла .db после сохранения обнаруживается
+        with open(os.path.join("test_verify", "verify_network.db"), 'ab') as f:
+            f.write(b'\0')
+        assert not storage.verify_network("verify_network", network)
+        
+        assert not storage.verify_network("missing_network", network)
+    finally:
+        storage.clear_all_networks()
+        os.rmdir("test_verify")
+    
+    print("\n✅ Тестирование проверки целостности завершено!")
+
+
 def test_performance():
     """Тестирует производительность с большими сетями"""
     
@@ -238,6 +281,9 @@ if __name__ == "__main__":
         # Тестирование граничных случаев
         test_edge_cases()
         
+        # Тестирование проверки целостности
+        test_verify_network()
+        
         # Тестирование производительности
         test_performance()
         
@@ -41,6 +41,14 @@ def test_birnbaum_criterion():
     assert total_coeff > 0, f"Сумма коэффициентов должна быть положительной, получено: {total_coeff}"
     
     print(f"Общая сумма коэффициентов: {total_coeff:.4f}")
+    
+    # Коэффициент - разность надежностей системы при работающем и отказавшем узле
+    connections = analyzer._get_connections_from_matrix()
+    for node, coeff in birnbaum_coeffs.items():
+        with_node = analyzer.system_reliability({**probabilities, node: 1.0}, connections)
+        without_node = analyzer.system_reliability({**probabilities, node: 0.0}, connections)
+        assert abs(coeff - (with_node - without_node)) < 1e-12, f"Неверный коэффициент узла {node}"
+    
     print("ТЕСТ ПРОЙДЕН УСПЕШНО\n")
     
     return birnbaum_coeffs
@@ -70,6 +78,20 @@ def test_system_reliability():
         print(f"  {node}: {prob:.4f}")
         assert 0 <= prob <= 1, f"Вероятность отказа должна быть от 0 до 1, получено: {prob}"
     
+    # Расчет по маске совпадает с расчетом по словарю для подмножеств узлов
+    analyzer.probabilities = probabilities
+    analyzer.structure_matrix = structure_matrix
+    connections = analyzer._get_connections_from_matrix()
+    node_names = list(probabilities)
+    probability_array = np.fromiter(probabilities.values(), np.float64, len(node_names))
+    for removed in ([], ['switch1'], ['switch1', 'router2', 'firewall']):
+        alive = np.array([node not in removed for node in node_names])
+        remaining = {node: prob for node, prob in probabilities.items() if node not in removed}
+        expected = analyzer.system_reliability(remaining, connections)
+        masked = analyzer.system_reliability_masked(probability_array, alive, structure_matrix)
+        print(f"Без узлов {removed}: {masked:.6f}")
+        assert abs(masked - expected) < 1e-12
+    
     print("ТЕСТ ПРОЙДЕН УСПЕШНО\n")
     
     return system_reliability
@@ -86,7 +108,7 @@ def test_durbin_watson():
     np.random.seed(42)
     residuals_no_autocorr = np.random.normal(0, 1, 20)
     
-    dw_stat, interpretation = analyzer.durbin_watson_test(residuals_no_autocorr.tolist())
+    dw_stat, interpretation = analyzer.durbin_watson_test(residuals_no_autocorr)
     
     print(f"Статистика Дарбина-Уотсона: {dw_stat:.4f}")
     print(f"Интерпретация: {interpretation}")
@@ -119,6 +141,17 @@ def test_node_removal():
     remaining_node_ids = [node['id'] for node in updated_network['nodes']]
     assert node_to_remove not in remaining_node_ids, f"Узел {node_to_remove} не был удален"
     
+    # Пример сети общий для всех вызовов и не изменяется при удалении узлов
+    assert create_sample_network()[2] is network_structure
+    assert len(network_structure['nodes']) == len(probabilities)
+    assert not structure_matrix.flags.writeable
+    try:
+        probabilities[node_to_remove] = 0.0
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("Вероятности примера сети доступны для записи")
+    
     # Проверяем критический порог
     is_critical, message = analyzer.check_critical_threshold(updated_network)
     print(f"Проверка критического порога: {message}")
@@ -178,11 +211,47 @@ def test_comprehensive_report():
     for col in required_columns:
         assert col in report.columns, f"Отсутствует колонка: {col}"
     
+    # Готовые коэффициенты Бирнбаума дают тот же отчет
+    birnbaum_coeffs = analyzer.calculate_birnbaum_criterion(probabilities, structure_matrix)
+    reused_report = analyzer.generate_reliability_report(probabilities, structure_matrix, birnbaum_coeffs)
+    assert reused_report.equals(report)
+    
+    # Уровни критичности массивом совпадают с поэлементным определением
+    coefficients = np.array([0.6, 0.5, 0.3, 0.15, 0.1, 0.05, 0.0])
+    levels = analyzer._get_criticality_levels(coefficients).tolist()
+    print(f"Уровни критичности: {levels}")
+    assert levels == [analyzer._get_criticality_level(c) for c in coefficients]
+    
     print("ТЕСТ ПРОЙДЕН УСПЕШНО\n")
     
     return report
 
 
+def test_probability_distribution():
+    """Тест распределения вероятностей состояний системы"""
+    print("Тест 7: Распределение состояний системы")
+    print("-" * 40)
+    
+    analyzer = AdvancedReliabilityAnalyzer()
+    probabilities, structure_matrix, network_structure = create_sample_network()
+    
+    # Полный перебор для малой системы
+    exact = analyzer.calculate_probability_distribution(probabilities)
+    print(f"Состояний (полный перебор): {len(exact)}")
+    assert len(exact) == 2 ** len(probabilities)
+    assert abs(sum(exact.values()) - 1) < 1e-9
+    
+    # Оценка Монте-Карло для большой системы
+    large_probabilities = {f"node{i}": 0.99 for i in range(40)}
+    sampled = analyzer.calculate_probability_distribution(large_probabilities, num_samples=5000, seed=42)
+    all_working = " | ".join(f"{node}:работает" for node in large_probabilities)
+    print(f"Состояний в выборке: {len(sampled)}, все узлы работают: {sampled[all_working]:.4f}")
+    assert abs(sum(sampled.values()) - 1) < 1e-9
+    assert abs(sampled[all_working] - 0.99 ** 40) < 0.05
+    
+    print("ТЕСТ ПРОЙДЕН УСПЕШНО\n")
+
+
 def main():
     """Основная функция тестирования"""
     print("ТЕСТИРОВАНИЕ ФУНКЦИЙ РАСШИРЕННОГО АНАЛИЗА НАДЕЖНОСТИ")
@@ -196,6 +265,7 @@ def main():
         test_node_removal()
         test_external_events()
         test_comprehensive_report()
+        test_probability_distribution()
         
         print("=" * 60)
         print("ВСЕ ТЕСТЫ ПРОЙДЕНЫ УСПЕШНО!")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тест записи листов Excel при экспорте результатов анализа
+"""
+
+import sys
+import os
+import tempfile
+
+# Добавляем путь к модулям
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import numpy as np
+import pandas as pd
+import openpyxl
+
+from main import ICSAnalyzer, _open_excel_writer, _write_sheet
+
+
+def _read_sheet(filename, sheet_name):
+    """Читает значения ячеек листа построчно"""
+    worksheet = openpyxl.load_workbook(filename)[sheet_name]
+    return [[cell.value for cell in row] for row in worksheet.iter_rows()]
+
+
+def test_write_sheet():
+    """Тест: лист совпадает с результатом DataFrame.to_excel"""
+    print("Тест 1: Запись листа")
+    print("-" * 40)
+
+    df = pd.DataFrame({
+        'name': ['узел 1', None, 'узел 3'],
+        'load': [0.5, np.nan, 0.75],
+        'capacity': np.array([100, 200, 300]),
+        'active': [True, False, True],
+    })
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fast_file = os.path.join(tmp_dir, 'fast.xlsx')
+        reference_file = os.path.join(tmp_dir, 'reference.xlsx')
+
+        with _open_excel_writer(fast_file) as writer:
+            print(f"Движок: {writer.engine}")
+            _write_sheet(writer, df, 'Узлы')
+            _write_sheet(writer, df.iloc[:0], 'Пусто')
+        with pd.ExcelWriter(reference_file, engine='openpyxl') as writer:
+            df.to_excel(writer, sheet_name='Узлы', index=False)
+
+        rows = _read_sheet(fast_file, 'Узлы')
+        print(f"Строк на листе: {len(rows)}")
+        assert rows == _read_sheet(reference_file, 'Узлы')
+        assert _read_sheet(fast_file, 'Пусто') == [list(df.columns)]
+
+    print("ТЕСТ ПРОЙДЕН УСПЕШНО\n")
+
+
+def test_export_skips_empty_tables():
+    """Тест: пустые таблицы не попадают в книгу, без таблиц файл не создается"""
+    print("Тест 2: Пропуск пустых таблиц")
+    print("-" * 40)
+
+    analyzer = ICSAnalyzer()
+    analyzer.results = {
+        'simulation': {'events_dataframe': pd.DataFrame(), 'metrics_dataframe': pd.DataFrame()},
+        'stress_test': {'report': pd.DataFrame()},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = os.path.join(tmp_dir, 'results.xlsx')
+
+        analyzer.export_results(filename)
+        assert not os.path.exists(filename)
+
+        analyzer.results['whatif'] = {'report': pd.DataFrame({'scenario': ['base'], 'value': [1.0]})}
+        analyzer.export_results(filename)
+        sheet_names = openpyxl.load_workbook(filename).sheetnames
+        print(f"Листы книги: {sheet_names}")
+        assert sheet_names == ['What-if']
+
+    print("ТЕСТ ПРОЙДЕН УСПЕШНО\n")
+
+
+def main():
+    """Основная функция тестирования"""
+    print("ТЕСТИРОВАНИЕ ЭКСПОРТА В EXCEL")
+    print("=" * 60)
+
+    try:
+        test_write_sheet()
+        test_export_skips_empty_tables()
+
+        print("=" * 60)
+        print("ВСЕ ТЕСТЫ ПРОЙДЕНЫ УСПЕШНО!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\nОШИБКА при тестировании: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
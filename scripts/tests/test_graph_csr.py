@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тест представления сети в формате CSR и обхода в ширину по нему
+"""
+
+import sys
+import os
+import numpy as np
+import networkx as nx
+
+# Добавляем путь к модулям
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.graph_csr import network_to_csr, reachable_csr
+
+
+def test_network_to_csr():
+    """Тест перевода словаря списков в CSR"""
+    print("Тест 1: Перевод сети в CSR")
+    print("-" * 40)
+    
+    network = {'a': ['b', 'c'], 'b': ['c'], 'c': [], 'd': ['a']}
+    names, indptr, indices = network_to_csr(network)
+    
+    print(f"indptr: {indptr.tolist()}, indices: {indices.tolist()}")
+    assert names == ['a', 'b', 'c', 'd']
+    assert indptr.dtype == np.int32 and indices.dtype == np.int32
+    assert np.diff(indptr).tolist() == [2, 1, 0, 1]
+    for i, name in enumerate(names):
+        neighbors = [names[j] for j in indices[indptr[i]:indptr[i + 1]]]
+        assert neighbors == network[name], f"Неверные соседи узла {name}"
+    
+    print("ТЕСТ ПРОЙДЕН УСПЕШНО\n")
+
+
+def test_reachable_csr():
+    """Тест обхода в ширину по CSR против networkx"""
+    print("Тест 2: Достижимость по CSR")
+    print("-" * 40)
+    
+    graph = nx.gnp_random_graph(15, 0.12, seed=5, directed=True)
+    network = {node: list(graph.successors(node)) for node in sorted(graph.nodes)}
+    names, indptr, indices = network_to_csr(network)
+    
+    for start, name in enumerate(names):
+        reachable = reachable_csr(indptr, indices, start)
+        expected = nx.descendants(graph, name) | {name}
+        assert {names[i] for i in np.flatnonzero(reachable)} == expected, \
+            f"Расхождение с networkx для узла {name}"
+    
+    print(f"Проверено начальных узлов: {len(names)}")
+    print("ТЕСТ ПРОЙДЕН УСПЕШНО\n")
+
+
+def main():
+    """Основная функция тестирования"""
+    print("ТЕСТИРОВАНИЕ ПРЕДСТАВЛЕНИЯ СЕТИ В CSR")
+    print("=" * 60)
+    
+    try:
+        test_network_to_csr()
+        test_reachable_csr()
+        
+        print("=" * 60)
+        print("ВСЕ ТЕСТЫ ПРОЙДЕНЫ УСПЕШНО!")
+        print("=" * 60)
+        
+    except Exception as e:
+        print(f"\nОШИБКА при тестировании: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тест анализа надежности методом Монте-Карло
+"""
+
+import sys
+import os
+import numpy as np
+import networkx as nx
+
+# Добавляем путь к модулям
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.system_model import SystemModel, create_sample_network
+from src.reliability import ReliabilityAnalyzer
+from src.mc_kernels import connected_after_failures
+
+
+def test_connectivity_kernel():
+    """Тест ядра проверки связности против networkx"""
+    print("Тест 1: Ядро проверки связности")
+    print("-" * 40)
+    
+    model = SystemModel("Тестовая ИКС")
+    model.generate_random_network(12, 0.25, seed=3)
+    
+    node_ids = list(model.nodes)
+    link_keys = list(model.links)
+    node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+    edge_src = np.array([node_index[source] for source, _ in link_keys], dtype=np.int64)
+    edge_dst = np.array([node_index[target] for _, target in link_keys], dtype=np.int64)
+    
+    rng = np.random.default_rng(0)
+    failed_nodes = rng.random((200, len(node_ids))) < 0.15
+    failed_links = rng.random((200, len(link_keys))) < 0.2
+    
+    connected = connected_after_failures(failed_nodes, failed_links, edge_src, edge_dst)
+    
+    for s in range(len(connected)):
+        graph = model.graph.copy()
+        for j, (source, target) in enumerate(link_keys):
+            if failed_links[s, j]:
+                graph.remove_edge(source, target)
+        graph.remove_nodes_from([node_ids[i] for i in range(len(node_ids)) if failed_nodes[s, i]])
+        expected = graph.number_of_nodes() > 0 and nx.is_connected(graph)
+        assert connected[s] == expected, f"Расхождение со networkx в выборке {s}"
+    
+    print(f"Доля связных состояний: {connected.mean():.3f}")
+    print("ТЕСТ ПРОЙДЕН УСПЕШНО\n")
+
+
+def test_monte_carlo_reliability():
+    """Тест анализа Монте-Карло на примерной сети"""
+    print("Тест 2: Анализ Монте-Карло")
+    print("-" * 40)
+    
+    model = create_sample_network()
+    analyzer = ReliabilityAnalyzer(model)
+    
+    np.random.seed(42)
+    results = analyzer.monte_carlo_reliability_analysis(2000)
+    
+    print(f"Надежность системы: {results['system_reliability']:.4f}")
+    
+    assert 0 <= results['system_reliability'] <= 1, "Надежность вне диапазона [0, 1]"
+    assert results['system_available_count'] <= 2000, "Связных состояний больше, чем симуляций"
+    for component_id, count in results['component_failures'].items():
+        assert 0 < count <= 2000, f"Неверное число отказов {component_id}: {count}"
+    
+    print("ТЕСТ ПРОЙДЕН УСПЕШНО\n")
+
+
+def main():
+    """Основная функция тестирования"""
+    print("ТЕСТИРОВАНИЕ АНАЛИЗА МОНТЕ-КАРЛО")
+    print("=" * 60)
+    
+    try:
+        test_connectivity_kernel()
+        test_monte_carlo_reliability()
+        
+        print("=" * 60)
+        print("ВСЕ ТЕСТЫ ПРОЙДЕНЫ УСПЕШНО!")
+        print("=" * 60)
+        
+    except Exception as e:
+        print(f"\nОШИБКА при тестировании: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тест генерации случайной сети в модели ИКС
+"""
+
+import sys
+import os
+
+# Добавляем путь к модулям
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.system_model import SystemModel
+
+
+def test_generate_random_network():
+    """Тест векторизованной генерации случайной сети"""
+    print("Тест 1: Генерация случайной сети")
+    print("-" * 40)
+    
+    model = SystemModel("Тестовая ИКС")
+    model.generate_random_network(20, 0.3, seed=42)
+    
+    print(f"Узлов: {len(model.nodes)}, каналов: {len(model.links)}")
+    
+    assert len(model.nodes) == 20, "Неверное количество узлов"
+    assert model.graph.number_of_edges() == len(model.links), "Граф и словарь каналов расходятся"
+    
+    # Каналы только между разными узлами и без дублей
+    for source, target in model.links:
+        assert source != target, f"Петля {source}-{target}"
+        assert (target, source) not in model.links, f"Дублирующий канал {source}-{target}"
+    
+    # Одинаковое зерно дает одинаковую сеть
+    other = SystemModel("Тестовая ИКС")
+    other.generate_random_network(20, 0.3, seed=42)
+    assert list(other.links) == list(model.links), "Сеть не воспроизводится при одинаковом зерне"
+    
+    # Крайние вероятности
+    empty = SystemModel()
+    empty.generate_random_network(5, 0.0, seed=1)
+    assert len(empty.links) == 0, "При p=0 каналов быть не должно"
+    
+    full = SystemModel()
+    full.generate_random_network(5, 1.0, seed=1)
+    assert len(full.links) == 10, "При p=1 граф должен быть полным"
+    
+    print("ТЕСТ ПРОЙДЕН УСПЕШНО\n")
+
+
+def test_as_soa():
+    """Тест представления модели в виде массивов"""
+    print("Тест 2: Представление SoA")
+    print("-" * 40)
+    
+    model = SystemModel("Тестовая ИКС")
+    model.generate_random_network(8, 0.5, seed=7)
+    
+    soa = model.as_soa()
+    assert soa is model.as_soa(), "Массивы должны кэшироваться"
+    assert len(soa['capacity']) == len(model.nodes), "Неверная длина массива узлов"
+    assert len(soa['src']) == len(model.links), "Неверная длина массива каналов"
+    
+    for k, (source, target) in enumerate(model.links):
+        assert soa['node_ids'][soa['src'][k]] == source, "Неверный индекс начала канала"
+        assert soa['node_ids'][soa['dst'][k]] == target, "Неверный индекс конца канала"
+        assert soa['bandwidth'][k] == model.links[(source, target)].bandwidth
+    
+    # Изменение структуры сбрасывает кэш
+    source, target = next(iter(model.links))
+    model.remove_link(source, target)
+    assert len(model.as_soa()['src']) == len(model.links), "Кэш не сброшен после удаления канала"
+    
+    print("ТЕСТ ПРОЙДЕН УСПЕШНО\n")
+
+
+def test_version():
+    """Тест счетчика изменений модели"""
+    print("Тест 3: Счетчик изменений")
+    print("-" * 40)
+    
+    model = SystemModel("Тестовая ИКС")
+    model.generate_random_network(6, 0.6, seed=3)
+    version = model.version
+    
+    model.calculate_network_metrics()
+    assert model.version == version, "Чтение не должно менять версию"
+    
+    source, target = next(iter(model.links))
+    model.update_link_utilization(source, target, 0.5)
+    assert model.version > version, "Изменение канала должно менять версию"
+    
+    version = model.version
+    model.remove_node(source)
+    assert model.version > version, "Удаление узла должно менять версию"
+    
+    print("ТЕСТ ПРОЙДЕН УСПЕШНО\n")
+
+
+def main():
+    """Основная функция тестирования"""
+    print("ТЕСТИРОВАНИЕ МОДЕЛИ ИКС")
+    print("=" * 60)
+    
+    try:
+        test_generate_random_network()
+        test_as_soa()
+        test_version()
+        
+        print("=" * 60)
+        print("ВСЕ ТЕСТЫ ПРОЙДЕНЫ УСПЕШНО!")
+        print("=" * 60)
+        
+    except Exception as e:
+        print(f"\nОШИБКА при тестировании: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
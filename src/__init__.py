@@ -1,16 +1,28 @@
 # -*- coding: utf-8 -*-
 """
 ИКС Анализатор Системы - Основные модули
+
+Классы подмодулей загружаются при первом обращении (PEP 562): импорт
+любого подмодуля не тянет за собой scipy, sympy и simpy остальных.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "ИКС Анализатор Системы"
 
-from .system_model import SystemModel, Node, Link, NodeType, LinkType
-from .reliability import ReliabilityAnalyzer, FailureType, FailureEvent, FaultTree
-from .simulation import NetworkSimulator, SimulationEvent, EventType
-from .stress_test import StressTester, StressTestType, StressTestScenario, StressTestResult
-from .whatif import WhatIfAnalyzer, ParameterType, ParameterRange, WhatIfScenario, WhatIfResult
+# Имя -> подмодуль, в котором оно определено
+_EXPORTS = {
+    'SystemModel': 'system_model', 'Node': 'system_model', 'Link': 'system_model',
+    'NodeType': 'system_model', 'LinkType': 'system_model',
+    'ReliabilityAnalyzer': 'reliability', 'FailureType': 'reliability',
+    'FailureEvent': 'reliability', 'FaultTree': 'reliability',
+    'NetworkSimulator': 'simulation', 'SimulationEvent': 'simulation', 'EventType': 'simulation',
+    'StressTester': 'stress_test', 'StressTestType': 'stress_test',
+    'StressTestScenario': 'stress_test', 'StressTestResult': 'stress_test',
+    'WhatIfAnalyzer': 'whatif', 'ParameterType': 'whatif', 'ParameterRange': 'whatif',
+    'WhatIfScenario': 'whatif', 'WhatIfResult': 'whatif',
+}
 
 __all__ = [
     'SystemModel', 'Node', 'Link', 'NodeType', 'LinkType',
@@ -18,4 +30,19 @@ __all__ = [
     'NetworkSimulator', 'SimulationEvent', 'EventType',
     'StressTester', 'StressTestType', 'StressTestScenario', 'StressTestResult',
     'WhatIfAnalyzer', 'ParameterType', 'ParameterRange', 'WhatIfScenario', 'WhatIfResult'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Импортирует подмодуль с запрошенным именем при первом обращении"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Следующие обращения не проходят через __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -12,13 +12,16 @@
 import numpy as np
 import pandas as pd
 from scipy import stats
-from statsmodels.stats.stattools import durbin_watson
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Dict, List, Mapping, Tuple, Optional, Union
 import random
 import itertools
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 import warnings
 
+from ..mc_kernels import birnbaum_importance
+
 # Константы
 CRITICAL_NODE_THRESHOLD = 3  # Минимальное количество узлов для функционирования системы
 
@@ -34,6 +37,13 @@ class SystemState:
 class AdvancedReliabilityAnalyzer:
     """Расширенный анализатор надежности ИКС"""
     
+    # Уровни критичности: нижняя граница коэффициента Бирнбаума -> уровень
+    CRITICALITY_LEVELS = ((0.5, 'КРИТИЧЕСКИЙ'), (0.2, 'ВЫСОКИЙ'), (0.1, 'СРЕДНИЙ'))
+    
+    # Наибольшее число узлов, для которого распределение состояний
+    # рассчитывается полным перебором 2^n состояний
+    EXACT_DISTRIBUTION_MAX_NODES = 20
+    
     def __init__(self):
         self.probabilities = {}
         self.structure_matrix = []
@@ -55,31 +65,14 @@ class AdvancedReliabilityAnalyzer:
         self.probabilities = probabilities
         self.structure_matrix = structure_matrix
         
-        # Получаем список узлов
+        # Все коэффициенты рассчитываются одним проходом по состояниям системы
+        # (ядро компилируется numba, если он установлен)
         nodes = list(probabilities.keys())
-        birnbaum_coefficients = {}
-        
-        # Для каждого узла рассчитываем коэффициент Бирнбаума
-        for node in nodes:
-            # Рассчитываем надежность системы при работе узла
-            reliability_with_node = self._calculate_system_reliability_with_node_state(node, True)
-            
-            # Рассчитываем надежность системы при отказе узла
-            reliability_without_node = self._calculate_system_reliability_with_node_state(node, False)
-            
-            # Коэффициент Бирнбаума = разность надежностей
-            birnbaum_coefficients[node] = reliability_with_node - reliability_without_node
+        probability_array = np.fromiter(probabilities.values(), np.float64, len(nodes))
+        coefficients = birnbaum_importance(probability_array,
+                                           self._adjacency_matrix(len(nodes), structure_matrix))
         
-        return birnbaum_coefficients
-    
-    def _calculate_system_reliability_with_node_state(self, target_node: str, node_working: bool) -> float:
-        """Рассчитывает надежность системы при заданном состоянии узла"""
-        # Создаем копию вероятностей с измененным состоянием целевого узла
-        modified_probs = self.probabilities.copy()
-        modified_probs[target_node] = 1.0 if node_working else 0.0
-        
-        # Рассчитываем надежность системы
-        return self.system_reliability(modified_probs, self._get_connections_from_matrix())
+        return dict(zip(nodes, coefficients.tolist()))
     
     def system_reliability(self, probabilities: Dict[str, float], 
                           connections: Dict[str, List[str]]) -> float:
@@ -126,6 +119,84 @@ class AdvancedReliabilityAnalyzer:
         
         return total_reliability
     
+    def system_reliability_masked(self, probabilities: np.ndarray, alive: np.ndarray,
+                                  structure_matrix: List[List[int]]) -> float:
+        """
+        Вычисляет вероятность безотказной работы системы из узлов, отмеченных маской.
+        
+        Векторизованный вариант system_reliability: состояния узлов перебираются
+        блоками массивов, связность проверяется на битовых масках соседей.
+        Удаление узла из системы - сброс его элемента в alive, без копирования словарей.
+        
+        Args:
+            probabilities: Массив вероятностей безотказной работы всех узлов
+            alive: Булева маска узлов, оставшихся в системе
+            structure_matrix: Матрица связности в порядке узлов probabilities
+            
+        Returns:
+            Общая вероятность безотказной работы системы
+        """
+        index = np.flatnonzero(alive)
+        n = index.size
+        
+        # Если система пустая
+        if n == 0:
+            return 0.0
+        
+        p = np.asarray(probabilities, dtype=np.float64)[index]
+        
+        # Если только один узел
+        if n == 1:
+            return float(p[0])
+        
+        # Связи между оставшимися узлами
+        adjacency = self._adjacency_matrix(len(probabilities), structure_matrix)[np.ix_(index, index)]
+        
+        # Соседи каждого узла в виде битовой маски
+        bit_values = np.int64(1) << np.arange(n, dtype=np.int64)
+        neighbor_masks = adjacency.astype(np.int64) @ bit_values
+        
+        total_reliability = 0.0
+        # Состояние - битовая маска работающих узлов; пустое состояние
+        # неработоспособно, поэтому перебор начинается с 1
+        block_size = 1 << 16
+        for start in range(1, 1 << n, block_size):
+            states = np.arange(start, min(start + block_size, 1 << n), dtype=np.int64)
+            working = ((states[:, None] >> np.arange(n)) & 1).astype(bool)
+            state_probs = np.where(working, p, 1.0 - p).prod(axis=1)
+            
+            # Узлы, достижимые из первого работающего узла по работающим узлам
+            reached = states & -states
+            while True:
+                expanded = reached.copy()
+                for i in range(n):
+                    expanded |= np.where((reached >> i) & 1, neighbor_masks[i], 0)
+                expanded &= states
+                if np.array_equal(expanded, reached):
+                    break
+                reached = expanded
+            
+            # Система работоспособна, если все работающие узлы связны
+            total_reliability += state_probs[reached == states].sum()
+        
+        return float(total_reliability)
+    
+    @staticmethod
+    def _adjacency_matrix(num_nodes: int, structure_matrix: List[List[int]]) -> np.ndarray:
+        """
+        Булева матрица связей узлов без петель.
+        
+        Матрица связности может быть меньше числа узлов: недостающие связи
+        считаются отсутствующими, как и в _get_connections_from_matrix.
+        """
+        adjacency = np.zeros((num_nodes, num_nodes), dtype=bool)
+        matrix = np.asarray(structure_matrix, dtype=np.int64)
+        if matrix.ndim == 2:
+            rows, cols = min(matrix.shape[0], num_nodes), min(matrix.shape[1], num_nodes)
+            adjacency[:rows, :cols] = matrix[:rows, :cols] == 1
+        np.fill_diagonal(adjacency, False)
+        return adjacency
+    
     def _is_system_working(self, working_nodes: List[str], connections: Dict[str, List[str]]) -> bool:
         """Проверяет, является ли система работоспособной при заданном наборе работающих узлов"""
         if not working_nodes:
@@ -159,17 +230,28 @@ class AdvancedReliabilityAnalyzer:
         # Система связна, если все узлы достижимы
         return len(visited) == len(nodes)
     
-    def calculate_probability_distribution(self, probabilities: Dict[str, float]) -> Dict[str, float]:
+    def calculate_probability_distribution(self, probabilities: Dict[str, float],
+                                           num_samples: int = 10000,
+                                           seed: Optional[int] = None) -> Dict[str, float]:
         """
         Вычисляет распределение вероятностей возможных состояний системы.
         
+        Для систем больше EXACT_DISTRIBUTION_MAX_NODES узлов полный перебор
+        невозможен, и распределение оценивается методом Монте-Карло.
+        
         Args:
             probabilities: Словарь с вероятностями безотказной работы узлов
+            num_samples: Количество выборок оценки Монте-Карло
+            seed: Зерно генератора для оценки Монте-Карло
             
         Returns:
-            Словарь с вероятностями различных состояний системы
+            Словарь с вероятностями различных состояний системы (для оценки
+            Монте-Карло - частоты состояний, встретившихся в выборке)
         """
         nodes = list(probabilities.keys())
+        if len(nodes) > self.EXACT_DISTRIBUTION_MAX_NODES:
+            return self._sample_probability_distribution(probabilities, num_samples, seed)
+        
         state_probabilities = {}
         
         # Генерируем все возможные состояния системы
@@ -192,6 +274,26 @@ class AdvancedReliabilityAnalyzer:
         
         return state_probabilities
     
+    def _sample_probability_distribution(self, probabilities: Dict[str, float],
+                                         num_samples: int, seed: Optional[int]) -> Dict[str, float]:
+        """Оценивает распределение состояний системы методом Монте-Карло"""
+        nodes = list(probabilities.keys())
+        p = np.fromiter(probabilities.values(), np.float64, len(nodes))
+        
+        # Все выборки разыгрываются одним вызовом; состояния упаковываются
+        # в байты и подсчитываются без перебора в Python
+        working = np.random.default_rng(seed).random((num_samples, len(nodes))) < p
+        states, counts = np.unique(np.packbits(working, axis=1), axis=0, return_counts=True)
+        states = np.unpackbits(states, axis=1, count=len(nodes)).astype(bool)
+        
+        state_probabilities = {}
+        for state, count in zip(states.tolist(), counts.tolist()):
+            state_key = " | ".join(f"{node}:работает" if node_working else f"{node}:отказал"
+                                   for node, node_working in zip(nodes, state))
+            state_probabilities[state_key] = count / num_samples
+        
+        return state_probabilities
+    
     def calculate_node_failure_probabilities(self, probabilities: Dict[str, float]) -> Dict[str, float]:
         """
         Вычисляет вероятности отказа отдельных узлов.
@@ -209,12 +311,12 @@ class AdvancedReliabilityAnalyzer:
         
         return failure_probabilities
     
-    def durbin_watson_test(self, residuals: List[float]) -> Tuple[float, str]:
+    def durbin_watson_test(self, residuals: Union[List[float], np.ndarray]) -> Tuple[float, str]:
         """
         Проверяет наличие автокорреляции остатков по критерию Дарбина–Уотсона.
         
         Args:
-            residuals: Список остатков регрессии
+            residuals: Остатки регрессии (массив NumPy или список)
             
         Returns:
             Кортеж (значение статистики, текстовая интерпретация результата)
@@ -222,9 +324,11 @@ class AdvancedReliabilityAnalyzer:
         if len(residuals) < 3:
             return 0.0, "Недостаточно данных для проведения теста"
         
-        # Рассчитываем статистику Дарбина-Уотсона
+        # Рассчитываем статистику Дарбина-Уотсона:
+        # сумма квадратов разностей соседних остатков / сумма квадратов остатков
         try:
-            dw_statistic = durbin_watson(residuals)
+            r = np.ascontiguousarray(residuals, dtype=np.float64)
+            dw_statistic = np.square(np.diff(r)).sum() / np.square(r).sum()
         except Exception as e:
             warnings.warn(f"Ошибка при расчете статистики Дарбина-Уотсона: {e}")
             return 0.0, "Ошибка при расчете статистики"
@@ -389,9 +493,10 @@ class AdvancedReliabilityAnalyzer:
                 'description': f'Случайный отказ оборудования узла {node_id}'
             })
         
-        # Обновляем вероятности отказов узлов
-        if 'node_failure_probabilities' not in updated_network:
-            updated_network['node_failure_probabilities'] = {}
+        # Обновляем вероятности отказов узлов (в копии словаря: поверхностная
+        # копия сети разделяет его с исходной структурой)
+        updated_network['node_failure_probabilities'] = dict(
+            updated_network.get('node_failure_probabilities', {}))
         
         for event in affected_nodes:
             node_id = event['node_id']
@@ -414,7 +519,7 @@ class AdvancedReliabilityAnalyzer:
         """Преобразует матрицу связности в словарь связей"""
         connections = {}
         
-        if not self.structure_matrix:
+        if len(self.structure_matrix) == 0:
             return connections
         
         # Предполагаем, что узлы пронумерованы как строки/столбцы матрицы
@@ -432,34 +537,46 @@ class AdvancedReliabilityAnalyzer:
         return connections
     
     def generate_reliability_report(self, probabilities: Dict[str, float], 
-                                  structure_matrix: List[List[int]]) -> pd.DataFrame:
+                                  structure_matrix: List[List[int]],
+                                  birnbaum_coeffs: Optional[Dict[str, float]] = None) -> pd.DataFrame:
         """
         Генерирует подробный отчет по надежности системы.
         
         Args:
             probabilities: Словарь с вероятностями безотказной работы узлов
             structure_matrix: Матрица связности системы
+            birnbaum_coeffs: Уже рассчитанные коэффициенты Бирнбаума для этих
+                probabilities и structure_matrix (если не заданы, рассчитываются)
             
         Returns:
             DataFrame с результатами анализа
         """
         # Рассчитываем все метрики
-        birnbaum_coeffs = self.calculate_birnbaum_criterion(probabilities, structure_matrix)
+        if birnbaum_coeffs is None:
+            birnbaum_coeffs = self.calculate_birnbaum_criterion(probabilities, structure_matrix)
+        else:
+            self.probabilities = probabilities
+            self.structure_matrix = structure_matrix
         failure_probs = self.calculate_node_failure_probabilities(probabilities)
         connections = self._get_connections_from_matrix()
         system_reliability = self.system_reliability(probabilities, connections)
         
+        # Уровни критичности определяются для всех узлов одним вызовом
+        nodes = list(probabilities.keys())
+        coefficients = np.fromiter((birnbaum_coeffs[node] for node in nodes), np.float64, len(nodes))
+        criticality_levels = self._get_criticality_levels(coefficients).tolist()
+        
         # Создаем отчет
         report_data = []
         
-        for node in probabilities.keys():
+        for node, criticality_level in zip(nodes, criticality_levels):
             report_data.append({
                 'node_id': node,
                 'reliability': probabilities[node],
                 'failure_probability': failure_probs[node],
                 'birnbaum_coefficient': birnbaum_coeffs[node],
                 'connections_count': len(connections.get(node, [])),
-                'criticality_level': self._get_criticality_level(birnbaum_coeffs[node])
+                'criticality_level': criticality_level
             })
         
         # Добавляем общую информацию о системе
@@ -476,20 +593,27 @@ class AdvancedReliabilityAnalyzer:
     
     def _get_criticality_level(self, birnbaum_coefficient: float) -> str:
         """Определяет уровень критичности узла на основе коэффициента Бирнбаума"""
-        if birnbaum_coefficient >= 0.5:
-            return 'КРИТИЧЕСКИЙ'
-        elif birnbaum_coefficient >= 0.2:
-            return 'ВЫСОКИЙ'
-        elif birnbaum_coefficient >= 0.1:
-            return 'СРЕДНИЙ'
-        else:
-            return 'НИЗКИЙ'
+        for threshold, level in self.CRITICALITY_LEVELS:
+            if birnbaum_coefficient >= threshold:
+                return level
+        return 'НИЗКИЙ'
+    
+    def _get_criticality_levels(self, birnbaum_coefficients: np.ndarray) -> np.ndarray:
+        """Определяет уровни критичности для массива коэффициентов Бирнбаума"""
+        return np.select([birnbaum_coefficients >= threshold for threshold, _ in self.CRITICALITY_LEVELS],
+                         [level for _, level in self.CRITICALITY_LEVELS], default='НИЗКИЙ')
 
 
-def create_sample_network() -> Tuple[Dict[str, float], List[List[int]], Dict[str, any]]:
+@lru_cache(maxsize=1)
+def create_sample_network() -> Tuple[Mapping[str, float], np.ndarray, Mapping[str, any]]:
     """
     Создает пример сети для демонстрации функций анализа надежности.
     
+    Сеть строится один раз и разделяется всеми вызовами, поэтому возвращается
+    только для чтения: вероятности и структура сети - MappingProxyType, матрица
+    связности - массив NumPy с запретом записи. Вложенные списки структуры сети
+    также не должны изменяться; методы анализатора возвращают новые структуры.
+    
     Returns:
         Кортеж (вероятности, матрица_связности, структура_сети)
     """
@@ -505,7 +629,7 @@ def create_sample_network() -> Tuple[Dict[str, float], List[List[int]], Dict[str
     }
     
     # Матрица связности (7x7)
-    structure_matrix = [
+    structure_matrix = np.array([
         [0, 1, 1, 0, 0, 0, 1],  # server1
         [1, 0, 0, 1, 0, 0, 1],  # server2
         [1, 0, 0, 1, 1, 0, 0],  # router1
@@ -513,7 +637,8 @@ def create_sample_network() -> Tuple[Dict[str, float], List[List[int]], Dict[str
         [0, 0, 1, 0, 0, 1, 0],  # switch1
         [0, 0, 0, 1, 1, 0, 0],  # switch2
         [1, 1, 0, 0, 0, 0, 0]   # firewall
-    ]
+    ], dtype=np.int64)
+    structure_matrix.setflags(write=False)
     
     # Структура сети
     network_structure = {
@@ -548,7 +673,7 @@ def create_sample_network() -> Tuple[Dict[str, float], List[List[int]], Dict[str
         ]
     }
     
-    return probabilities, structure_matrix, network_structure
+    return MappingProxyType(probabilities), structure_matrix, MappingProxyType(network_structure)
 
 
 if __name__ == "__main__":
@@ -597,14 +722,16 @@ if __name__ == "__main__":
     # Генерируем пример остатков
     np.random.seed(42)
     residuals = np.random.normal(0, 1, 20) + 0.3 * np.random.normal(0, 1, 20)  # с автокорреляцией
-    dw_stat, dw_interpretation = analyzer.durbin_watson_test(residuals.tolist())
+    dw_stat, dw_interpretation = analyzer.durbin_watson_test(residuals)
     print(f"   Статистика Дарбина-Уотсона: {dw_stat:.4f}")
     print(f"   Интерпретация: {dw_interpretation}")
     print()
     
     # 7. Пошаговое удаление узлов
     print("7. Пошаговое удаление узлов:")
-    current_network = network_structure.copy()
+    # remove_nodes и simulate_external_events возвращают новую структуру,
+    # не изменяя переданную, поэтому исходная сеть не копируется
+    current_network = network_structure
     nodes_to_test = ['switch1', 'switch2', 'router1']
     
     for node_to_remove in nodes_to_test:
@@ -622,8 +749,8 @@ if __name__ == "__main__":
     
     # 8. Имитация внешних событий
     print("8. Имитация внешних воздействий:")
-    # Восстанавливаем исходную сеть
-    current_network = network_structure.copy()
+    # Возвращаемся к исходной сети (удаление узлов ее не изменяло)
+    current_network = network_structure
     
     # Симулируем внешние события несколько раз
     for i in range(3):
@@ -2,21 +2,35 @@
 # -*- coding: utf-8 -*-
 """
 Графический интерфейс приложения
-"""
-
-from .main_window import MainWindow
-from .network_viewer import NetworkViewer
-from .metrics_panel import MetricsPanel
-from .control_panel import ControlPanel
-
-__all__ = ['MainWindow', 'NetworkViewer', 'MetricsPanel', 'ControlPanel']
-
 
+Классы загружаются при первом обращении (PEP 562): импорт отдельного
+подмодуля, например advanced_reliability_panel, не тянет за собой
+main_window с matplotlib.pyplot и tkinter.
+"""
 
+import importlib
 
+# Имя -> подмодуль, в котором оно определено
+_EXPORTS = {
+    'MainWindow': 'main_window',
+    'NetworkViewer': 'network_viewer',
+    'MetricsPanel': 'metrics_panel',
+    'ControlPanel': 'control_panel',
+}
 
+__all__ = ['MainWindow', 'NetworkViewer', 'MetricsPanel', 'ControlPanel']
 
 
+def __getattr__(name):
+    """Импортирует подмодуль с запрошенным именем при первом обращении"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Следующие обращения не проходят через __getattr__
+    return value
 
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
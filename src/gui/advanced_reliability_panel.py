@@ -13,7 +13,6 @@
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
@@ -22,9 +21,9 @@ from scipy import stats
 from statsmodels.stats.stattools import durbin_watson
 from statsmodels.graphics.tsaplots import plot_acf
 from typing import Dict, List, Tuple, Optional, Union
-import random
 import itertools
 from dataclasses import dataclass
+from functools import lru_cache
 import warnings
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                              QLabel, QTableWidget, QTableWidgetItem, QTabWidget,
@@ -33,6 +32,12 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QColor, QPalette
 
+try:
+    import pyqtgraph as pg
+    PYQTGRAPH_AVAILABLE = True
+except ImportError:
+    PYQTGRAPH_AVAILABLE = False
+
 # Константы
 CRITICAL_NODE_THRESHOLD = 3  # Минимальное количество узлов для функционирования системы
 
@@ -45,6 +50,19 @@ NODE_COLORS = {
     'critical': '#8B0000'      # Темно-красный - критический
 }
 
+# Границы уровней критичности по коэффициенту Бирнбаума (средний, высокий,
+# критический) и цвета столбцов для каждого уровня, начиная с низкого
+BIRNBAUM_COLOR_BINS = np.array([0.1, 0.2, 0.5])
+BIRNBAUM_BAR_COLORS = np.array([NODE_COLORS['working'], '#FFD700',
+                                NODE_COLORS['attacked'], NODE_COLORS['critical']])
+
+# Линии уровней критичности на графике: (уровень, цвет, подпись)
+BIRNBAUM_LEVEL_LINES = (
+    (0.5, 'red', 'Критический (≥0.5)'),
+    (0.2, 'orange', 'Высокий (≥0.2)'),
+    (0.1, 'yellow', 'Средний (≥0.1)')
+)
+
 
 @dataclass
 class NodeState:
@@ -164,6 +182,14 @@ class FragilityAnalysisModule:
 class ExternalThreatsModule:
     """Модуль моделирования внешних угроз"""
     
+    # Последствия угроз: (угроза, число узлов-целей, множитель надежности
+    # пораженного узла, описание события)
+    THREAT_EFFECTS = (
+        ('hacker_attack', 2, 0.3, 'Хакерская атака на узел {}'),      # Снижаем надежность
+        ('power_outage', 3, 0.0, 'Отключение питания узла {}'),       # Полный отказ
+        ('communication_failure', 1, 0.5, 'Сбой коммуникации узла {}')  # Снижаем надежность связи
+    )
+    
     def __init__(self):
         self.threat_probabilities = {
             'hacker_attack': 0.1,      # 10% вероятность атаки
@@ -188,50 +214,56 @@ class ExternalThreatsModule:
         Returns:
             Кортеж (обновленные_вероятности, список_событий)
         """
-        updated_probs = probabilities.copy()
-        events = []
+        updated_probs, events = self.simulate_threats_batch(network, probabilities, 1)
+        return dict(zip(probabilities, updated_probs[0].tolist())), events[0]
+    
+    def simulate_threats_batch(self, network: Dict, probabilities: Dict[str, float],
+                               num_rounds: int,
+                               rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, List[List[Dict]]]:
+        """
+        Симулирует несколько независимых раундов внешних угроз сразу.
         
+        Случайные величины всех раундов разыгрываются массивами: возникновение
+        угрозы, выбор узлов-целей (без повторов в раунде) и поражение каждой цели.
+        
+        Args:
+            network: Структура сети
+            probabilities: Вероятности безотказной работы узлов
+            num_rounds: Количество раундов
+            rng: Генератор случайных чисел (по умолчанию - новый)
+            
+        Returns:
+            Кортеж (матрица обновленных вероятностей (num_rounds, n_nodes) в порядке
+            узлов probabilities, список событий каждого раунда)
+        """
+        rng = np.random.default_rng() if rng is None else rng
         nodes = list(probabilities.keys())
+        num_nodes = len(nodes)
+        
+        factors = np.ones((num_rounds, num_nodes))
+        events = [[] for _ in range(num_rounds)]
         
-        # Хакерская атака
-        if random.random() < self.threat_probabilities['hacker_attack']:
-            target_nodes = random.sample(nodes, min(2, len(nodes)))
-            for node in target_nodes:
-                if random.random() < self.threat_impact['hacker_attack']:
-                    updated_probs[node] *= 0.3  # Снижаем надежность
-                    events.append({
-                        'type': 'hacker_attack',
-                        'target': node,
-                        'impact': self.threat_impact['hacker_attack'],
-                        'description': f'Хакерская атака на узел {node}'
-                    })
-        
-        # Отключение питания
-        if random.random() < self.threat_probabilities['power_outage']:
-            affected_nodes = random.sample(nodes, min(3, len(nodes)))
-            for node in affected_nodes:
-                if random.random() < self.threat_impact['power_outage']:
-                    updated_probs[node] = 0.0  # Полный отказ
-                    events.append({
-                        'type': 'power_outage',
-                        'target': node,
-                        'impact': self.threat_impact['power_outage'],
-                        'description': f'Отключение питания узла {node}'
-                    })
-        
-        # Сбой коммуникации
-        if random.random() < self.threat_probabilities['communication_failure']:
-            target_node = random.choice(nodes)
-            if random.random() < self.threat_impact['communication_failure']:
-                updated_probs[target_node] *= 0.5  # Снижаем надежность связи
-                events.append({
-                    'type': 'communication_failure',
-                    'target': target_node,
-                    'impact': self.threat_impact['communication_failure'],
-                    'description': f'Сбой коммуникации узла {target_node}'
+        for threat, num_targets, factor, description in self.THREAT_EFFECTS:
+            num_targets = min(num_targets, num_nodes)
+            occurred = rng.random(num_rounds) < self.threat_probabilities[threat]
+            # Случайная перестановка узлов в каждом раунде - первые цели без повторов
+            targets = rng.random((num_rounds, num_nodes)).argsort(axis=1)[:, :num_targets]
+            hit = occurred[:, None] & (rng.random((num_rounds, num_targets)) < self.threat_impact[threat])
+            
+            hit_rounds, hit_slots = np.nonzero(hit)
+            hit_nodes = targets[hit_rounds, hit_slots]
+            factors[hit_rounds, hit_nodes] *= factor
+            
+            for round_index, node_index in zip(hit_rounds.tolist(), hit_nodes.tolist()):
+                events[round_index].append({
+                    'type': threat,
+                    'target': nodes[node_index],
+                    'impact': self.threat_impact[threat],
+                    'description': description.format(nodes[node_index])
                 })
         
-        return updated_probs, events
+        probability_array = np.fromiter(probabilities.values(), np.float64, num_nodes)
+        return probability_array * factors, events
 
 
 class NetworkVisualizationWidget(QWidget):
@@ -356,39 +388,79 @@ class ACFVisualizationWidget(QWidget):
 
 
 class BirnbaumVisualizationWidget(QWidget):
-    """Виджет для визуализации коэффициентов Бирнбаума"""
+    """
+    Виджет для визуализации коэффициентов Бирнбаума.
+    
+    При установленном pyqtgraph график рисуется средствами Qt и обновляется
+    без растеризации всей фигуры; иначе используется matplotlib.
+    """
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.figure = Figure(figsize=(10, 6))
-        self.canvas = FigureCanvas(self.figure)
         
         layout = QVBoxLayout()
-        layout.addWidget(self.canvas)
+        if PYQTGRAPH_AVAILABLE:
+            self.plot_widget = pg.PlotWidget(background='w')
+            self.plot_widget.setTitle('Коэффициенты значимости Бирнбаума')
+            self.plot_widget.setLabel('bottom', 'Узлы системы')
+            self.plot_widget.setLabel('left', 'Коэффициент значимости Бирнбаума')
+            self.plot_widget.getAxis('left').enableAutoSIPrefix(False)
+            self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
+            
+            # Линии уровней и столбцы создаются один раз, при обновлении
+            # меняются только данные
+            for level, color, label in BIRNBAUM_LEVEL_LINES:
+                self.plot_widget.addItem(pg.InfiniteLine(
+                    pos=level, angle=0, pen=pg.mkPen(color, style=Qt.DashLine),
+                    label=label, labelOpts={'position': 0.98, 'color': color, 'anchors': [(1, 0), (1, 0)]}
+                ))
+            self.bars = pg.BarGraphItem(x=[], height=[], width=0.6)
+            self.plot_widget.addItem(self.bars)
+            self.value_labels = []
+            
+            layout.addWidget(self.plot_widget)
+        else:
+            self.figure = Figure(figsize=(10, 6))
+            self.canvas = FigureCanvas(self.figure)
+            layout.addWidget(self.canvas)
         self.setLayout(layout)
     
     def plot_birnbaum_coefficients(self, coefficients: Dict[str, float]):
         """Строит график коэффициентов Бирнбаума"""
-        self.figure.clear()
-        
-        ax = self.figure.add_subplot(111)
-        
         # Сортируем коэффициенты по убыванию
         sorted_coeffs = sorted(coefficients.items(), key=lambda x: x[1], reverse=True)
         nodes = [item[0] for item in sorted_coeffs]
-        values = [item[1] for item in sorted_coeffs]
+        values = np.array([item[1] for item in sorted_coeffs], dtype=np.float64)
         
         # Определяем цвета в зависимости от критичности
-        colors = []
-        for value in values:
-            if value >= 0.5:
-                colors.append(NODE_COLORS['critical'])
-            elif value >= 0.2:
-                colors.append(NODE_COLORS['attacked'])
-            elif value >= 0.1:
-                colors.append('#FFD700')  # Золотой
-            else:
-                colors.append(NODE_COLORS['working'])
+        colors = BIRNBAUM_BAR_COLORS[np.searchsorted(BIRNBAUM_COLOR_BINS, values, side='right')].tolist()
+        
+        if PYQTGRAPH_AVAILABLE:
+            self._plot_pyqtgraph(nodes, values, colors)
+        else:
+            self._plot_matplotlib(nodes, values, colors)
+    
+    def _plot_pyqtgraph(self, nodes: List[str], values: np.ndarray, colors: List[str]):
+        """Обновляет столбцы и подписи графика pyqtgraph"""
+        positions = np.arange(len(nodes))
+        self.bars.setOpts(x=positions, height=values, brushes=colors)
+        self.plot_widget.getAxis('bottom').setTicks([list(zip(positions.tolist(), nodes))])
+        
+        # Подписи значений над столбцами
+        for label in self.value_labels:
+            self.plot_widget.removeItem(label)
+        self.value_labels = []
+        for position, value in zip(positions, values):
+            label = pg.TextItem(f'{value:.3f}', color='k', anchor=(0.5, 1))
+            label.setPos(position, value)
+            self.plot_widget.addItem(label)
+            self.value_labels.append(label)
+    
+    def _plot_matplotlib(self, nodes: List[str], values: np.ndarray, colors: List[str]):
+        """Перестраивает график matplotlib"""
+        self.figure.clear()
+        
+        ax = self.figure.add_subplot(111)
         
         # Строим столбчатую диаграмму
         bars = ax.bar(range(len(nodes)), values, color=colors, alpha=0.8)
@@ -406,9 +478,8 @@ class BirnbaumVisualizationWidget(QWidget):
                    f'{value:.3f}', ha='center', va='bottom')
         
         # Добавляем горизонтальные линии для уровней критичности
-        ax.axhline(y=0.5, color='red', linestyle='--', alpha=0.7, label='Критический (≥0.5)')
-        ax.axhline(y=0.2, color='orange', linestyle='--', alpha=0.7, label='Высокий (≥0.2)')
-        ax.axhline(y=0.1, color='yellow', linestyle='--', alpha=0.7, label='Средний (≥0.1)')
+        for level, color, label in BIRNBAUM_LEVEL_LINES:
+            ax.axhline(y=level, color=color, linestyle='--', alpha=0.7, label=label)
         
         ax.legend()
         ax.grid(True, alpha=0.3)
@@ -417,6 +488,34 @@ class BirnbaumVisualizationWidget(QWidget):
         self.canvas.draw()
 
 
+@lru_cache(maxsize=8)
+def _analyze_reliability(probability_items: Tuple[Tuple[str, float], ...],
+                         structure_matrix: Tuple[Tuple[int, ...], ...]) -> Tuple[Dict[str, float], float]:
+    """
+    Рассчитывает коэффициенты Бирнбаума и надежность системы.
+    
+    Результат кэшируется по входным данным: повторный анализ той же сети
+    (пункты меню «Новый анализ», «Критерий Бирнбаума») не пересчитывается.
+    Порядок пар в probability_items задает порядок строк structure_matrix.
+    
+    Returns:
+        Кортеж (коэффициенты_Бирнбаума, надежность_системы)
+    """
+    from src.analytics.advanced_reliability_analyzer import AdvancedReliabilityAnalyzer
+    
+    analyzer = AdvancedReliabilityAnalyzer()
+    probabilities = dict(probability_items)
+    
+    birnbaum_coeffs = analyzer.calculate_birnbaum_criterion(
+        probabilities, [list(row) for row in structure_matrix]
+    )
+    system_reliability = analyzer.system_reliability(
+        probabilities, analyzer._get_connections_from_matrix()
+    )
+    
+    return birnbaum_coeffs, system_reliability
+
+
 class AdvancedReliabilityPanel(QWidget):
     """Панель расширенного анализа надежности"""
     
@@ -434,6 +533,7 @@ class AdvancedReliabilityPanel(QWidget):
         self.current_network = None
         self.current_probabilities = None
         self.current_results = {}
+        self._analysis_key = None  # Входные данные, по которым получены current_results
     
     def init_ui(self):
         """Инициализация пользовательского интерфейса"""
@@ -654,31 +754,17 @@ class AdvancedReliabilityPanel(QWidget):
             return
         
         try:
-            # Импортируем анализатор
-            from src.analytics.advanced_reliability_analyzer import AdvancedReliabilityAnalyzer
-            
-            analyzer = AdvancedReliabilityAnalyzer()
-            
-            # Создаем матрицу связности
-            structure_matrix = self._create_structure_matrix()
-            
-            # Рассчитываем коэффициенты Бирнбаума
-            birnbaum_coeffs = analyzer.calculate_birnbaum_criterion(
-                self.current_probabilities, structure_matrix
-            )
-            
-            # Рассчитываем надежность системы
-            connections = analyzer._get_connections_from_matrix()
-            system_reliability = analyzer.system_reliability(
-                self.current_probabilities, connections
-            )
+            # Рассчитываем коэффициенты Бирнбаума и надежность системы
+            analysis_key = self._analysis_inputs()
+            birnbaum_coeffs, system_reliability = _analyze_reliability(*analysis_key)
             
-            # Сохраняем результаты
+            # Сохраняем результаты (копия, чтобы не изменять кэшированный словарь)
             self.current_results = {
-                'birnbaum_coefficients': birnbaum_coeffs,
+                'birnbaum_coefficients': dict(birnbaum_coeffs),
                 'system_reliability': system_reliability,
                 'probabilities': self.current_probabilities
             }
+            self._analysis_key = analysis_key
             
             # Обновляем интерфейс
             self.update_results_table()
@@ -690,6 +776,24 @@ class AdvancedReliabilityPanel(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Ошибка", f"Ошибка при анализе: {str(e)}")
     
+    def refresh(self, force: bool = False):
+        """
+        Обновляет результаты анализа, если изменились входные данные.
+        
+        Если вероятности и структура сети те же, что при последнем анализе,
+        таблица и графики остаются без изменений. При force=True анализ
+        перезапускается в любом случае; виджеты перезаписываются на месте,
+        а коэффициенты берутся из кэша _analyze_reliability.
+        """
+        if not force and self.current_results and self._analysis_key == self._analysis_inputs():
+            return
+        self.run_analysis()
+    
+    def _analysis_inputs(self) -> Tuple[Tuple[Tuple[str, float], ...], Tuple[Tuple[int, ...], ...]]:
+        """Возвращает входные данные анализа в виде хешируемых кортежей"""
+        return (tuple(self.current_probabilities.items()),
+                tuple(map(tuple, self._create_structure_matrix())))
+    
     def _create_structure_matrix(self) -> List[List[int]]:
         """Создает матрицу связности из структуры сети"""
         if not self.current_network or 'connections' not in self.current_network:
@@ -878,6 +982,7 @@ class AdvancedReliabilityPanel(QWidget):
         self.fragility_results.clear()
         self.threats_results.clear()
         self.current_results = {}
+        self._analysis_key = None
 
 
 def create_sample_network_with_states() -> Tuple[Dict, Dict[str, float], Dict[str, NodeState]]:
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Вычислительные ядра для анализа методом Монте-Карло
+
+Ядра работают только с массивами NumPy и скалярами. Если установлен numba,
+они компилируются в машинный код, иначе выполняются интерпретатором.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Заглушка numba.njit: возвращает функцию без изменений"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def sample_failures(availability: np.ndarray, num_simulations: int) -> np.ndarray:
+    """
+    Разыгрывает отказы компонентов для всех симуляций сразу.
+
+    Args:
+        availability: Доступность каждого компонента, форма (n_components,)
+        num_simulations: Количество симуляций
+
+    Returns:
+        Булева матрица (num_simulations, n_components), True - компонент отказал
+    """
+    availability = np.ascontiguousarray(availability, dtype=np.float64)
+    draws = np.random.random((num_simulations, availability.size))
+    return draws > availability
+
+
+@njit(cache=True)
+def _find_root(parent, i):
+    """Поиск корня в системе непересекающихся множеств со сжатием пути"""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+@njit(parallel=True, cache=True)
+def connected_after_failures(failed_nodes, failed_links, edge_src, edge_dst):
+    """
+    Проверяет связность сети для каждого набора отказов.
+
+    Args:
+        failed_nodes: Булева матрица отказов узлов (n_samples, n_nodes)
+        failed_links: Булева матрица отказов каналов (n_samples, n_links)
+        edge_src: Индексы начальных узлов каналов (n_links,)
+        edge_dst: Индексы конечных узлов каналов (n_links,)
+
+    Returns:
+        Булев массив (n_samples,): True - оставшиеся узлы образуют одну компоненту
+    """
+    n_samples, n_nodes = failed_nodes.shape
+    n_links = edge_src.shape[0]
+    result = np.zeros(n_samples, dtype=np.bool_)
+
+    for s in prange(n_samples):
+        parent = np.arange(n_nodes)
+
+        for e in range(n_links):
+            if failed_links[s, e]:
+                continue
+            a = edge_src[e]
+            b = edge_dst[e]
+            if failed_nodes[s, a] or failed_nodes[s, b]:
+                continue
+            root_a = _find_root(parent, a)
+            root_b = _find_root(parent, b)
+            if root_a != root_b:
+                parent[root_a] = root_b
+
+        components = 0
+        for i in range(n_nodes):
+            if not failed_nodes[s, i] and _find_root(parent, i) == i:
+                components += 1
+
+        result[s] = components == 1
+
+    return result
+
+
+@njit(cache=True)
+def _state_connected(state, neighbor_masks):
+    """Проверяет, что узлы битовой маски state связны по маскам соседей"""
+    reached = state & -state
+    while True:
+        expanded = reached
+        for i in range(neighbor_masks.shape[0]):
+            if (reached >> i) & 1:
+                expanded |= neighbor_masks[i]
+        expanded &= state
+        if expanded == reached:
+            return reached == state
+        reached = expanded
+
+
+@njit(cache=True)
+def birnbaum_importance(probabilities, adjacency):
+    """
+    Вычисляет коэффициенты значимости Бирнбаума полным перебором состояний.
+
+    Система работоспособна, если работает хотя бы один узел и все работающие
+    узлы связны. Коэффициент узла k - разность надежностей системы при
+    работающем и отказавшем узле k: сумма по работоспособным состояниям
+    произведения вероятностей остальных узлов со знаком состояния узла k.
+
+    Args:
+        probabilities: Вероятности безотказной работы узлов (n_nodes,)
+        adjacency: Булева матрица связей (n_nodes, n_nodes) без петель
+
+    Returns:
+        Массив коэффициентов Бирнбаума (n_nodes,)
+    """
+    n = probabilities.shape[0]
+    neighbor_masks = np.zeros(n, dtype=np.int64)
+    for i in range(n):
+        for j in range(n):
+            if adjacency[i, j]:
+                neighbor_masks[i] |= np.int64(1) << j
+
+    coefficients = np.zeros(n)
+    factors = np.empty(n)
+    prefix = np.empty(n + 1)
+    suffix = np.empty(n + 1)
+
+    for state in range(1, np.int64(1) << n):
+        if not _state_connected(state, neighbor_masks):
+            continue
+
+        for i in range(n):
+            factors[i] = probabilities[i] if (state >> i) & 1 else 1.0 - probabilities[i]
+
+        # Произведения вероятностей всех узлов, кроме k: prefix[k] * suffix[k + 1]
+        prefix[0] = 1.0
+        for i in range(n):
+            prefix[i + 1] = prefix[i] * factors[i]
+        suffix[n] = 1.0
+        for i in range(n - 1, -1, -1):
+            suffix[i] = suffix[i + 1] * factors[i]
+
+        for k in range(n):
+            others = prefix[k] * suffix[k + 1]
+            if (state >> k) & 1:
+                coefficients[k] += others
+            else:
+                coefficients[k] -= others
+
+    return coefficients
@@ -11,8 +11,8 @@ from sympy.stats import *
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
-import networkx as nx
 from .system_model import SystemModel, Node, Link
+from .mc_kernels import sample_failures, connected_after_failures
 
 
 class FailureType(Enum):
@@ -183,58 +183,38 @@ class ReliabilityAnalyzer:
             'average_uptime': 0.0
         }
         
-        for _ in range(num_simulations):
-            # Симулируем отказы компонентов
-            failed_components = []
-            
-            # Проверяем узлы
-            for node_id in self.system_model.nodes:
-                availability = self.calculate_availability(node_id)
-                if np.random.random() > availability:
-                    failed_components.append(node_id)
-                    if node_id not in results['component_failures']:
-                        results['component_failures'][node_id] = 0
-                    results['component_failures'][node_id] += 1
-            
-            # Проверяем каналы
-            for (source, target), link in self.system_model.links.items():
-                link_id = f"{source}_{target}"
-                availability = self.calculate_availability(link_id)
-                if np.random.random() > availability:
-                    failed_components.append(link_id)
-                    if link_id not in results['component_failures']:
-                        results['component_failures'][link_id] = 0
-                    results['component_failures'][link_id] += 1
-            
-            # Проверяем связность сети
-            if self._is_system_connected_after_failures(failed_components):
-                results['system_available_count'] += 1
+        soa = self.system_model.as_soa()
+        node_ids = soa['node_ids']
+        component_ids = node_ids + soa['link_ids']
+        
+        # Доступность компонентов не меняется между симуляциями
+        availability = np.array([self.calculate_availability(component_id)
+                                 for component_id in component_ids], dtype=np.float64)
+        
+        # Разыгрываем отказы всех компонентов во всех симуляциях одним вызовом
+        failures = sample_failures(availability, num_simulations)
         
+        failure_counts = failures.sum(axis=0)
+        for component_id, count in zip(component_ids, failure_counts):
+            if count:
+                results['component_failures'][component_id] = int(count)
+        
+        # Связность проверяется один раз для каждого уникального набора отказов
+        unique_failures, inverse = np.unique(failures, axis=0, return_inverse=True)
+        
+        num_nodes = len(node_ids)
+        connected = connected_after_failures(
+            np.ascontiguousarray(unique_failures[:, :num_nodes]),
+            np.ascontiguousarray(unique_failures[:, num_nodes:]),
+            soa['src'], soa['dst']
+        )
+        
+        results['system_available_count'] = int(connected[inverse.ravel()].sum())
         results['system_reliability'] = results['system_available_count'] / num_simulations
         results['average_uptime'] = results['system_reliability'] * 8760  # часов в году
         
         return results
     
-    def _is_system_connected_after_failures(self, failed_components: List[str]) -> bool:
-        """Проверить связность системы после отказов"""
-        # Создаем копию графа
-        test_graph = self.system_model.graph.copy()
-        
-        # Удаляем отказавшие узлы
-        for component in failed_components:
-            if component in test_graph.nodes:
-                test_graph.remove_node(component)
-            else:
-                # Это канал связи
-                parts = component.split('_')
-                if len(parts) == 2:
-                    source, target = parts
-                    if test_graph.has_edge(source, target):
-                        test_graph.remove_edge(source, target)
-        
-        # Проверяем связность
-        return nx.is_connected(test_graph)
-    
     def create_fault_tree(self, top_event: str) -> FaultTree:
         """Создать дерево отказов для системы"""
         fault_tree = FaultTree(f"FTA_{self.system_model.name}")
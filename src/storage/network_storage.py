@@ -4,13 +4,29 @@ NetworkStorage - управление локальными файлами сет
 """
 
 import os
+import hashlib
+import json
 import pickle
 import shelve
+import shutil
 from typing import Dict, List, Optional, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Скрытый подкаталог хранилища с хешами сохраненных сетей
+DIGEST_DIR = '.blake2b'
+
+
+def _network_digest(network_data: Dict[str, List[str]]) -> str:
+    """
+    Хеш BLAKE2b сети в канонической форме (JSON с отсортированными ключами)
+    
+    В отличие от байтов pickle, результат не зависит от порядка ключей
+    словаря и от того, какие строки в нем - один и тот же объект.
+    """
+    return hashlib.blake2b(json.dumps(network_data, sort_keys=True).encode()).hexdigest()
+
 
 class NetworkStorage:
     """
@@ -18,6 +34,8 @@ class NetworkStorage:
     
     Каждая сеть сохраняется в отдельный файл <имя_сети>.db
     Формат хранения: словарь Python, где ключ - имя узла, значение - список связанных узлов
+    Хеши сети и файла .db для verify_network хранятся в скрытом подкаталоге
+    .blake2b (по файлу <имя_сети> на сеть), а не рядом с файлами сетей
     """
     
     def __init__(self, storage_dir: str = "networks"):
@@ -53,8 +71,20 @@ class NetworkStorage:
             file_path = os.path.join(self.storage_dir, f"{safe_name}.db")
             
             # Сохраняем используя pickle для надежности
+            payload = pickle.dumps(network_data)
             with open(file_path, 'wb') as f:
-                pickle.dump(network_data, f)
+                f.write(payload)
+            
+            # Хеши для verify_network: канонический хеш данных и хеш байтов файла
+            try:
+                network_digest = _network_digest(network_data)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Сеть '{network_name}' не сериализуется в JSON, хеш не сохранен: {e}")
+                self._remove_digest(safe_name)
+            else:
+                os.makedirs(os.path.join(self.storage_dir, DIGEST_DIR), exist_ok=True)
+                with open(self._digest_path(safe_name), 'w', encoding='utf-8') as f:
+                    f.write(f"{network_digest}\n{hashlib.blake2b(payload).hexdigest()}\n")
             
             logger.info(f"Сеть '{network_name}' сохранена в файл: {file_path}")
             return True
@@ -91,6 +121,53 @@ class NetworkStorage:
             logger.error(f"Ошибка при загрузке сети '{network_name}': {e}")
             return None
     
+    def verify_network(self, network_name: str, network_data: Dict[str, List[str]]) -> bool:
+        """
+        Проверяет, что файл <имя_сети>.db содержит в точности указанную сеть
+        
+        Канонический хеш BLAKE2b ожидаемых данных сравнивается с хешем,
+        записанным при сохранении, а файл .db читается блоками и сверяется
+        со своим хешем - сеть из него не загружается. Для сетей, сохраненных
+        без файла хешей, сеть загружается и хешируется так же.
+        
+        Args:
+            network_name: Имя сети
+            network_data: Ожидаемый словарь сети {узел: [список_связанных_узлов]}
+            
+        Returns:
+            bool: True если файл совпадает с данными, False если нет или файл не найден
+        """
+        try:
+            safe_name = self._sanitize_filename(network_name)
+            file_path = os.path.join(self.storage_dir, f"{safe_name}.db")
+            expected_digest = _network_digest(network_data)
+            
+            try:
+                with open(self._digest_path(safe_name), encoding='utf-8') as f:
+                    saved_digest, file_digest = f.read().split()
+            except FileNotFoundError:
+                if not os.path.exists(file_path):
+                    raise
+                loaded = self.load_network(network_name)
+                return loaded is not None and _network_digest(loaded) == expected_digest
+            
+            if saved_digest != expected_digest:
+                return False
+            
+            file_hash = hashlib.blake2b()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(65536), b''):
+                    file_hash.update(chunk)
+            
+            return file_hash.hexdigest() == file_digest
+            
+        except FileNotFoundError:
+            logger.warning(f"Файл сети '{network_name}' не найден для проверки")
+            return False
+        except Exception as e:
+            logger.error(f"Ошибка при проверке сети '{network_name}': {e}")
+            return False
+    
     def delete_network(self, network_name: str) -> bool:
         """
         Удаляет файл сети
@@ -107,6 +184,7 @@ class NetworkStorage:
             
             if os.path.exists(file_path):
                 os.remove(file_path)
+                self._remove_digest(safe_name)
                 logger.info(f"Сеть '{network_name}' удалена: {file_path}")
                 return True
             else:
@@ -203,6 +281,10 @@ class NetworkStorage:
                 if self.delete_network(network_name):
                     success_count += 1
             
+            # Вместе с сетями удаляются и хеши, оставшиеся от файлов .db,
+            # удаленных не через delete_network
+            shutil.rmtree(os.path.join(self.storage_dir, DIGEST_DIR), ignore_errors=True)
+            
             logger.info(f"Удалено сетей: {success_count} из {len(networks)}")
             return success_count == len(networks)
             
@@ -210,6 +292,17 @@ class NetworkStorage:
             logger.error(f"Ошибка при очистке всех сетей: {e}")
             return False
     
+    def _digest_path(self, safe_name: str) -> str:
+        """Путь к файлу хешей сети, записанному save_network"""
+        return os.path.join(self.storage_dir, DIGEST_DIR, safe_name)
+    
+    def _remove_digest(self, safe_name: str):
+        """Удаляет файл хешей сети, если он есть"""
+        try:
+            os.remove(self._digest_path(safe_name))
+        except FileNotFoundError:
+            pass
+    
     def _sanitize_filename(self, filename: str) -> str:
         """
         Очищает имя файла от недопустимых символов
@@ -6,11 +6,13 @@
 
 import networkx as nx
 import numpy as np
-import pandas as pd
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
-import random
+
+# pandas нужен только для экспорта/импорта и загружается при первом вызове
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class NodeType(Enum):
@@ -72,9 +74,13 @@ class SystemModel:
         self.nodes: Dict[str, Node] = {}
         self.links: Dict[Tuple[str, str], Link] = {}
         self.metrics = {}
+        self._soa = None  # Кэш представления в виде массивов (см. as_soa)
+        self.version = 0  # Счетчик изменений модели (ключ кэшей производных данных)
         
     def add_node(self, node: Node):
         """Добавить узел в систему"""
+        self._soa = None
+        self.version += 1
         self.nodes[node.id] = node
         self.graph.add_node(
             node.id,
@@ -92,6 +98,8 @@ class SystemModel:
     
     def add_link(self, link: Link):
         """Добавить канал связи"""
+        self._soa = None
+        self.version += 1
         self.links[(link.source, link.target)] = link
         self.graph.add_edge(
             link.source,
@@ -109,6 +117,8 @@ class SystemModel:
     def remove_node(self, node_id: str):
         """Удалить узел из системы"""
         if node_id in self.nodes:
+            self._soa = None
+            self.version += 1
             del self.nodes[node_id]
             self.graph.remove_node(node_id)
             
@@ -126,55 +136,111 @@ class SystemModel:
     def remove_link(self, source: str, target: str):
         """Удалить канал связи"""
         if (source, target) in self.links:
+            self._soa = None
+            self.version += 1
             del self.links[(source, target)]
             if self.graph.has_edge(source, target):
                 self.graph.remove_edge(source, target)
     
-    def generate_random_network(self, num_nodes: int = 10, connection_prob: float = 0.3):
+    def generate_random_network(self, num_nodes: int = 10, connection_prob: float = 0.3,
+                                seed: Optional[int] = None):
         """Генерировать случайную сеть"""
         # Очищаем текущую сеть
         self.graph.clear()
         self.nodes.clear()
         self.links.clear()
+        self._soa = None
+        self.version += 1
+        
+        rng = np.random.default_rng(seed)
         
-        # Генерируем узлы
+        # Генерируем узлы (атрибуты всех узлов разыгрываются одним вызовом)
         node_types = list(NodeType)
+        type_idx = rng.integers(0, len(node_types), size=num_nodes)
+        capacities = rng.uniform(100, 1000, size=num_nodes)  # Мбит/с
+        reliabilities = rng.uniform(0.85, 0.99, size=num_nodes)
+        coords = rng.uniform(0, 100, size=(num_nodes, 2))
+        
         for i in range(num_nodes):
-            node_type = random.choice(node_types)
-            capacity = random.uniform(100, 1000)  # Мбит/с
-            reliability = random.uniform(0.85, 0.99)
-            
             node = Node(
                 id=f"node_{i}",
-                node_type=node_type,
-                capacity=capacity,
-                reliability=reliability,
-                x=random.uniform(0, 100),
-                y=random.uniform(0, 100)
+                node_type=node_types[type_idx[i]],
+                capacity=float(capacities[i]),
+                reliability=float(reliabilities[i]),
+                x=float(coords[i, 0]),
+                y=float(coords[i, 1])
             )
             self.add_node(node)
         
-        # Генерируем каналы связи
+        # Генерируем каналы связи: испытания Бернулли для верхнего треугольника
+        # матрицы смежности, индексы ребер извлекаются без цикла Python
+        adjacency = np.triu(rng.random((num_nodes, num_nodes)) < connection_prob, k=1)
+        sources, targets = np.nonzero(adjacency)
+        self.add_edges_bulk(sources, targets, rng=rng)
+    
+    def add_edges_bulk(self, sources, targets, rng: Optional[np.random.Generator] = None):
+        """Добавить каналы связи со случайными параметрами по массивам индексов узлов"""
+        sources = np.asarray(sources, dtype=np.intp)
+        targets = np.asarray(targets, dtype=np.intp)
+        num_edges = len(sources)
+        if num_edges == 0:
+            return
+        
+        if rng is None:
+            rng = np.random.default_rng()
+        
         node_ids = list(self.nodes.keys())
         link_types = list(LinkType)
         
-        for i, source in enumerate(node_ids):
-            for j, target in enumerate(node_ids[i+1:], i+1):
-                if random.random() < connection_prob:
-                    bandwidth = random.uniform(10, 100)  # Мбит/с
-                    latency = random.uniform(1, 50)  # мс
-                    reliability = random.uniform(0.90, 0.99)
-                    link_type = random.choice(link_types)
-                    
-                    link = Link(
-                        source=source,
-                        target=target,
-                        bandwidth=bandwidth,
-                        latency=latency,
-                        reliability=reliability,
-                        link_type=link_type
-                    )
-                    self.add_link(link)
+        bandwidths = rng.uniform(10, 100, size=num_edges)  # Мбит/с
+        latencies = rng.uniform(1, 50, size=num_edges)  # мс
+        reliabilities = rng.uniform(0.90, 0.99, size=num_edges)
+        type_idx = rng.integers(0, len(link_types), size=num_edges)
+        
+        for k in range(num_edges):
+            link = Link(
+                source=node_ids[sources[k]],
+                target=node_ids[targets[k]],
+                bandwidth=float(bandwidths[k]),
+                latency=float(latencies[k]),
+                reliability=float(reliabilities[k]),
+                link_type=link_types[type_idx[k]]
+            )
+            self.add_link(link)
+    
+    def as_soa(self) -> Dict[str, np.ndarray]:
+        """
+        Представление модели в виде структуры массивов (SoA).
+        
+        Массивы строятся при первом обращении и кэшируются до добавления или
+        удаления узлов/каналов. Порядок элементов совпадает с порядком
+        self.nodes и self.links; src/dst - индексы узлов каналов.
+        После изменения атрибутов компонентов на месте вызовите invalidate_soa().
+        """
+        if getattr(self, '_soa', None) is None:
+            nodes = list(self.nodes.values())
+            links = list(self.links.values())
+            node_ids = list(self.nodes)
+            node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+            num_links = len(links)
+            
+            self._soa = {
+                'node_ids': node_ids,
+                'link_ids': [f"{link.source}_{link.target}" for link in links],
+                'capacity': np.fromiter((node.capacity for node in nodes), np.float64, len(nodes)),
+                'node_reliability': np.fromiter((node.reliability for node in nodes), np.float64, len(nodes)),
+                'bandwidth': np.fromiter((link.bandwidth for link in links), np.float64, num_links),
+                'latency': np.fromiter((link.latency for link in links), np.float64, num_links),
+                'link_reliability': np.fromiter((link.reliability for link in links), np.float64, num_links),
+                'src': np.fromiter((node_index[link.source] for link in links), np.int64, num_links),
+                'dst': np.fromiter((node_index[link.target] for link in links), np.int64, num_links)
+            }
+        return self._soa
+    
+    def invalidate_soa(self):
+        """Сбросить кэш представления в виде массивов"""
+        self._soa = None
+        self.version += 1
     
     def calculate_network_metrics(self):
         """Рассчитать метрики сети"""
@@ -250,6 +316,8 @@ class SystemModel:
             if memory_usage is not None:
                 node.memory_usage = max(0, min(1, memory_usage))
             
+            self.version += 1
+            
             # Обновляем данные в графе
             self.graph.nodes[node_id]['cpu_load'] = node.cpu_load
             self.graph.nodes[node_id]['memory_usage'] = node.memory_usage
@@ -260,6 +328,7 @@ class SystemModel:
         if link_key in self.links:
             link = self.links[link_key]
             link.utilization = max(0, min(1, utilization))
+            self.version += 1
             
             # Обновляем данные в графе
             if self.graph.has_edge(source, target):
@@ -275,8 +344,10 @@ class SystemModel:
                 utilization = min(traffic_load / link.bandwidth, 1.0)
                 self.update_link_utilization(source, target, utilization)
     
-    def export_to_dataframe(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def export_to_dataframe(self) -> Tuple['pd.DataFrame', 'pd.DataFrame']:
         """Экспортировать модель в DataFrame"""
+        import pandas as pd
+        
         # Узлы
         nodes_data = []
         for node_id, node in self.nodes.items():
@@ -310,12 +381,14 @@ class SystemModel:
         
         return nodes_df, links_df
     
-    def import_from_dataframe(self, nodes_df: pd.DataFrame, links_df: pd.DataFrame):
+    def import_from_dataframe(self, nodes_df: 'pd.DataFrame', links_df: 'pd.DataFrame'):
         """Импортировать модель из DataFrame"""
         # Очищаем текущую модель
         self.graph.clear()
         self.nodes.clear()
         self.links.clear()
+        self._soa = None
+        self.version += 1
         
         # Импортируем узлы
         for _, row in nodes_df.iterrows():
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Представление сети в формате CSR и обход графа по нему
+
+Сеть {узел: [связанные_узлы]} переводится в два непрерывных массива
+(indptr, indices) и таблицу имен; статистика и обход в ширину работают
+по массивам. Если установлен numba, обход компилируется в машинный код.
+"""
+
+import numpy as np
+from typing import Dict, List, Tuple
+
+from ..mc_kernels import njit
+
+
+def network_to_csr(network: Dict[str, List[str]]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Переводит сеть из словаря списков в формат CSR.
+    
+    Returns:
+        Кортеж (имена узлов, indptr, indices): соседи узла i - это
+        indices[indptr[i]:indptr[i + 1]], индексы соответствуют именам
+    """
+    names = list(network)
+    index = {name: i for i, name in enumerate(names)}
+    indptr = np.zeros(len(names) + 1, dtype=np.int32)
+    indptr[1:] = np.fromiter(map(len, network.values()), np.int32, len(names))
+    np.cumsum(indptr[1:], out=indptr[1:])
+    indices = np.fromiter((index[neighbor] for neighbors in network.values() for neighbor in neighbors),
+                          np.int32, int(indptr[-1]))
+    return names, indptr, indices
+
+
+@njit(cache=True)
+def reachable_csr(indptr, indices, start):
+    """
+    Находит узлы, достижимые из start, обходом в ширину по графу в формате CSR.
+
+    Args:
+        indptr: Границы списков соседей: соседи узла u - indices[indptr[u]:indptr[u + 1]]
+        indices: Индексы соседей всех узлов подряд
+        start: Индекс начального узла
+
+    Returns:
+        Булев массив (n_nodes,), True - узел достижим (включая start)
+    """
+    n = indptr.shape[0] - 1
+    reached = np.zeros(n, dtype=np.bool_)
+    queue = np.empty(n, dtype=np.int64)
+    reached[start] = True
+    queue[0] = start
+    head = 0
+    tail = 1
+    while head < tail:
+        u = queue[head]
+        head += 1
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if not reached[v]:
+                reached[v] = True
+                queue[tail] = v
+                tail += 1
+    return reached
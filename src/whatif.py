@@ -7,9 +7,8 @@
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
-import random
 from scipy.optimize import minimize, differential_evolution
 from scipy.stats import norm, uniform
 import itertools
@@ -44,6 +43,12 @@ class ParameterRange:
     default_value: float
     step_size: float = 0.1
 
+    def as_samples(self, n: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Равномерная выборка n значений параметра из диапазона"""
+        if rng is None:
+            rng = np.random.default_rng()
+        return rng.uniform(self.min_value, self.max_value, n)
+
 
 @dataclass
 class WhatIfScenario:
@@ -65,6 +70,15 @@ class WhatIfResult:
     recommendations: List[str]
 
 
+# Метрики Монте-Карло: порядок совпадает со столбцами матрицы образцов
+MC_METRICS = (
+    'throughput_samples',
+    'response_time_samples',
+    'success_rate_samples',
+    'reliability_samples'
+)
+
+
 class WhatIfAnalyzer:
     """Анализатор What-if сценариев"""
     
@@ -74,6 +88,7 @@ class WhatIfAnalyzer:
         self.parameter_ranges = {}
         self.analysis_results = []
         self.monte_carlo_results = {}
+        self._mc_samples = None  # Матрица образцов (n_sims, n_metrics), переиспользуется
     
     def set_parameter_ranges(self, parameter_ranges: List[ParameterRange]):
         """Установить диапазоны параметров для анализа"""
@@ -146,11 +161,7 @@ class WhatIfAnalyzer:
             sensitivity_results[param_key] = []
             
             # Генерируем случайные значения в диапазоне
-            values = np.random.uniform(
-                param_range.min_value, 
-                param_range.max_value, 
-                num_samples
-            )
+            values = param_range.as_samples(num_samples)
             
             for value in values:
                 # Создаем модифицированную систему
@@ -172,23 +183,25 @@ class WhatIfAnalyzer:
         return sensitivity_results
     
     def monte_carlo_analysis(self, num_simulations: int = 1000,
-                           simulation_duration: float = 300) -> Dict[str, float]:
+                           simulation_duration: float = 300,
+                           seed: Optional[int] = None) -> Dict[str, float]:
         """Анализ методом Монте-Карло"""
         print(f"Запуск анализа Монте-Карло ({num_simulations} симуляций)...")
         
-        results = {
-            'throughput_samples': [],
-            'response_time_samples': [],
-            'success_rate_samples': [],
-            'reliability_samples': []
-        }
+        # Все случайные модификации разыгрываются заранее столбцами массивов
+        rng = np.random.default_rng(seed)
+        modifications = self._sample_random_modifications(num_simulations, rng)
+        
+        samples = self._mc_samples
+        if samples is None or samples.shape[0] != num_simulations:
+            samples = self._mc_samples = np.empty((num_simulations, len(MC_METRICS)))
         
         for i in range(num_simulations):
             if i % 100 == 0:
                 print(f"Прогресс: {i}/{num_simulations}")
             
-            # Создаем случайную модификацию системы
-            modified_system = self._create_random_system_modification()
+            # Создаем модификацию системы из i-й строки выборки
+            modified_system = self._create_random_system_modification(modifications, i)
             
             # Запускаем симуляцию
             simulator = NetworkSimulator(modified_system, simulation_duration)
@@ -196,27 +209,33 @@ class WhatIfAnalyzer:
             
             metrics = simulator.get_simulation_results()['metrics']
             
-            # Собираем образцы
-            results['throughput_samples'].append(metrics.get('network_throughput', 0))
-            results['response_time_samples'].append(metrics.get('average_response_time', 0))
-            results['success_rate_samples'].append(metrics.get('success_rate', 0))
-            
             # Рассчитываем надежность
             reliability_analyzer = ReliabilityAnalyzer(modified_system)
             reliability_results = reliability_analyzer.calculate_system_reliability()
-            results['reliability_samples'].append(reliability_results.get('system_overall', 0))
+            
+            samples[i] = (
+                metrics.get('network_throughput', 0),
+                metrics.get('average_response_time', 0),
+                metrics.get('success_rate', 0),
+                reliability_results.get('system_overall', 0)
+            )
         
-        # Статистический анализ
+        # Статистический анализ по столбцам матрицы образцов
         monte_carlo_stats = {}
-        for metric, samples in results.items():
-            if samples:
+        if num_simulations > 0:
+            means = samples.mean(axis=0)
+            stds = samples.std(axis=0)
+            mins = samples.min(axis=0)
+            maxs = samples.max(axis=0)
+            p5, p95 = np.percentile(samples, [5, 95], axis=0)
+            for j, metric in enumerate(MC_METRICS):
                 monte_carlo_stats[metric] = {
-                    'mean': np.mean(samples),
-                    'std': np.std(samples),
-                    'min': np.min(samples),
-                    'max': np.max(samples),
-                    'percentile_5': np.percentile(samples, 5),
-                    'percentile_95': np.percentile(samples, 95)
+                    'mean': means[j],
+                    'std': stds[j],
+                    'min': mins[j],
+                    'max': maxs[j],
+                    'percentile_5': p5[j],
+                    'percentile_95': p95[j]
                 }
         
         self.monte_carlo_results = monte_carlo_stats
@@ -402,29 +421,58 @@ class WhatIfAnalyzer:
         
         return modified_system
     
-    def _create_random_system_modification(self) -> SystemModel:
+    def _sample_random_modifications(self, num_simulations: int,
+                                     rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """
+        Разыграть случайные модификации системы для всех симуляций сразу.
+        
+        Каждый массив имеет форму (num_simulations, n_components), порядок
+        компонентов совпадает с порядком self.system_model.nodes / links.
+        """
+        nodes = list(self.system_model.nodes.values())
+        links = list(self.system_model.links.values())
+        node_shape = (num_simulations, len(nodes))
+        link_shape = (num_simulations, len(links))
+        
+        node_capacity = np.array([node.capacity for node in nodes], dtype=np.float64)
+        node_reliability = np.array([node.reliability for node in nodes], dtype=np.float64)
+        link_bandwidth = np.array([link.bandwidth for link in links], dtype=np.float64)
+        link_reliability = np.array([link.reliability for link in links], dtype=np.float64)
+        
+        return {
+            'node_capacity': node_capacity * rng.uniform(0.8, 1.2, node_shape),
+            'node_reliability': np.clip(node_reliability + rng.uniform(-0.05, 0.05, node_shape), 0.8, 0.99),
+            'link_bandwidth': link_bandwidth * rng.uniform(0.9, 1.1, link_shape),
+            'link_reliability': np.clip(link_reliability + rng.uniform(-0.02, 0.02, link_shape), 0.9, 0.99)
+        }
+    
+    def _create_random_system_modification(self, modifications: Optional[Dict[str, np.ndarray]] = None,
+                                           index: int = 0) -> SystemModel:
         """Создать случайную модификацию системы"""
-        modified_system = SystemModel(f"{self.system_model.name}_random")
-        
-        # Копируем базовую систему
-        for node_id, node in self.system_model.nodes.items():
-            modified_system.add_node(node)
+        if modifications is None:
+            modifications = self._sample_random_modifications(1, np.random.default_rng())
+            index = 0
         
-        for (source, target), link in self.system_model.links.items():
-            modified_system.add_link(link)
+        modified_system = SystemModel(f"{self.system_model.name}_random")
         
-        # Случайные модификации
-        for node_id, node in modified_system.nodes.items():
-            # Случайное изменение пропускной способности
-            node.capacity *= random.uniform(0.8, 1.2)
-            # Случайное изменение надежности
-            node.reliability = max(0.8, min(0.99, node.reliability + random.uniform(-0.05, 0.05)))
-        
-        for (source, target), link in modified_system.links.items():
-            # Случайное изменение пропускной способности канала
-            link.bandwidth *= random.uniform(0.9, 1.1)
-            # Случайное изменение надежности канала
-            link.reliability = max(0.9, min(0.99, link.reliability + random.uniform(-0.02, 0.02)))
+        # Копии компонентов, чтобы не изменять исходную систему
+        node_capacity = modifications['node_capacity'][index]
+        node_reliability = modifications['node_reliability'][index]
+        for i, node in enumerate(self.system_model.nodes.values()):
+            modified_system.add_node(replace(
+                node,
+                capacity=float(node_capacity[i]),
+                reliability=float(node_reliability[i])
+            ))
+        
+        link_bandwidth = modifications['link_bandwidth'][index]
+        link_reliability = modifications['link_reliability'][index]
+        for i, link in enumerate(self.system_model.links.values()):
+            modified_system.add_link(replace(
+                link,
+                bandwidth=float(link_bandwidth[i]),
+                reliability=float(link_reliability[i])
+            ))
         
         return modified_system
     